@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Shared Rate Limiter
+Sliding-window request limits per platform and platform session, shared by every worker process on a host through SQLite
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+# Platform quotas are stated per hour
+RATE_LIMIT_WINDOW = 3600
+
+class RateLimiter:
+    """
+    Sliding-window limiter backed by a SQLite WAL database.
+
+    Every granted request is logged with its timestamp under a scope (e.g.
+    "gemini" for the platform, "gemini/<session id>" for one session), and a
+    request is granted while fewer than ``limit`` requests were logged in
+    the last ``window`` seconds. The check and the insert run in one
+    ``BEGIN IMMEDIATE`` transaction, so worker
+    processes sharing the database file never overshoot a quota together,
+    and capacity frees up request by request as the window slides instead
+    of all at once when a fixed counter is reset. Scopes can also be blocked
+    until a given time, when a platform itself reports a rate limit.
+    """
+
+    STAT_KEYS = ('allowed', 'denied')
+
+    def __init__(self, path: str, window: float = RATE_LIMIT_WINDOW):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.window = window
+        self.stats = {key: 0 for key in self.STAT_KEYS}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS requests (
+                scope TEXT NOT NULL,
+                requested_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS requests_scope ON requests (scope, requested_at);
+            CREATE TABLE IF NOT EXISTS blocks (
+                scope TEXT PRIMARY KEY,
+                blocked_until REAL NOT NULL
+            );
+        ''')
+
+    def acquire(self, scope: str, limit: int, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Take one request from ``scope``'s quota if the last window has room.
+        Returns whether it was ``allowed``, the requests ``used`` in the
+        window (including this one), the ``remaining`` ones and, when denied,
+        seconds until the next request can be granted (``retry_after``).
+        """
+        usage = self.acquire_all({scope: limit}, now)
+        return {
+            'allowed': usage['allowed'],
+            'used': usage['used'][scope],
+            'remaining': usage['remaining'][scope],
+            'retry_after': usage['retry_after']
+        }
+
+    def acquire_all(self, limits: Mapping[str, int], now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Take one request from every scope in ``limits`` (scope -> limit), or
+        from none of them. ``used`` and ``remaining`` are per scope, and
+        ``limited_by`` lists the scopes that denied the request.
+        """
+        now = time.time() if now is None else now
+        window_start = now - self.window
+        used: Dict[str, int] = {}
+        retry_after: Dict[str, float] = {}
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for scope, limit in limits.items():
+                    self._conn.execute('DELETE FROM requests WHERE scope = ? AND requested_at <= ?', (scope, window_start))
+                    used[scope], oldest = self._conn.execute(
+                        'SELECT COUNT(*), MIN(requested_at) FROM requests WHERE scope = ?', (scope,)
+                    ).fetchone()
+                    blocked = self._conn.execute(
+                        'SELECT blocked_until FROM blocks WHERE scope = ? AND blocked_until > ?', (scope, now)
+                    ).fetchone()
+
+                    if blocked:
+                        retry_after[scope] = blocked[0] - now
+                    elif used[scope] >= limit:
+                        # The oldest logged request leaves the window first
+                        retry_after[scope] = oldest + self.window - now if used[scope] else self.window
+
+                allowed = not retry_after
+                if allowed:
+                    for scope in limits:
+                        used[scope] += 1
+                    self._conn.executemany('INSERT INTO requests VALUES (?, ?)', [(scope, now) for scope in limits])
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+            self.stats['allowed' if allowed else 'denied'] += 1
+
+        return {
+            'allowed': allowed,
+            'used': used,
+            'remaining': {scope: max(0, limit - used[scope]) for scope, limit in limits.items()},
+            'retry_after': round(max(retry_after.values(), default=0.0), 3),
+            'limited_by': sorted(retry_after)
+        }
+
+    def block(self, scope: str, until: float):
+        """Deny every request for ``scope`` until ``until`` (a time.time() timestamp)"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO blocks VALUES (?, ?) ON CONFLICT (scope) DO UPDATE SET '
+                'blocked_until = MAX(blocked_until, excluded.blocked_until)',
+                (scope, until)
+            )
+
+    def usage(self, scope: str, now: Optional[float] = None) -> int:
+        """Requests granted to ``scope`` in the current window"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM requests WHERE scope = ? AND requested_at > ?', (scope, now - self.window)
+            ).fetchone()[0]
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop requests that left the window and expired blocks, for scopes no longer in use"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                pruned = self._conn.execute('DELETE FROM requests WHERE requested_at <= ?', (now - self.window,)).rowcount
+                self._conn.execute('DELETE FROM blocks WHERE blocked_until <= ?', (now,))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return pruned
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
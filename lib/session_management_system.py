@@ -5,17 +5,26 @@ Handles authentication, cookies, rate limits, and session persistence
 """
 
 import asyncio
+import fcntl
 import json
+import os
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import pickle
 import hashlib
+import random
+import socket
+import threading
 import aiofiles
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+from rate_limiter import RateLimiter
+from session_store import SessionStore, open_session_store
+
 class SessionState(Enum):
     UNINITIALIZED = "uninitialized"
     INITIALIZING = "initializing"
@@ -44,17 +53,100 @@ class SessionData:
     max_requests_per_hour: int
     fingerprint: str
 
+class RateLimitExceeded(Exception):
+    """Every session of a platform (or the platform itself) is out of quota for now"""
+
+    def __init__(self, platform: str, retry_after: float):
+        super().__init__(f"Rate limited on {platform}; retry in {retry_after:.0f}s")
+        self.platform = platform
+        self.retry_after = retry_after
+
+class ComputerUseBackend:
+    """
+    Executes Computer Use actions for SessionManager.
+
+    ``prompt`` is the natural-language instruction; ``action`` carries the
+    same request in structured form (e.g. {"type": "query", "platform": ...,
+    "query": ...}) for backends that do not need to interpret the prompt.
+    """
+
+    async def execute(self, prompt: str, action: Dict[str, Any]) -> Dict:
+        raise NotImplementedError
+
 class SessionManager:
-    def __init__(self, storage_path: str = "sessions"):
+    def __init__(self, storage_path: str = "sessions", backend: Optional[ComputerUseBackend] = None,
+                 health_ttl: float = 300.0, health_check_interval: Optional[float] = None,
+                 persist_interval: float = 1.0, pool_sizes: Optional[Dict[str, int]] = None,
+                 rate_limiter: Optional[RateLimiter] = None, session_store: Optional[Union[SessionStore, str]] = None,
+                 rate_limit_wait: float = 60.0):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
-        self.active_sessions: Dict[str, SessionData] = {}
+        self.backend = backend
+        # Hourly quotas, per session and per platform, are counted in a sliding window shared by every
+        # process using this storage path. Checkouts wait up to rate_limit_wait seconds for quota to
+        # free up before RateLimitExceeded is raised.
+        self.rate_limiter = rate_limiter or RateLimiter(str(self.storage_path / "rate_limits.db"))
+        # Only what the manager opens itself is closed by close(); passed-in instances belong to the caller
+        self._owns_rate_limiter = rate_limiter is None
+        self.rate_limit_wait = rate_limit_wait
+
+        # Each platform has a pool of up to pool_size sessions (separate accounts or anonymous
+        # identities). A checked-out session runs one query at a time; the platform lock only
+        # guards choosing, validating and creating sessions.
+        self.session_pools: Dict[str, List[SessionData]] = {}
         self.session_locks: Dict[str, asyncio.Lock] = {}
+        self._pool_capacity: Dict[str, asyncio.Semaphore] = {}
+        self._checked_out: Set[str] = set()
+        # session_id -> pool slot, which names the session's manifest entry
+        self._session_slots: Dict[str, int] = {}
+        self.pool_stats = {
+            "checkouts": 0,
+            "checkout_waits": 0,
+            "sessions_created": 0,
+            "sessions_restored": 0,
+            "sessions_leased": 0,
+            "leases_lost": 0,
+            "rate_limit_waits": 0
+        }
+
+        # With a shared store, pooled sessions are leased from it (and new ones saved to it), so
+        # workers hand off initialized sessions instead of each creating their own. A URL is opened
+        # with open_session_store (and closed again by close())
+        self._owns_session_store = isinstance(session_store, str)
+        self.session_store = open_session_store(session_store) if self._owns_session_store else session_store
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self._lease_renew_at: Dict[str, float] = {}
+
+        # A passed connectivity test (or successful query) is trusted for health_ttl seconds;
+        # the background checker re-verifies idle sessions every health_check_interval seconds
+        self.health_ttl = health_ttl
+        self.health_check_interval = health_check_interval or max(1.0, health_ttl / 2)
+        self._healthy_at: Dict[str, float] = {}
+        self._health_checker: Optional[asyncio.Task] = None
+        self.health_stats = {
+            "cached": 0,
+            "connectivity_tests": 0,
+            "background_tests": 0,
+            "background_evictions": 0
+        }
+
+        # Write-behind persistence: changed sessions are coalesced and written by one writer
+        # task every persist_interval seconds (0 writes through on every change)
+        self.persist_interval = persist_interval
+        self._dirty_sessions: Dict[Path, SessionData] = {}
+        # platform -> newest stored session file, so restores never scan the storage directory
+        self.manifest_path = self.storage_path / "manifest.json"
+        # Serializes manifest updates across processes sharing the directory (the manifest itself is replaced)
+        self.manifest_lock_path = self.storage_path / "manifest.lock"
+        self._manifest_lock = threading.Lock()
+        self._session_writer: Optional[asyncio.Task] = None
+        self.persist_stats = {"requests": 0, "writes": 0, "flushes": 0}
 
         # Platform-specific session configurations
         self.platform_configs = {
             "chatgpt": {
                 "requires_auth": True,
+                "pool_size": 5,
                 "max_requests_per_hour": 50,
                 "session_lifetime_hours": 24,
                 "rate_limit_detection": [
@@ -73,6 +165,7 @@ class SessionManager:
             },
             "searchgpt": {
                 "requires_auth": True,
+                "pool_size": 3,
                 "max_requests_per_hour": 30,
                 "session_lifetime_hours": 12,
                 "rate_limit_detection": [
@@ -89,6 +182,7 @@ class SessionManager:
             },
             "gemini": {
                 "requires_auth": False,
+                "pool_size": 10,
                 "max_requests_per_hour": 100,
                 "session_lifetime_hours": 8,
                 "rate_limit_detection": [
@@ -104,6 +198,7 @@ class SessionManager:
             },
             "perplexity": {
                 "requires_auth": False,
+                "pool_size": 2,
                 "max_requests_per_hour": 25,
                 "session_lifetime_hours": 6,
                 "rate_limit_detection": [
@@ -119,42 +214,235 @@ class SessionManager:
                 ]
             }
         }
+        for platform, pool_size in (pool_sizes or {}).items():
+            self.platform_configs[platform]["pool_size"] = pool_size
+
+    def pool_size(self, platform: str) -> int:
+        return max(1, self.platform_configs.get(platform, {}).get("pool_size", 1))
+
+    def platform_quota(self, platform: str) -> int:
+        """Requests per hour for a platform as a whole; by default every pooled session's quota"""
+        config = self.platform_configs.get(platform, {})
+        return config.get("max_platform_requests_per_hour",
+                          config.get("max_requests_per_hour", 60) * self.pool_size(platform))
+
+    @property
+    def active_sessions(self) -> Dict[str, SessionData]:
+        """The preferred pooled session per platform"""
+        return {platform: min(pool, key=self._checkout_order) for platform, pool in self.session_pools.items() if pool}
 
     async def get_session(self, platform: str, force_new: bool = False) -> SessionData:
         """
-        Get or create a session for the specified platform
+        Get or create a session for the specified platform. The session is
+        not checked out, so it may be in use by a concurrent query; use
+        checkout_session to run queries on a session of one's own.
         """
 
+        async with self._platform_lock(platform):
+            if force_new:
+                pool = self.session_pools.setdefault(platform, [])
+                if len(pool) >= self.pool_size(platform):
+                    await self._drop_session(platform, min(pool, key=self._checkout_order))
+                session = await self._fill_pool_slot(platform, restore=False)
+                if not await self._use_session(platform, session):
+                    raise RateLimitExceeded(platform, self._pool_retry_after(platform))
+                return session
+            return await self._select_session(platform, idle_only=False)
+
+    async def checkout_session(self, platform: str) -> SessionData:
+        """
+        Take the least-loaded idle session of a platform's pool (the one with
+        the most requests left this hour), creating one while the pool is
+        below its size, and waiting while every pooled session is checked out.
+        Rate-limited sessions stay pooled: when every session (or the
+        platform) is out of quota, the checkout waits for quota to free up,
+        or raises RateLimitExceeded if that takes over rate_limit_wait
+        seconds. Every checkout must be followed by checkin_session.
+        """
+
+        capacity = self._pool_capacity.get(platform)
+        if capacity is None:
+            capacity = self._pool_capacity[platform] = asyncio.Semaphore(self.pool_size(platform))
+        if capacity.locked():
+            self.pool_stats["checkout_waits"] += 1
+        await capacity.acquire()
+
+        try:
+            while True:
+                async with self._platform_lock(platform):
+                    try:
+                        session = await self._select_session(platform, idle_only=True)
+                        self._checked_out.add(session.session_id)
+                        break
+                    except RateLimitExceeded as e:
+                        if e.retry_after > self.rate_limit_wait:
+                            raise
+                        retry_after = e.retry_after
+                self.pool_stats["rate_limit_waits"] += 1
+                await asyncio.sleep(retry_after)
+        except BaseException:
+            capacity.release()
+            raise
+
+        self.pool_stats["checkouts"] += 1
+        return session
+
+    def checkin_session(self, session: SessionData):
+        """Return a checked-out session to its pool"""
+        self._checked_out.discard(session.session_id)
+        self._pool_capacity[session.platform].release()
+
+    @asynccontextmanager
+    async def pooled_session(self, platform: str) -> AsyncIterator[SessionData]:
+        session = await self.checkout_session(platform)
+        try:
+            yield session
+        finally:
+            self.checkin_session(session)
+
+    def _platform_lock(self, platform: str) -> asyncio.Lock:
         # Ensure we have a lock for this platform
         if platform not in self.session_locks:
             self.session_locks[platform] = asyncio.Lock()
+        return self.session_locks[platform]
 
-        async with self.session_locks[platform]:
-            # Check if we have an active session
-            if not force_new and platform in self.active_sessions:
-                session = self.active_sessions[platform]
+    def _checkout_order(self, session: SessionData):
+        """Most requests left this hour first, then the longest idle"""
+        return (session.request_count - session.max_requests_per_hour, session.last_activity)
 
-                # Validate session is still usable
-                if await self._validate_session(session):
-                    await self._update_session_activity(session)
-                    return session
-                else:
-                    # Session invalid, remove it
-                    del self.active_sessions[platform]
+    async def _select_session(self, platform: str, idle_only: bool) -> SessionData:
+        """
+        Best usable session of a platform's pool, or a new one in a free slot;
+        must be called with the platform lock held. Raises RateLimitExceeded
+        when every candidate is out of quota.
+        """
 
-            # Try to restore from storage
-            if not force_new:
-                restored_session = await self._restore_session(platform)
-                if restored_session and await self._validate_session(restored_session):
-                    self.active_sessions[platform] = restored_session
-                    return restored_session
+        pool = self.session_pools.setdefault(platform, [])
+        for session in sorted(pool, key=self._checkout_order):
+            if idle_only and session.session_id in self._checked_out:
+                continue
+            if await self._use_session(platform, session):
+                return session
 
-            # Create new session
-            new_session = await self._create_new_session(platform)
-            self.active_sessions[platform] = new_session
-            await self._persist_session(new_session)
+        for _ in range(self.pool_size(platform) - len(pool)):
+            session = await self._fill_pool_slot(platform)
+            if await self._use_session(platform, session):
+                return session
 
-            return new_session
+        raise RateLimitExceeded(platform, self._pool_retry_after(platform))
+
+    async def _use_session(self, platform: str, session: SessionData) -> bool:
+        """
+        Validate a pooled session and count a request against its quota.
+        Sessions that are no longer usable are dropped; rate-limited ones stay
+        pooled until their quota frees up. Raises RateLimitExceeded when the
+        platform quota is used up.
+        """
+
+        if not await self._hold_lease(session):
+            # Another worker took the session over after our lease lapsed
+            await self._drop_session(platform, session)
+            self.pool_stats["leases_lost"] += 1
+            return False
+
+        # Validate session is still usable and within its quota
+        if not await self._validate_session(session):
+            if session.state != SessionState.RATE_LIMITED:
+                # Session invalid, remove it; a query still running on it finishes normally
+                await self._drop_session(platform, session)
+            return False
+        return await self._update_session_activity(session)
+
+    def _pool_retry_after(self, platform: str) -> float:
+        """Seconds until the first rate-limited session of a platform's pool can be used again"""
+        now = datetime.now()
+        resets = [(session.rate_limit_reset - now).total_seconds() for session in self.session_pools.get(platform, [])
+                  if session.state == SessionState.RATE_LIMITED and session.rate_limit_reset]
+        return max(0.0, min(resets, default=1.0))
+
+    async def _fill_pool_slot(self, platform: str, restore: bool = True) -> SessionData:
+        """
+        Lease, restore or create a session for the lowest free slot of a
+        platform's pool; the caller counts its first request (_use_session)
+        """
+
+        pool = self.session_pools.setdefault(platform, [])
+        used_slots = {self._session_slots.get(session.session_id) for session in pool}
+        slot = next(slot for slot in range(len(pool) + 1) if slot not in used_slots)
+
+        # Take over a session another worker released
+        if restore and self.session_store is not None:
+            leased_session = await self._lease_session(platform)
+            if leased_session:
+                self._session_slots[leased_session.session_id] = slot
+                pool.append(leased_session)
+                self.pool_stats["sessions_leased"] += 1
+                return leased_session
+
+        # Try to restore from storage; a rate-limited session is kept, not replaced
+        elif restore:
+            restored_session = await self._restore_session(platform, slot)
+            if (restored_session and restored_session.session_id not in self._session_slots
+                    and (await self._validate_session(restored_session)
+                         or restored_session.state == SessionState.RATE_LIMITED)):
+                self._session_slots[restored_session.session_id] = slot
+                pool.append(restored_session)
+                self.pool_stats["sessions_restored"] += 1
+                return restored_session
+
+        # Create new session
+        new_session = await self._create_new_session(platform)
+        self._session_slots[new_session.session_id] = slot
+        pool.append(new_session)
+        self.pool_stats["sessions_created"] += 1
+        if self.session_store is not None:
+            # Saving a new session leases it to this worker
+            await asyncio.to_thread(self._write_to_session_store, [self._snapshot_session(new_session)])
+            self._lease_renew_at[new_session.session_id] = time.monotonic() + self.session_store.lease_ttl / 2
+
+        return new_session
+
+    async def _lease_session(self, platform: str) -> Optional[SessionData]:
+        """Lease the first usable session of a platform from the shared store"""
+
+        tried: Set[str] = set()
+        while True:
+            leased = await asyncio.to_thread(self.session_store.lease, platform, self.worker_id, tried)
+            if leased is None:
+                return None
+            session_id, data = leased
+            tried.add(session_id)
+
+            try:
+                session = SessionData(**pickle.loads(data))
+            except Exception:
+                await asyncio.to_thread(self.session_store.delete, session_id)
+                continue
+
+            self._lease_renew_at[session_id] = time.monotonic() + self.session_store.lease_ttl / 2
+            if await self._validate_session(session):
+                return session
+            self._lease_renew_at.pop(session_id, None)
+            await asyncio.to_thread(self.session_store.release, session_id, self.worker_id)
+
+    async def _hold_lease(self, session: SessionData) -> bool:
+        """Renew a session's lease once half of it has run out; False if another worker owns the session"""
+        if self.session_store is None:
+            return True
+        now = time.monotonic()
+        if now < self._lease_renew_at.get(session.session_id, 0.0):
+            return True
+        if not await asyncio.to_thread(self.session_store.renew, session.session_id, self.worker_id):
+            return False
+        self._lease_renew_at[session.session_id] = now + self.session_store.lease_ttl / 2
+        return True
+
+    async def _drop_session(self, platform: str, session: SessionData):
+        self.session_pools[platform].remove(session)
+        self._session_slots.pop(session.session_id, None)
+        self._healthy_at.pop(session.session_id, None)
+        if self._lease_renew_at.pop(session.session_id, None) is not None:
+            await asyncio.to_thread(self.session_store.release, session.session_id, self.worker_id)
 
     async def _create_new_session(self, platform: str) -> SessionData:
         """
@@ -241,22 +529,28 @@ class SessionManager:
 
         try:
             # Execute initialization through Computer Use
-            init_result = await self._execute_computer_action(init_prompt)
+            init_result = await self._execute_computer_action(
+                init_prompt, {"type": "initialize", "platform": session.platform, "url": url}
+            )
 
             # Process initialization results
             await self._process_session_init_result(session, init_result)
 
             session.state = SessionState.ACTIVE
             session.last_activity = datetime.now()
+            self._record_health(session, True)
 
         except Exception as e:
             session.state = SessionState.ERROR
             raise Exception(f"Session initialization failed for {session.platform}: {e}")
 
-    async def _execute_computer_action(self, prompt: str) -> Dict:
+    async def _execute_computer_action(self, prompt: str, action: Optional[Dict[str, Any]] = None) -> Dict:
         """
         Execute Computer Use action and return structured result
         """
+        if self.backend is not None:
+            return await self.backend.execute(prompt, action or {"type": "generic"})
+
         # This would integrate with your Anthropic client
         # Placeholder for actual Computer Use implementation
         return {
@@ -310,8 +604,77 @@ class SessionManager:
         if session.state == SessionState.BLOCKED:
             return False
 
+        # Trust a recent connectivity test instead of repeating it on every request
+        healthy_at = self._healthy_at.get(session.session_id)
+        if healthy_at is not None and time.monotonic() - healthy_at < self.health_ttl:
+            self.health_stats["cached"] += 1
+            return True
+
         # Validate session is actually active (could do a quick test query)
-        return await self._test_session_connectivity(session)
+        self.health_stats["connectivity_tests"] += 1
+        healthy = await self._test_session_connectivity(session)
+        self._record_health(session, healthy)
+        return healthy
+
+    def _record_health(self, session: SessionData, healthy: bool):
+        if healthy:
+            self._healthy_at[session.session_id] = time.monotonic()
+        else:
+            self._healthy_at.pop(session.session_id, None)
+
+    def start_health_checker(self) -> asyncio.Task:
+        """
+        Start re-verifying idle sessions in the background so that requests
+        find a fresh cached health check. Must be called from a running loop.
+        """
+        if self._health_checker is None or self._health_checker.done():
+            self._health_checker = asyncio.create_task(self._health_check_loop())
+        return self._health_checker
+
+    async def stop_health_checker(self):
+        if self._health_checker is not None:
+            self._health_checker.cancel()
+            try:
+                await self._health_checker
+            except asyncio.CancelledError:
+                pass
+            self._health_checker = None
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await self.check_idle_sessions()
+
+    async def check_idle_sessions(self):
+        """
+        Re-verify sessions that have been idle for a check interval and whose
+        cached health is that old; checked-out sessions are skipped. The
+        connectivity test runs without the platform lock and a failed session
+        is dropped only if it is still pooled, so requests are never blocked.
+        """
+        now = time.monotonic()
+        idle_before = datetime.now() - timedelta(seconds=self.health_check_interval)
+
+        for platform, pool in list(self.session_pools.items()):
+            for session in list(pool):
+                healthy_at = self._healthy_at.get(session.session_id, 0.0)
+                if (session.session_id in self._checked_out or session.last_activity > idle_before
+                        or now - healthy_at < self.health_check_interval):
+                    continue
+
+                self.health_stats["background_tests"] += 1
+                healthy = await self._test_session_connectivity(session)
+
+                async with self._platform_lock(platform):
+                    if session not in pool:
+                        continue
+                    self._record_health(session, healthy)
+                    if not healthy:
+                        await self._drop_session(platform, session)
+                        self.health_stats["background_evictions"] += 1
+                        if self.session_store is not None:
+                            # Other workers would only find it broken too
+                            await asyncio.to_thread(self.session_store.delete, session.session_id)
 
     async def _test_session_connectivity(self, session: SessionData) -> bool:
         """
@@ -330,26 +693,109 @@ class SessionManager:
         """
 
         try:
-            result = await self._execute_computer_action(connectivity_test)
+            result = await self._execute_computer_action(
+                connectivity_test, {"type": "connectivity_test", "platform": session.platform}
+            )
             return result.get("status") == "success"
-        except:
+        except Exception:
             return False
 
-    async def _update_session_activity(self, session: SessionData):
+    async def _update_session_activity(self, session: SessionData) -> bool:
         """
-        Update session activity tracking
+        Count a request against the session's and the platform's hourly
+        quotas and update activity tracking. Returns False, leaving the
+        session rate limited until a request leaves its window, when the
+        session's quota is used up; raises RateLimitExceeded when the
+        platform's is.
         """
 
-        session.last_activity = datetime.now()
-        session.request_count += 1
-
-        # Check rate limits
-        if session.request_count >= session.max_requests_per_hour:
+        # Check rate limits; the shared database may be locked by another worker, so off the event loop
+        session_scope = self._rate_limit_scope(session)
+        usage = await asyncio.to_thread(self.rate_limiter.acquire_all, {
+            session_scope: session.max_requests_per_hour,
+            session.platform: self.platform_quota(session.platform)
+        })
+        if usage["allowed"]:
+            session.request_count = usage["used"][session_scope]
+            session.last_activity = datetime.now()
+        elif session_scope in usage["limited_by"]:
+            session.request_count = usage["used"][session_scope]
             session.state = SessionState.RATE_LIMITED
-            session.rate_limit_reset = datetime.now() + timedelta(hours=1)
+            session.rate_limit_reset = datetime.now() + timedelta(seconds=usage["retry_after"])
 
         # Persist updates
         await self._persist_session(session)
+        if session.platform in usage["limited_by"]:
+            raise RateLimitExceeded(session.platform, usage["retry_after"])
+        return usage["allowed"]
+
+    @staticmethod
+    def _rate_limit_scope(session: SessionData) -> str:
+        return f"{session.platform}/{session.session_id}"
+
+    async def execute_query(self, platform: str, query: str) -> Dict[str, Any]:
+        """
+        Send a query to a platform through its session and return the answer
+        """
+
+        try:
+            async with self.pooled_session(platform) as session:
+                return await self._run_query(session, query)
+        except RateLimitExceeded as e:
+            return {
+                "platform": platform,
+                "query": query,
+                "status": "rate_limited",
+                "response_text": "",
+                "session_id": None,
+                "latency_seconds": 0.0,
+                "errors": [str(e)]
+            }
+
+    async def _run_query(self, session: SessionData, query: str) -> Dict[str, Any]:
+        platform = session.platform
+        query_prompt = f"""
+        Run a query on {platform}:
+
+        1. Verify session indicators are present: {self.platform_configs[platform].get('session_indicators', [])}
+        2. Enter this query exactly and submit it: {query}
+        3. Wait for the answer to finish streaming
+        4. Return the complete answer text, including any numbered or bulleted lists
+
+        Do not open links or follow-up suggestions.
+        """
+
+        started = time.monotonic()
+        try:
+            result = await self._execute_computer_action(
+                query_prompt, {"type": "query", "platform": platform, "query": query}
+            )
+        except Exception as e:
+            result = {"status": "error", "errors": [str(e)]}
+
+        response_text = result.get("response_text", "") if result.get("status") == "success" else ""
+        status = result.get("status", "error")
+        if status == "success":
+            # An answered query proves the session works as well as a connectivity test
+            self._record_health(session, True)
+
+        # Platforms report rate limits inside the page rather than as errors
+        for message in self.platform_configs[platform].get("rate_limit_detection", []):
+            if message.lower() in response_text.lower():
+                await self.handle_rate_limit(session, message)
+                status = "rate_limited"
+                response_text = ""
+                break
+
+        return {
+            "platform": platform,
+            "query": query,
+            "status": status,
+            "response_text": response_text,
+            "session_id": session.session_id,
+            "latency_seconds": round(time.monotonic() - started, 3),
+            "errors": result.get("errors", [])
+        }
 
     async def handle_rate_limit(self, session: SessionData, detected_message: str = None):
         """
@@ -375,6 +821,8 @@ class SessionManager:
             wait_time = 3600  # Default 1 hour
 
         session.rate_limit_reset = datetime.now() + timedelta(seconds=wait_time)
+        # Other processes using this session stop sending it requests too
+        await asyncio.to_thread(self.rate_limiter.block, self._rate_limit_scope(session), time.time() + wait_time)
 
         await self._persist_session(session)
 
@@ -427,7 +875,9 @@ class SessionManager:
         """
 
         try:
-            auth_result = await self._execute_computer_action(auth_prompt)
+            auth_result = await self._execute_computer_action(
+                auth_prompt, {"type": "authenticate", "platform": session.platform}
+            )
 
             if auth_result.get("status") == "success":
                 # Update session with auth data
@@ -447,39 +897,196 @@ class SessionManager:
 
     async def _persist_session(self, session: SessionData):
         """
-        Persist session data to storage
+        Persist session data to storage. With a persist interval the session
+        is only marked dirty; the writer task writes it with the next batch.
         """
 
         session_file = self.storage_path / f"{session.platform}_{session.session_id}.pkl"
+        self.persist_stats["requests"] += 1
+
+        if self.persist_interval <= 0:
+            await asyncio.to_thread(self._write_session_files, {session_file: self._snapshot_session(session)})
+            return
 
-        async with aiofiles.open(session_file, 'wb') as f:
-            await f.write(pickle.dumps(asdict(session)))
+        self._dirty_sessions[session_file] = session
+        if self._session_writer is None or self._session_writer.done():
+            self._session_writer = asyncio.create_task(self._session_writer_loop())
+
+    async def _session_writer_loop(self):
+        try:
+            while True:
+                await asyncio.sleep(self.persist_interval)
+                await self.flush_sessions()
+        except asyncio.CancelledError:
+            # Shutdown (including asyncio.run cancelling leftover tasks): write what is still dirty
+            self._write_session_files(self._take_dirty_sessions())
+            raise
+
+    def _take_dirty_sessions(self) -> Dict[Path, Tuple[Dict[str, Any], bytes]]:
+        """Snapshot dirty sessions on the event loop thread, so writers never see a half-updated session"""
+        dirty, self._dirty_sessions = self._dirty_sessions, {}
+        return {session_file: self._snapshot_session(session) for session_file, session in dirty.items()}
+
+    def _snapshot_session(self, session: SessionData) -> Tuple[Dict[str, Any], bytes]:
+        """(manifest entry, pickled session data) for one session"""
+        return self._manifest_entry(session), pickle.dumps(asdict(session))
+
+    def _manifest_entry(self, session: SessionData) -> Dict[str, Any]:
+        return {
+            "platform": session.platform,
+            "slot": self._session_slots.get(session.session_id, 0),
+            "session_id": session.session_id,
+            "state": session.state.value,
+            "expires_at": session.expires_at.isoformat(),
+            "rate_limit_reset": session.rate_limit_reset.isoformat() if session.rate_limit_reset else None,
+            "written_at": time.time()
+        }
+
+    async def flush_sessions(self):
+        """Write every dirty session now"""
+        batch = self._take_dirty_sessions()
+        if batch:
+            await asyncio.to_thread(self._write_session_files, batch)
+
+    def _write_session_files(self, batch: Dict[Path, Tuple[Dict[str, Any], bytes]]):
+        """
+        Write each file to a temporary name, fsync and rename it into place, so
+        a crash never leaves a torn file, then point the manifest at the
+        newest session per platform
+        """
+        for session_file, (_, data) in batch.items():
+            self._write_atomically(session_file, data)
+        self._update_manifest({self._manifest_key(entry["platform"], entry["slot"]): {"file": session_file.name, **entry}
+                               for session_file, (entry, _) in batch.items()})
+        if self.session_store is not None:
+            self._write_to_session_store(batch.values())
+
+        self.persist_stats["writes"] += len(batch)
+        self.persist_stats["flushes"] += 1
+
+    def _write_to_session_store(self, snapshots: Iterable[Tuple[Dict[str, Any], bytes]]):
+        """Save sessions to the shared store; saves of sessions another worker took over are refused there"""
+        for entry, data in snapshots:
+            available_at = datetime.fromisoformat(entry["rate_limit_reset"]).timestamp() if entry["rate_limit_reset"] else 0.0
+            self.session_store.save(entry["session_id"], entry["platform"], data,
+                                    datetime.fromisoformat(entry["expires_at"]).timestamp(), available_at, self.worker_id)
+
+    @staticmethod
+    def _manifest_key(platform: str, slot: int) -> str:
+        # Slot 0 keeps the plain platform key of single-session stores
+        return platform if not slot else f"{platform}#{slot}"
+
+    def _update_manifest(self, entries: Dict[str, Optional[Dict[str, Any]]]):
+        """
+        Set (or, for None, remove) manifest entries and replace the manifest
+        atomically, holding an exclusive file lock so concurrent updates from
+        other processes are never lost
+        """
+        with self._manifest_lock, open(self.manifest_lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            manifest = self._read_manifest()
+            for key, entry in entries.items():
+                if entry is None:
+                    manifest.pop(key, None)
+                else:
+                    manifest[key] = entry
+            self._write_atomically(self.manifest_path, json.dumps(manifest, indent=2).encode())
+
+    @staticmethod
+    def _write_atomically(path: Path, data: bytes):
+        temporary_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_file, path)
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Latest stored session per platform pool slot; empty if the manifest is missing or unreadable"""
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-    async def _restore_session(self, platform: str) -> Optional[SessionData]:
+    async def close(self):
+        """
+        Stop background tasks, write any dirty sessions, hand leased sessions
+        back to the shared store and close the rate limiter and store if the
+        manager opened them
+        """
+        await self.stop_health_checker()
+        if self._session_writer is not None:
+            self._session_writer.cancel()
+            try:
+                await self._session_writer
+            except asyncio.CancelledError:
+                pass
+            self._session_writer = None
+        await self.flush_sessions()
+
+        if self.session_store is not None:
+            for session_id in list(self._lease_renew_at):
+                await asyncio.to_thread(self.session_store.release, session_id, self.worker_id)
+            self._lease_renew_at.clear()
+            if self._owns_session_store:
+                self.session_store.close()
+
+        if self._owns_rate_limiter:
+            self.rate_limiter.close()
+
+    async def __aenter__(self) -> 'SessionManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _restore_session(self, platform: str, slot: int = 0) -> Optional[SessionData]:
         """
         Restore session from storage
         """
 
-        # Find most recent session file for platform
-        session_files = list(self.storage_path.glob(f"{platform}_*.pkl"))
-        if not session_files:
+        # The manifest names the most recent session file of each pool slot; older
+        # stores without one are scanned once, for the first slot
+        key = self._manifest_key(platform, slot)
+        entry = self._read_manifest().get(key)
+        if entry is not None and (self.storage_path / entry["file"]).exists():
+            if datetime.now() > datetime.fromisoformat(entry["expires_at"]):
+                return None
+            latest_file = self.storage_path / entry["file"]
+        elif slot:
             return None
-
-        # Get most recent
-        latest_file = max(session_files, key=lambda p: p.stat().st_mtime)
+        else:
+            entry = None
+            latest_file = self._scan_latest_session_file(platform)
+            if latest_file is None:
+                return None
 
         try:
             async with aiofiles.open(latest_file, 'rb') as f:
                 session_data = pickle.loads(await f.read())
-                return SessionData(**session_data)
+                session = SessionData(**session_data)
         except Exception:
             return None
 
+        if entry is None:
+            entry = {"file": latest_file.name, **self._manifest_entry(session), "slot": slot}
+            await asyncio.to_thread(self._update_manifest, {key: entry})
+        return session
+
+    def _scan_latest_session_file(self, platform: str) -> Optional[Path]:
+        """Most recently written session file for a platform, by scanning the storage directory"""
+        session_files = list(self.storage_path.glob(f"{platform}_*.pkl"))
+        if not session_files:
+            return None
+        return max(session_files, key=lambda p: p.stat().st_mtime)
+
     def _generate_session_id(self, platform: str) -> str:
         """Generate unique session ID"""
         timestamp = str(int(time.time()))
         platform_hash = hashlib.md5(platform.encode()).hexdigest()[:8]
-        return f"{platform}_{timestamp}_{platform_hash}"
+        # Pooled sessions of one platform are often created within the same second
+        return f"{platform}_{timestamp}_{platform_hash}_{os.urandom(3).hex()}"
 
     def _generate_user_agent(self) -> str:
         """Generate realistic user agent"""
@@ -497,21 +1104,27 @@ class SessionManager:
 
         current_time = datetime.now()
 
-        # Clean up active sessions
-        expired_platforms = []
-        for platform, session in self.active_sessions.items():
-            if current_time > session.expires_at:
-                expired_platforms.append(platform)
-
-        for platform in expired_platforms:
-            del self.active_sessions[platform]
+        # Clean up pooled sessions
+        for platform, pool in self.session_pools.items():
+            for session in [session for session in pool if current_time > session.expires_at]:
+                await self._drop_session(platform, session)
 
         # Clean up storage files older than 7 days
         cutoff_time = current_time - timedelta(days=7)
 
-        for session_file in self.storage_path.glob("*.pkl"):
+        removed = set()
+        for session_file in [*self.storage_path.glob("*.pkl"), *self.storage_path.glob("*.tmp")]:
             if datetime.fromtimestamp(session_file.stat().st_mtime) < cutoff_time:
                 session_file.unlink()
+                removed.add(session_file.name)
+
+        stale = [key for key, entry in self._read_manifest().items() if entry["file"] in removed]
+        if stale:
+            self._update_manifest({key: None for key in stale})
+
+        await asyncio.to_thread(self.rate_limiter.prune)
+        if self.session_store is not None:
+            await asyncio.to_thread(self.session_store.purge_expired)
 
     async def get_session_stats(self) -> Dict:
         """
@@ -520,18 +1133,88 @@ class SessionManager:
 
         stats = {}
 
-        for platform, session in self.active_sessions.items():
+        for platform, pool in self.session_pools.items():
             stats[platform] = {
-                "state": session.state.value,
-                "created_at": session.created_at.isoformat(),
-                "last_activity": session.last_activity.isoformat(),
-                "request_count": session.request_count,
-                "rate_limit_reset": session.rate_limit_reset.isoformat() if session.rate_limit_reset else None,
-                "expires_at": session.expires_at.isoformat()
+                "pool_size": self.pool_size(platform),
+                "checked_out": sum(1 for session in pool if session.session_id in self._checked_out),
+                "sessions": [
+                    {
+                        "session_id": session.session_id,
+                        "slot": self._session_slots.get(session.session_id),
+                        "state": session.state.value,
+                        "created_at": session.created_at.isoformat(),
+                        "last_activity": session.last_activity.isoformat(),
+                        "request_count": session.request_count,
+                        "rate_limit_reset": session.rate_limit_reset.isoformat() if session.rate_limit_reset else None,
+                        "expires_at": session.expires_at.isoformat(),
+                        "health_checked_seconds_ago": (
+                            round(time.monotonic() - self._healthy_at[session.session_id], 1)
+                            if session.session_id in self._healthy_at else None
+                        )
+                    }
+                    for session in sorted(pool, key=self._checkout_order)
+                ]
             }
 
         return stats
 
+class LocalComputerUseBackend(ComputerUseBackend):
+    """
+    Offline stand-in for a Computer Use client.
+
+    Answers every action successfully after ``latency`` seconds. Queries get a
+    deterministic numbered list of dealerships drawn from ``dealerships``
+    (seeded by platform and query), with authority phrases attached to some
+    entries, so query runners can be exercised without network access.
+    """
+
+    AUTHORITY_PHRASES = [
+        "ASE-certified technicians",
+        "award-winning service department",
+        "highly rated in customer reviews",
+        "over 30 years in business",
+        "factory-certified experts"
+    ]
+
+    def __init__(self, dealerships: List[str], latency: float = 0.05, mention_rate: float = 0.6, seed: int = 0):
+        self.dealerships = dealerships
+        self.latency = latency
+        self.mention_rate = mention_rate
+        self.seed = seed
+        self.actions_executed = 0
+
+    async def execute(self, prompt: str, action: Dict[str, Any]) -> Dict:
+        self.actions_executed += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        result = {
+            "status": "success",
+            "screenshots": [],
+            "extracted_data": {},
+            "session_cookies": [],
+            "errors": []
+        }
+        if action.get("type") == "query":
+            result["response_text"] = self._answer(action["platform"], action["query"])
+        return result
+
+    def _answer(self, platform: str, query: str) -> str:
+        seed = hashlib.sha256(f"{self.seed}:{platform}:{query}".encode()).digest()
+        rng = random.Random(seed)
+
+        # The first roster entry is the dealership under test; it only appears some of the time
+        candidates = self.dealerships[1:]
+        listed = rng.sample(candidates, min(len(candidates), rng.randint(3, 6)))
+        if self.dealerships and rng.random() < self.mention_rate:
+            listed.insert(rng.randrange(len(listed) + 1), self.dealerships[0])
+
+        lines = [f"Here are some options for \"{query}\":"]
+        for position, name in enumerate(listed, 1):
+            phrases = rng.sample(self.AUTHORITY_PHRASES, rng.randint(0, 2))
+            lines.append(f"{position}. {name}" + (f" - {', '.join(phrases)}" if phrases else ""))
+        return "\n".join(lines)
+
 # Usage example
 async def main():
     session_manager = SessionManager()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Shared Session Store
+Leased browser sessions that several SessionManager workers, on one host or many, can hand off instead of cold-starting
+"""
+
+import socket
+import socketserver
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# How long a worker owns a leased session without renewing it, in seconds
+DEFAULT_LEASE_TTL = 60.0
+
+class SessionStore:
+    """
+    Shared storage of pickled sessions with lease (ownership) semantics.
+
+    A worker owns a session while it holds its lease: it saves the session
+    it created (which leases it), renews the lease while it keeps using the
+    session and releases it when done. Sessions whose lease was released or
+    lapsed can be leased by any worker, so a live session is handed off
+    instead of being initialized again. Saves from a worker that lost the
+    lease are refused. ``available_at`` keeps rate-limited sessions from
+    being leased before their limit resets.
+    """
+
+    def __init__(self, lease_ttl: float = DEFAULT_LEASE_TTL):
+        self.lease_ttl = lease_ttl
+
+    def save(self, session_id: str, platform: str, data: bytes, expires_at: float,
+             available_at: float, owner: str) -> bool:
+        """Store a session, leasing it to ``owner`` if it is new; False if another worker holds it"""
+        raise NotImplementedError
+
+    def lease(self, platform: str, owner: str, exclude: Iterable[str] = ()) -> Optional[Tuple[str, bytes]]:
+        """Lease an unexpired, available and unowned session of a platform: (session_id, data), or None"""
+        raise NotImplementedError
+
+    def renew(self, session_id: str, owner: str) -> bool:
+        """Extend ``owner``'s lease; False if the session is gone or leased by another worker"""
+        raise NotImplementedError
+
+    def release(self, session_id: str, owner: str):
+        """Give up ``owner``'s lease so other workers can take the session"""
+        raise NotImplementedError
+
+    def delete(self, session_id: str):
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        """Drop expired sessions; backends whose keys expire on their own have nothing to do"""
+        return 0
+
+    def close(self):
+        pass
+
+def open_session_store(url: str, lease_ttl: float = DEFAULT_LEASE_TTL) -> SessionStore:
+    """``redis://host:port[/prefix]`` for a Redis-protocol server, anything else is a SQLite file path"""
+    if url.startswith('redis://'):
+        address, _, prefix = url[len('redis://'):].partition('/')
+        host, _, port = address.partition(':')
+        return RedisSessionStore(host or '127.0.0.1', int(port or 6379), prefix or 'dealership-ai:sessions',
+                                 lease_ttl=lease_ttl)
+    return SQLiteSessionStore(url, lease_ttl=lease_ttl)
+
+class SQLiteSessionStore(SessionStore):
+    """Session store in a SQLite WAL database, shared by the worker processes of one host"""
+
+    def __init__(self, path: str, lease_ttl: float = DEFAULT_LEASE_TTL):
+        super().__init__(lease_ttl)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                platform TEXT NOT NULL,
+                data BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                available_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS sessions_platform ON sessions (platform, lease_expires_at);
+        ''')
+
+    def _transaction(self, statements) -> Any:
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = statements(self._conn)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def save(self, session_id: str, platform: str, data: bytes, expires_at: float,
+             available_at: float, owner: str) -> bool:
+        now = time.time()
+
+        def statements(conn: sqlite3.Connection) -> bool:
+            return conn.execute(
+                'INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (session_id) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at, '
+                'available_at = excluded.available_at, updated_at = excluded.updated_at '
+                'WHERE lease_owner = excluded.lease_owner OR lease_expires_at <= excluded.updated_at',
+                (session_id, platform, data, expires_at, available_at, now, owner, now + self.lease_ttl)
+            ).rowcount == 1
+
+        return self._transaction(statements)
+
+    def lease(self, platform: str, owner: str, exclude: Iterable[str] = ()) -> Optional[Tuple[str, bytes]]:
+        now = time.time()
+        exclude = list(exclude)
+
+        def statements(conn: sqlite3.Connection) -> Optional[Tuple[str, bytes]]:
+            # Most recently used first: its browser state is the freshest
+            row = conn.execute(
+                f'''SELECT session_id, data FROM sessions
+                    WHERE platform = ? AND lease_expires_at <= ? AND expires_at > ? AND available_at <= ?
+                    AND session_id NOT IN ({', '.join('?' * len(exclude))})
+                    ORDER BY updated_at DESC LIMIT 1''',
+                [platform, now, now, now] + exclude
+            ).fetchone()
+            if row:
+                conn.execute(
+                    'UPDATE sessions SET lease_owner = ?, lease_expires_at = ? WHERE session_id = ?',
+                    (owner, now + self.lease_ttl, row[0])
+                )
+            return row
+
+        row = self._transaction(statements)
+        return (row[0], bytes(row[1])) if row else None
+
+    def renew(self, session_id: str, owner: str) -> bool:
+        now = time.time()
+        with self._lock:
+            # A lapsed lease nobody else took is simply taken back
+            return self._conn.execute(
+                'UPDATE sessions SET lease_owner = ?, lease_expires_at = ? '
+                'WHERE session_id = ? AND (lease_owner = ? OR lease_expires_at <= ?)',
+                (owner, now + self.lease_ttl, session_id, owner, now)
+            ).rowcount == 1
+
+    def release(self, session_id: str, owner: str):
+        with self._lock:
+            self._conn.execute(
+                'UPDATE sessions SET lease_owner = NULL, lease_expires_at = 0 WHERE session_id = ? AND lease_owner = ?',
+                (session_id, owner)
+            )
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (time.time(),)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+class RespConnection:
+    """Minimal blocking Redis-protocol (RESP2) client: one connection, one command at a time"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 6379, timeout: float = 5.0):
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._reader = self._socket.makefile('rb')
+
+    def command(self, *args: Any) -> Any:
+        parts = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+        request = [b'*%d\r\n' % len(parts)]
+        for part in parts:
+            request.append(b'$%d\r\n%s\r\n' % (len(part), part))
+        self._socket.sendall(b''.join(request))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis-protocol server closed the connection")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b'+':
+            return payload.decode()
+        if kind == b'-':
+            raise RespError(payload.decode())
+        if kind == b':':
+            return int(payload)
+        if kind == b'$':
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            length = int(payload)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise RespError(f"Unexpected reply: {line!r}")
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+class RedisSessionStore(SessionStore):
+    """
+    Session store on a Redis-protocol server, shared by workers on any node.
+
+    Keys per session: ``<prefix>:<id>:data`` (expiring with the session),
+    ``<prefix>:<id>:available_at`` and ``<prefix>:<id>:lease`` (the owner,
+    with a PX lease TTL); ``<prefix>:platform:<name>`` is the set of a
+    platform's session ids. Leases are taken with SET NX, and checked
+    updates use WATCH/MULTI/EXEC, so no server-side scripting is needed.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 6379, prefix: str = 'dealership-ai:sessions',
+                 lease_ttl: float = DEFAULT_LEASE_TTL):
+        super().__init__(lease_ttl)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._connection = RespConnection(host, port)
+
+    def _key(self, session_id: str, field: str) -> str:
+        return f"{self.prefix}:{session_id}:{field}"
+
+    def _platform_key(self, platform: str) -> str:
+        return f"{self.prefix}:platform:{platform}"
+
+    def _lease_ms(self) -> int:
+        return max(1, int(self.lease_ttl * 1000))
+
+    def _transaction(self, commands: List[Tuple[Any, ...]]) -> bool:
+        """MULTI/EXEC after a WATCH; False when a watched key changed"""
+        self._connection.command('MULTI')
+        for command in commands:
+            self._connection.command(*command)
+        return self._connection.command('EXEC') is not None
+
+    def save(self, session_id: str, platform: str, data: bytes, expires_at: float,
+             available_at: float, owner: str) -> bool:
+        lease_key, data_key = self._key(session_id, 'lease'), self._key(session_id, 'data')
+        ttl_ms = max(1, int((expires_at - time.time()) * 1000))
+        with self._lock:
+            self._connection.command('WATCH', lease_key, data_key)
+            holder = self._connection.command('GET', lease_key)
+            if holder is not None and holder.decode() != owner:
+                self._connection.command('UNWATCH')
+                return False
+
+            commands = [
+                ('SET', data_key, data, 'PX', ttl_ms),
+                ('SET', self._key(session_id, 'available_at'), repr(available_at), 'PX', ttl_ms),
+                ('SADD', self._platform_key(platform), session_id)
+            ]
+            if not self._connection.command('EXISTS', data_key):
+                # Only a new session is leased by saving it; a released one stays free for other workers
+                commands.append(('SET', lease_key, owner, 'PX', self._lease_ms()))
+            return self._transaction(commands)
+
+    def lease(self, platform: str, owner: str, exclude: Iterable[str] = ()) -> Optional[Tuple[str, bytes]]:
+        exclude = set(exclude)
+        now = time.time()
+        with self._lock:
+            for member in self._connection.command('SMEMBERS', self._platform_key(platform)):
+                session_id = member.decode()
+                if session_id in exclude:
+                    continue
+                lease_key = self._key(session_id, 'lease')
+                if self._connection.command('SET', lease_key, owner, 'NX', 'PX', self._lease_ms()) is None:
+                    continue
+
+                data, available_at = self._connection.command(
+                    'MGET', self._key(session_id, 'data'), self._key(session_id, 'available_at')
+                )
+                if data is None:
+                    # The session expired: forget it
+                    self._connection.command('DEL', lease_key, self._key(session_id, 'available_at'))
+                    self._connection.command('SREM', self._platform_key(platform), session_id)
+                    continue
+                if available_at is not None and float(available_at) > now:
+                    self._connection.command('DEL', lease_key)
+                    continue
+                return session_id, data
+        return None
+
+    def renew(self, session_id: str, owner: str) -> bool:
+        lease_key = self._key(session_id, 'lease')
+        with self._lock:
+            self._connection.command('WATCH', lease_key)
+            holder = self._connection.command('GET', lease_key)
+            if holder is not None and holder.decode() != owner:
+                self._connection.command('UNWATCH')
+                return False
+            return self._transaction([('SET', lease_key, owner, 'PX', self._lease_ms())])
+
+    def release(self, session_id: str, owner: str):
+        lease_key = self._key(session_id, 'lease')
+        with self._lock:
+            self._connection.command('WATCH', lease_key)
+            holder = self._connection.command('GET', lease_key)
+            if holder is None or holder.decode() != owner:
+                self._connection.command('UNWATCH')
+                return
+            self._transaction([('DEL', lease_key)])
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._connection.command(
+                'DEL', self._key(session_id, 'data'), self._key(session_id, 'available_at'),
+                self._key(session_id, 'lease')
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+class LocalRespServer:
+    """
+    In-process stand-in for a Redis server, for tests and benchmarks.
+
+    Serves the commands RedisSessionStore uses (GET, MGET, EXISTS, SET with NX/XX
+    and PX/EX, DEL, PEXPIRE, SADD, SREM, SMEMBERS, WATCH/MULTI/EXEC and
+    PING) over RESP2 on a local port, with key expiry and optimistic
+    transactions. Not a general-purpose server.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self._data: Dict[bytes, Any] = {}
+        self._expires: Dict[bytes, float] = {}
+        # Bumped on every write, so WATCH can detect changes
+        self._versions: Dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server._serve(self.rfile, self.wfile)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'LocalRespServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'LocalRespServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _serve(self, rfile, wfile):
+        watched: Dict[bytes, Tuple[int, bool]] = {}
+        queued: Optional[List[List[bytes]]] = None
+
+        while True:
+            line = rfile.readline()
+            if not line:
+                return
+            arguments = [rfile.read(int(rfile.readline()[1:-2]) + 2)[:-2] for _ in range(int(line[1:-2]))]
+            name = arguments[0].upper()
+
+            if name == b'MULTI':
+                queued = []
+                reply: Any = 'OK'
+            elif name == b'EXEC':
+                with self._lock:
+                    if any(self._version(key) != version for key, version in watched.items()):
+                        reply = None
+                    else:
+                        reply = [self._execute(command) for command in queued or []]
+                queued, watched = None, {}
+                self._write(wfile, reply, array=True)
+                continue
+            elif name == b'DISCARD':
+                queued, watched, reply = None, {}, 'OK'
+            elif name == b'WATCH':
+                with self._lock:
+                    watched.update((key, self._version(key)) for key in arguments[1:])
+                reply = 'OK'
+            elif name == b'UNWATCH':
+                watched, reply = {}, 'OK'
+            elif queued is not None:
+                queued.append(arguments)
+                reply = 'QUEUED'
+            else:
+                with self._lock:
+                    reply = self._execute(arguments)
+            self._write(wfile, reply)
+
+    def _version(self, key: bytes) -> Tuple[int, bool]:
+        # A key expiring counts as a change
+        return self._versions.get(key, 0), self._get(key) is not None
+
+    def _get(self, key: bytes) -> Any:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return self._data.get(key)
+
+    def _touch(self, key: bytes):
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _execute(self, arguments: List[bytes]) -> Any:
+        name, keys = arguments[0].upper(), arguments[1:]
+        try:
+            if name == b'PING':
+                return 'PONG'
+            if name == b'GET':
+                return self._get(keys[0])
+            if name == b'EXISTS':
+                return sum(self._get(key) is not None for key in keys)
+            if name == b'MGET':
+                return [self._get(key) for key in keys]
+            if name == b'SET':
+                return self._set(keys[0], keys[1], [option.upper() for option in keys[2:]])
+            if name == b'DEL':
+                deleted = 0
+                for key in keys:
+                    if self._get(key) is not None:
+                        del self._data[key]
+                        self._expires.pop(key, None)
+                        self._touch(key)
+                        deleted += 1
+                return deleted
+            if name == b'PEXPIRE':
+                if self._get(keys[0]) is None:
+                    return 0
+                self._expires[keys[0]] = time.time() + int(keys[1]) / 1000
+                self._touch(keys[0])
+                return 1
+            if name == b'SADD':
+                members = self._get(keys[0]) or set()
+                added = len(set(keys[1:]) - members)
+                self._data[keys[0]] = members | set(keys[1:])
+                self._touch(keys[0])
+                return added
+            if name == b'SREM':
+                members = self._get(keys[0]) or set()
+                removed = len(members & set(keys[1:]))
+                if members - set(keys[1:]):
+                    self._data[keys[0]] = members - set(keys[1:])
+                else:
+                    self._data.pop(keys[0], None)
+                self._touch(keys[0])
+                return removed
+            if name == b'SMEMBERS':
+                return sorted(self._get(keys[0]) or ())
+        except (IndexError, ValueError):
+            return RespError(f"ERR wrong arguments for '{name.decode().lower()}' command")
+        return RespError(f"ERR unknown command '{name.decode().lower()}'")
+
+    def _set(self, key: bytes, value: bytes, options: List[bytes]) -> Any:
+        exists = self._get(key) is not None
+        if (b'NX' in options and exists) or (b'XX' in options and not exists):
+            return None
+
+        expires_at = None
+        for unit, scale in ((b'PX', 1000), (b'EX', 1)):
+            if unit in options:
+                expires_at = time.time() + int(options[options.index(unit) + 1]) / scale
+        self._data[key] = value
+        if expires_at is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = expires_at
+        self._touch(key)
+        return 'OK'
+
+    def _write(self, wfile, reply: Any, array: bool = False):
+        wfile.write(self._encode(reply, array))
+        wfile.flush()
+
+    def _encode(self, reply: Any, array: bool = False) -> bytes:
+        if reply is None:
+            return b'*-1\r\n' if array else b'$-1\r\n'
+        if isinstance(reply, RespError):
+            return b'-%s\r\n' % str(reply).encode()
+        if isinstance(reply, str):
+            return b'+%s\r\n' % reply.encode()
+        if isinstance(reply, int):
+            return b':%d\r\n' % reply
+        if isinstance(reply, bytes):
+            return b'$%d\r\n%s\r\n' % (len(reply), reply)
+        return b'*%d\r\n' % len(reply) + b''.join(self._encode(item) for item in reply)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+AI Platform Answer Cache
+Persistent TTL cache of platform answers keyed by platform, normalized query, location and freshness window
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# How long an answer stays fresh per platform, in seconds. Search-backed
+# platforms change their answers faster than model-only ones.
+PLATFORM_ANSWER_TTLS = {
+    'chatgpt': 24 * 3600,
+    'searchgpt': 6 * 3600,
+    'gemini': 12 * 3600,
+    'perplexity': 6 * 3600
+}
+DEFAULT_ANSWER_TTL = 12 * 3600
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_query(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so trivially different phrasings share a key"""
+    return _WHITESPACE.sub(' ', _PUNCTUATION.sub(' ', text.lower())).strip()
+
+class AnswerCache:
+    """
+    On-disk cache of AI platform answers.
+
+    Answers are keyed by (platform, normalized query, location, freshness
+    window). The location is only part of the key when the query names it, so
+    generic queries such as "experienced car dealers near me" are shared by
+    every dealer. Freshness windows are fixed, per-platform TTL-sized time
+    slots: every dealer queried within the same window gets the same answer,
+    and an answer is never served after its window ends. Expired entries are
+    dropped first, then least-recently-used ones, once ``max_entries`` or
+    ``max_bytes`` is exceeded.
+    """
+
+    STAT_KEYS = ('hits', 'misses', 'stores', 'evictions')
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, int]] = None,
+                 max_entries: int = 100000, max_bytes: int = 128 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(PLATFORM_ANSWER_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = {key: 0 for key in self.STAT_KEYS}
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS answers (
+                platform TEXT NOT NULL,
+                query TEXT NOT NULL,
+                location TEXT NOT NULL,
+                freshness_window INTEGER NOT NULL,
+                answer TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (platform, query, location, freshness_window)
+            );
+            CREATE INDEX IF NOT EXISTS answers_expires_at ON answers (expires_at);
+            CREATE INDEX IF NOT EXISTS answers_last_access ON answers (last_access);
+            CREATE TABLE IF NOT EXISTS answer_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                entries INTEGER NOT NULL,
+                bytes INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO answer_totals VALUES (0, 0, 0);
+        ''')
+
+    def ttl(self, platform: str) -> int:
+        return self.ttls.get(platform, DEFAULT_ANSWER_TTL)
+
+    def cache_key(self, platform: str, query: str, location: str = '',
+                  now: Optional[float] = None) -> Tuple[str, str, str, int]:
+        """(platform, normalized query, location scope, freshness window) for a query"""
+        normalized = normalize_query(query)
+        location_scope = normalize_query(location)
+        if location_scope not in normalized:
+            location_scope = ''
+        window = int((now if now is not None else time.time()) // self.ttl(platform))
+        return platform, normalized, location_scope, window
+
+    def get(self, platform: str, query: str, location: str = '') -> Optional[Dict[str, Any]]:
+        """Return the cached answer for this freshness window, or None"""
+        now = time.time()
+        key = self.cache_key(platform, query, location, now)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT answer FROM answers WHERE platform = ? AND query = ? AND location = ? AND freshness_window = ? '
+                'AND expires_at > ?', key + (now,)
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    'UPDATE answers SET last_access = ? WHERE platform = ? AND query = ? AND location = ? '
+                    'AND freshness_window = ?', (now,) + key
+                )
+            self.stats['hits' if row else 'misses'] += 1
+        return json.loads(row[0]) if row else None
+
+    def store(self, platform: str, query: str, location: str, answer: Dict[str, Any]):
+        """Store an answer for the current freshness window and evict over budget"""
+        now = time.time()
+        key = self.cache_key(platform, query, location, now)
+        expires_at = (key[3] + 1) * self.ttl(platform)
+        encoded = json.dumps(answer)
+        size = len(encoded) + sum(len(part) for part in key[:3])
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                previous = self._conn.execute(
+                    'SELECT size FROM answers WHERE platform = ? AND query = ? AND location = ? AND freshness_window = ?', key
+                ).fetchone()
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    key + (encoded, size, expires_at, now)
+                )
+                if previous:
+                    self._conn.execute('UPDATE answer_totals SET bytes = bytes + ?', (size - previous[0],))
+                else:
+                    self._conn.execute('UPDATE answer_totals SET entries = entries + 1, bytes = bytes + ?', (size,))
+
+                evicted = self._evict(now)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+            self.stats['stores'] += 1
+            self.stats['evictions'] += evicted
+
+    def _evict(self, now: float) -> int:
+        """Drop expired entries, then the oldest ones until within budget; must run inside a transaction"""
+        entries, total_bytes = self._conn.execute('SELECT entries, bytes FROM answer_totals').fetchone()
+        if entries <= self.max_entries and total_bytes <= self.max_bytes:
+            return 0
+
+        expired_entries, expired_bytes = self._conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers WHERE expires_at <= ?', (now,)
+        ).fetchone()
+        if expired_entries:
+            self._conn.execute('DELETE FROM answers WHERE expires_at <= ?', (now,))
+            entries -= expired_entries
+            total_bytes -= expired_bytes
+        evicted = expired_entries
+
+        while entries > self.max_entries or total_bytes > self.max_bytes:
+            batch = self._conn.execute(
+                'SELECT rowid, size FROM answers ORDER BY last_access LIMIT ?',
+                (max(1, entries - self.max_entries, 16),)
+            ).fetchall()
+            if not batch:
+                break
+
+            for rowid, size in batch:
+                if entries <= self.max_entries and total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute('DELETE FROM answers WHERE rowid = ?', (rowid,))
+                entries -= 1
+                total_bytes -= size
+                evicted += 1
+
+        self._conn.execute('UPDATE answer_totals SET entries = ?, bytes = ?', (entries, total_bytes))
+        return evicted
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the counters, for computing per-run statistics"""
+        with self._lock:
+            return dict(self.stats)
+
+    def stats_since(self, snapshot: Dict[str, int]) -> Dict[str, Any]:
+        """Hit/miss statistics accumulated since ``snapshot`` was taken"""
+        current = self.snapshot()
+        stats: Dict[str, Any] = {key: current[key] - snapshot.get(key, 0) for key in self.STAT_KEYS}
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
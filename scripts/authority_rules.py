@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Authority Element Rules
+Compiled rule table and single-pass traversal engine for counting authority elements in JSON-LD
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Declarative rule table. A rule fires at most once per JSON object when any of
+# its matchers is satisfied; a matcher is satisfied when all of its conditions are:
+#   type - the object's @type equals this value
+#   keys - all of these keys are present on the object
+#   text - this lowercase text occurs anywhere in the object's subtree (keys or
+#          scalar values, as rendered by str()); it must not span punctuation
+# Flag rules set the element to True instead of counting.
+AUTHORITY_RULES: List[Dict[str, Any]] = [
+    {
+        'element': 'certifications',
+        'match_any': [{'type': 'EducationalOccupationalCredential'}]
+    },
+    {
+        'element': 'awards',
+        'match_any': [{'type': 'Award'}, {'text': 'award'}]
+    },
+    {
+        'element': 'expert_staff',
+        'match_any': [{'type': 'Person', 'keys': ['jobTitle']}]
+    },
+    {
+        'element': 'reviews',
+        'match_any': [{'keys': ['aggregateRating']}, {'keys': ['review']}]
+    },
+    {
+        'element': 'experience_years',
+        'flag': True,
+        'match_any': [{'keys': ['foundingDate']}, {'keys': ['yearsInBusiness']}]
+    }
+]
+
+# Characters that can appear in str() of a number, bool or None
+_SCALAR_CHARACTERS = set('0123456789.+-einfalstruo')
+_UNMATCHABLE_TEXT = re.compile(r'[\s\'"\\]')
+
+# Compiled matcher: (rule index, required keys, required text bits)
+_Matcher = Tuple[int, Tuple[str, ...], int]
+
+class AuthorityRuleEngine:
+    """
+    Counts authority elements in linear time without recursion.
+
+    Rules are compiled into a dispatch table keyed by @type plus a list of
+    type-independent matchers. Text matchers are evaluated from per-subtree
+    bitmasks propagated up from children, so each key and scalar is inspected
+    once instead of re-serializing every subtree, and nesting depth is limited
+    only by memory.
+    """
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None):
+        self.rules = rules if rules is not None else AUTHORITY_RULES
+        self._elements: List[str] = []
+        self._flags: List[bool] = []
+        self._text_bits: Dict[str, int] = {}
+        self._typed_matchers: Dict[str, List[_Matcher]] = {}
+        self._untyped_matchers: List[_Matcher] = []
+        self._compile()
+
+        # Numbers, booleans and null only need rendering when a text matcher could match them
+        self._scalar_text = any(set(text) <= _SCALAR_CHARACTERS for text in self._text_bits)
+
+    def _compile(self):
+        for index, rule in enumerate(self.rules):
+            self._elements.append(rule['element'])
+            self._flags.append(bool(rule.get('flag', False)))
+
+            for matcher in rule['match_any']:
+                text_bits = 0
+                if 'text' in matcher:
+                    text = matcher['text'].lower()
+                    if _UNMATCHABLE_TEXT.search(text):
+                        raise ValueError(f"Text matcher may not contain whitespace, quotes or backslashes: {text!r}")
+                    if text not in self._text_bits:
+                        self._text_bits[text] = 1 << len(self._text_bits)
+                    text_bits = self._text_bits[text]
+
+                compiled = (index, tuple(matcher.get('keys', ())), text_bits)
+                if 'type' in matcher:
+                    self._typed_matchers.setdefault(matcher['type'], []).append(compiled)
+                else:
+                    self._untyped_matchers.append(compiled)
+
+    def _text_mask(self, strings: List[str]) -> int:
+        """Text bits present in a node's keys and scalars, rendered the way str() renders them"""
+        joined = ' '.join(strings)
+        if not joined.isprintable():
+            # repr() escapes non-printable characters, which can change what matches
+            joined = ' '.join(repr(token) for token in strings)
+        rendered = joined.lower()
+
+        mask = 0
+        for text, bit in self._text_bits.items():
+            if text in rendered:
+                mask |= bit
+        return mask
+
+    def _evaluate(self, node: Dict, subtree_text: int, elements: Dict[str, Any]):
+        node_type = node.get('@type')
+        typed = self._typed_matchers.get(node_type, ()) if isinstance(node_type, str) else ()
+
+        fired = 0
+        for matchers in (typed, self._untyped_matchers):
+            for index, keys, text_bits in matchers:
+                bit = 1 << index
+                if fired & bit:
+                    continue
+                if text_bits and subtree_text & text_bits != text_bits:
+                    continue
+                for key in keys:
+                    if key not in node:
+                        break
+                else:
+                    fired |= bit
+                    element = self._elements[index]
+                    if self._flags[index]:
+                        elements[element] = True
+                    else:
+                        elements[element] += 1
+
+    def count(self, schema_data: Any, elements: Dict[str, Any]):
+        """Add authority element counts for ``schema_data`` into ``elements``"""
+        if not isinstance(schema_data, (dict, list)):
+            return
+
+        track_text = bool(self._text_bits)
+        track_scalars = self._scalar_text
+
+        # Breadth-first pass: every container is visited once and children always
+        # land after their parent, so walking the list backwards is a post-order.
+        nodes: List[Any] = [schema_data]
+        parents: List[int] = [-1]
+        masks: List[int] = []
+
+        index = 0
+        while index < len(nodes):
+            node = nodes[index]
+            if isinstance(node, dict):
+                values = node.values()
+                strings = list(node) if track_text else None
+            else:
+                values = node
+                strings = [] if track_text else None
+
+            for value in values:
+                if isinstance(value, (dict, list)):
+                    nodes.append(value)
+                    parents.append(index)
+                elif track_text:
+                    if isinstance(value, str):
+                        strings.append(value)
+                    elif track_scalars:
+                        strings.append(repr(value))
+
+            masks.append(self._text_mask(strings) if strings else 0)
+            index += 1
+
+        for index in range(len(nodes) - 1, -1, -1):
+            node = nodes[index]
+            if isinstance(node, dict):
+                self._evaluate(node, masks[index], elements)
+            parent = parents[index]
+            if parent >= 0:
+                masks[parent] |= masks[index]
@@ -4,10 +4,13 @@ Authority Score Calculator
 Calculates final authority score based on implemented features
 """
 
-import json
-from typing import Dict, Any
+import argparse
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from report_sink import ReportSink, report_path
+from results_store import ResultsStore
+
 class AuthorityScoreCalculator:
     def __init__(self):
         self.baseline_score = 58
@@ -192,41 +195,77 @@ class AuthorityScoreCalculator:
             }
         }
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Calculate the final authority score")
+    parser.add_argument('--dealer', default='https://your-dealership.com',
+                        help="Dealer the score is recorded under in the results store")
+    parser.add_argument('--results-db', default=None,
+                        help="SQLite results store to append the score components to (disabled by default)")
+    parser.add_argument('--output', default=None,
+                        help="NDJSON report path; a .gz suffix compresses it "
+                             "(default: $DEALERSHIP_AI_REPORTS_DIR or reports/)")
+    parser.add_argument('--compress', action='store_true',
+                        help="Gzip the report when --output is not given")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
     calculator = AuthorityScoreCalculator()
+    output_path = report_path('final_authority_score_report.ndjson', args.output, args.compress)
 
     print("📊 Calculating Final Authority Score...")
 
-    # Calculate final score
-    score_results = calculator.calculate_final_authority_score()
-
-    # Generate detailed breakdown
-    authority_breakdown = calculator.generate_authority_breakdown(score_results)
-
-    # Compile comprehensive report
-    final_report = {
-        'calculation_timestamp': datetime.now().isoformat(),
-        'authority_score_results': score_results,
-        'authority_breakdown': authority_breakdown,
-        'implementation_summary': {
+    with ReportSink(output_path) as sink:
+        # Calculate final score
+        score_results = calculator.calculate_final_authority_score()
+        sink.write(score_results, record_type='authority_score_results')
+
+        # Generate detailed breakdown
+        authority_breakdown = calculator.generate_authority_breakdown(score_results)
+        sink.write(authority_breakdown, record_type='authority_breakdown')
+
+        if args.results_db:
+            scores = {
+                'final_score': score_results['final_score'],
+                'improvement': score_results['improvement'],
+                'eat_weighted_score': authority_breakdown['eat_weighted_score']
+            }
+            for feature, contribution in score_results['feature_contributions'].items():
+                scores[feature] = contribution['score_contribution']
+            for component, data in authority_breakdown['eat_components'].items():
+                scores[f'eat_{component.lower()}'] = data['score']
+
+            results_store = ResultsStore(args.results_db)
+            try:
+                results_store.append_authority_scores(args.dealer, scores, 'calculator')
+            finally:
+                results_store.close()
+
+        implementation_summary = {
             'weeks_completed': 4,
             'features_implemented': len(calculator.implemented_features),
             'schema_types_added': 8,
             'certifications_displayed': 6,
             'staff_profiles_created': 12,
             'awards_showcased': 4
-        },
-        'business_impact_projection': {
+        }
+        sink.write(implementation_summary, record_type='implementation_summary')
+
+        business_impact = {
             'authority_score_improvement': score_results['improvement'],
             'estimated_annual_revenue_increase': round(score_results['improvement'] * 1500),
             'ai_platform_visibility_improvement': '400%',
             'organic_search_ranking_boost': '+15 average positions'
         }
-    }
+        sink.write(business_impact, record_type='business_impact_projection')
 
-    # Save comprehensive report
-    with open('/Users/briankramer/Documents/GitHub/dealership-ai/reports/final_authority_score_report.json', 'w') as f:
-        json.dump(final_report, f, indent=2)
+        summary = {
+            'calculation_timestamp': datetime.now().isoformat(),
+            'final_score': score_results['final_score'],
+            'improvement': score_results['improvement'],
+            'eat_weighted_score': authority_breakdown['eat_weighted_score']
+        }
+        sink.close(summary)
 
     # Print results
     print("\n" + "="*70)
@@ -237,15 +276,22 @@ def main():
     print(f"✅ Final Score: {score_results['final_score']}")
     print(f"📈 Improvement: +{score_results['improvement']} points")
     print(f"🎯 Target Achievement: {score_results['target_achievement_percent']:.1f}%")
-    print(f"💰 Revenue Impact: ${final_report['business_impact_projection']['estimated_annual_revenue_increase']:,}/year")
+    print(f"💰 Revenue Impact: ${business_impact['estimated_annual_revenue_increase']:,}/year")
     print("="*70)
     print("\n🎯 E-E-A-T Component Scores:")
     for component, data in authority_breakdown['eat_components'].items():
         print(f"  {component}: {data['score']}/100")
     print(f"\n📊 Overall E-E-A-T Score: {authority_breakdown['eat_weighted_score']}/100")
+    print(f"📄 Report: {output_path}")
     print("="*70)
 
-    return final_report
+    return {
+        'calculation_timestamp': summary['calculation_timestamp'],
+        'authority_score_results': score_results,
+        'authority_breakdown': authority_breakdown,
+        'implementation_summary': implementation_summary,
+        'business_impact_projection': business_impact
+    }
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,28 +4,167 @@ Authority Schema Validation Script
 Validates all implemented schema markup and measures authority score improvements
 """
 
+import argparse
+import asyncio
+import hashlib
 import json
+import os
 import requests
 import time
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from urllib.parse import urljoin, urlparse
+from typing import Dict, List, Any, Iterable, Iterator, Optional
 import logging
 
+from authority_rules import AuthorityRuleEngine
+from contribution_ledger import ContributionLedger, schema_fingerprint
+from http_cache import PageCache
+from jsonld_extractor import extract_jsonld_from_response
+from report_sink import ReportSink, report_path
+from results_store import ResultsStore, authority_score_components
+from schema_rules import SchemaValidator
+from schema_vocabulary import SchemaVocabulary
+from site_discovery import SiteDiscovery
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Schema errors listed per JSON-LD block before the rest are summarized
+MAX_SCHEMA_ERRORS_PER_BLOCK = 20
+
+# Pages to validate
+PAGES_TO_CHECK = [
+    '/',
+    '/about',
+    '/staff',
+    '/certifications',
+    '/awards',
+    '/inventory',
+    '/service',
+    '/parts'
+]
+
+# Authority scoring (shared with batch_scoring.py)
+BASE_AUTHORITY_SCORE = 58  # Starting authority score
+AUTHORITY_SCORE_WEIGHTS = {
+    'schema_implementation': 0.25,  # 25% - Technical implementation
+    'certifications': 0.20,         # 20% - Industry certifications
+    'expert_staff': 0.15,           # 15% - Staff expertise
+    'awards_recognition': 0.15,     # 15% - Awards and recognition
+    'customer_reviews': 0.15,       # 15% - Customer validation
+    'business_longevity': 0.10      # 10% - Years in business
+}
+MAX_SCORE = 100                    # Cap for each component and for the final score
+SCHEMA_IMPLEMENTATION_SCALE = 120  # Full marks at ~83% valid schemas per page
+CERTIFICATION_POINTS = 15          # 15 points per certification
+EXPERT_STAFF_POINTS = 10           # 10 points per expert
+AWARD_POINTS = 20                  # 20 points per award
+CUSTOMER_REVIEWS_SCORE = 85
+BUSINESS_LONGEVITY_SCORE = 90
+IMPROVEMENT_POTENTIAL = 0.3        # 30% improvement potential
+
+class TokenBucket:
+    """Async token bucket used as a per-host politeness limit"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 class AuthorityValidator:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, cache_path: Optional[str] = None,
+                 ledger_path: Optional[str] = None, discover_pages: bool = False,
+                 page_budget: int = 25, vocabulary_path: Optional[str] = None,
+                 request_delay: float = 0.5):
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; AuthorityValidator/1.0)'
         })
+        self.rule_engine = AuthorityRuleEngine()
+        self.vocabulary = SchemaVocabulary(vocabulary_path) if vocabulary_path else None
+        self.schema_validator = SchemaValidator(vocabulary=self.vocabulary)
+        self.cache = PageCache(cache_path, version=self.schema_validator.version) if cache_path else None
+        self.ledger = ContributionLedger(ledger_path) if ledger_path else None
+        self.discover_pages = discover_pages
+        self.page_budget = page_budget
+        self.request_delay = request_delay
+        self._pages: Optional[List[str]] = None
+        self.discovery_stats: Optional[Dict[str, int]] = None
+
+    def pages_to_check(self) -> List[str]:
+        """Pages to validate: the fixed list, or a sitemap-driven selection within the page budget"""
+        if self._pages is None:
+            if self.discover_pages:
+                discovery = SiteDiscovery(self.session, self.base_url, page_budget=self.page_budget)
+                self._pages = discovery.discover(seed_pages=PAGES_TO_CHECK)
+                self.discovery_stats = discovery.stats
+            else:
+                self._pages = list(PAGES_TO_CHECK)
+        return self._pages
 
     def validate_schema_markup(self) -> Dict[str, Any]:
         """Validate JSON-LD schema markup implementation"""
-        results = {
+        cache_snapshot = self.cache.snapshot() if self.cache else None
+        pages = self.pages_to_check()
+        page_records = []
+
+        for page in pages:
+            page_records.append(self._validate_page(page))
+            time.sleep(self.request_delay)  # Rate limiting
+
+        return self._aggregate_page_records(pages, page_records, cache_snapshot)
+
+    async def validate_schema_markup_async(self, max_concurrency_per_host: int = 4,
+                                           requests_per_second: float = 2.0,
+                                           burst: int = 2) -> Dict[str, Any]:
+        """Validate JSON-LD schema markup with concurrent page fetches.
+
+        Pages are fetched concurrently, capped at ``max_concurrency_per_host``
+        in-flight requests per host and paced by a per-host token bucket
+        instead of a fixed sleep. Blocking I/O and parsing run in worker
+        threads, so this is safe to await from an existing event loop.
+        Returns the same structure as ``validate_schema_markup``.
+        """
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        buckets: Dict[str, TokenBucket] = {}
+        cache_snapshot = self.cache.snapshot() if self.cache else None
+
+        async def validate(page: str) -> Dict[str, Any]:
+            host = urlparse(urljoin(self.base_url, page)).netloc
+            if host not in semaphores:
+                semaphores[host] = asyncio.Semaphore(max_concurrency_per_host)
+                buckets[host] = TokenBucket(requests_per_second, burst)
+
+            async with semaphores[host]:
+                await buckets[host].acquire()
+                return await asyncio.to_thread(self._validate_page, page)
+
+        pages = await asyncio.to_thread(self.pages_to_check)
+        page_records = await asyncio.gather(*(validate(page) for page in pages))
+
+        return self._aggregate_page_records(pages, page_records, cache_snapshot)
+
+    def _new_results(self) -> Dict[str, Any]:
+        """Create an empty validation results structure"""
+        return {
             'pages_validated': 0,
             'schema_found': 0,
             'valid_schemas': 0,
@@ -36,107 +175,133 @@ class AuthorityValidator:
                 'reviews': 0,
                 'experience_years': False
             },
+            'schema_warnings': 0,
             'errors': []
         }
 
-        # Pages to validate
-        pages_to_check = [
-            '/',
-            '/about',
-            '/staff',
-            '/certifications',
-            '/awards',
-            '/inventory',
-            '/service',
-            '/parts'
-        ]
+    def _aggregate_page_records(self, pages: List[str], page_records: List[Dict[str, Any]],
+                                cache_snapshot: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Combine per-page records (in page order) into the validation results"""
+        results = self._new_results()
+
+        if self.ledger:
+            # Only pages whose JSON-LD changed move the stored aggregate
+            applied = self.ledger.apply(self.base_url, dict(zip(pages, page_records)))
+            aggregate = applied['aggregate']
+            for key in ('pages_validated', 'schema_found', 'valid_schemas', 'schema_warnings'):
+                results[key] = aggregate.get(key, 0)
+            for key in ('certifications', 'awards', 'expert_staff', 'reviews'):
+                results['authority_elements'][key] = aggregate[key]
+            results['authority_elements']['experience_years'] = aggregate['experience_years_pages'] > 0
+            for record in page_records:
+                results['errors'].extend(record['errors'])
+            results['incremental'] = applied['stats']
+        else:
+            for record in page_records:
+                self._merge_page_record(results, record)
 
-        for page in pages_to_check:
-            try:
-                url = urljoin(self.base_url, page)
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
+        if self.cache:
+            results['cache'] = self.cache.stats_since(cache_snapshot)
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results['pages_validated'] += 1
+        if self.discovery_stats is not None:
+            results['discovery'] = dict(self.discovery_stats, pages_selected=len(pages))
 
-                # Find JSON-LD scripts
-                scripts = soup.find_all('script', {'type': 'application/ld+json'})
+        return results
 
-                for script in scripts:
-                    try:
-                        schema_data = json.loads(script.string)
-                        results['schema_found'] += 1
+    def _validate_page(self, page: str) -> Dict[str, Any]:
+        """Fetch and validate a single page, returning its contribution to the results"""
+        record = self._new_results()
 
-                        # Validate schema structure
-                        if self._validate_schema_structure(schema_data):
-                            results['valid_schemas'] += 1
+        try:
+            url = urljoin(self.base_url, page)
+            headers = self.cache.conditional_headers(url) if self.cache else None
+            response = self.session.get(url, timeout=10, stream=True, headers=headers)
 
-                        # Count authority elements
-                        self._count_authority_elements(schema_data, results['authority_elements'])
+            if self.cache and response.status_code == 304:
+                response.close()
+                cached_record = self.cache.not_modified(url)
+                if cached_record is not None:
+                    return cached_record
+                raise Exception(f"Unexpected 304 Not Modified for uncached or outdated page {url}")
 
-                    except json.JSONDecodeError as e:
-                        results['errors'].append(f"Invalid JSON-LD on {page}: {str(e)}")
+            response.raise_for_status()
 
-            except Exception as e:
-                results['errors'].append(f"Error validating {page}: {str(e)}")
+            # Scan the body for JSON-LD scripts, stopping once no more can follow
+            digest = hashlib.sha256(self.schema_validator.version.encode()) if self.cache else None
+            blocks = extract_jsonld_from_response(response, digest=digest)
 
-            time.sleep(0.5)  # Rate limiting
+            if self.cache:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                cached_record = self.cache.matching_content(url, digest.hexdigest(), etag, last_modified)
+                if cached_record is not None:
+                    return cached_record
 
-        return results
+            # Pages whose JSON-LD is unchanged since the last run are not recounted
+            fingerprint = schema_fingerprint(blocks, salt=self.schema_validator.version)
+            unchanged_record = self.ledger.unchanged_record(self.base_url, page, fingerprint) if self.ledger else None
 
-    def _validate_schema_structure(self, schema_data: Dict) -> bool:
-        """Validate schema structure against Schema.org requirements"""
-        required_fields = ['@context', '@type']
+            if unchanged_record is not None:
+                record = unchanged_record
+            else:
+                self._count_page_blocks(page, blocks, record)
+                record['fingerprint'] = fingerprint
 
-        if isinstance(schema_data, list):
-            return all(
-                all(field in item for field in required_fields)
-                for item in schema_data
-                if isinstance(item, dict)
-            )
-        elif isinstance(schema_data, dict):
-            return all(field in schema_data for field in required_fields)
+            if self.cache:
+                self.cache.store(url, digest.hexdigest(), etag, last_modified, record)
 
-        return False
+        except Exception as e:
+            record['errors'].append(f"Error validating {page}: {str(e)}")
+
+        return record
+
+    def _count_page_blocks(self, page: str, blocks: List[str], record: Dict[str, Any]):
+        """Parse, validate and count a page's JSON-LD blocks into its record"""
+        record['pages_validated'] += 1
+
+        for block in blocks:
+            try:
+                schema_data = json.loads(block)
+                record['schema_found'] += 1
+
+                # Validate schema structure
+                report = self._validate_schema_structure(schema_data)
+                if report['valid']:
+                    record['valid_schemas'] += 1
+                record['schema_warnings'] += len(report['warnings'])
+
+                schema_errors = report['errors']
+                record['errors'].extend(f"Schema error on {page}: {error}" for error in schema_errors[:MAX_SCHEMA_ERRORS_PER_BLOCK])
+                if len(schema_errors) > MAX_SCHEMA_ERRORS_PER_BLOCK:
+                    record['errors'].append(f"Schema error on {page}: {len(schema_errors) - MAX_SCHEMA_ERRORS_PER_BLOCK} more")
+
+                # Count authority elements
+                self._count_authority_elements(schema_data, record['authority_elements'])
+
+            except json.JSONDecodeError as e:
+                record['errors'].append(f"Invalid JSON-LD on {page}: {str(e)}")
+
+    def _merge_page_record(self, results: Dict[str, Any], record: Dict[str, Any]):
+        """Add a single page's contribution into the aggregate results"""
+        for key in ('pages_validated', 'schema_found', 'valid_schemas', 'schema_warnings'):
+            results[key] += record.get(key, 0)
+
+        elements = results['authority_elements']
+        for key, value in record['authority_elements'].items():
+            if key == 'experience_years':
+                elements[key] = elements[key] or value
+            else:
+                elements[key] += value
+
+        results['errors'].extend(record['errors'])
+
+    def _validate_schema_structure(self, schema_data: Dict) -> Dict[str, Any]:
+        """Validate schema structure against Schema.org requirements"""
+        return self.schema_validator.validate(schema_data)
 
     def _count_authority_elements(self, schema_data: Dict, elements: Dict):
         """Count authority-building elements in schema"""
-        def traverse_schema(data):
-            if isinstance(data, dict):
-                # Check for certifications
-                if data.get('@type') == 'EducationalOccupationalCredential':
-                    elements['certifications'] += 1
-
-                # Check for awards
-                if data.get('@type') == 'Award' or 'award' in str(data).lower():
-                    elements['awards'] += 1
-
-                # Check for expert staff
-                if data.get('@type') == 'Person' and 'jobTitle' in data:
-                    elements['expert_staff'] += 1
-
-                # Check for reviews
-                if 'aggregateRating' in data or 'review' in data:
-                    elements['reviews'] += 1
-
-                # Check for years in business
-                if 'foundingDate' in data or 'yearsInBusiness' in data:
-                    elements['experience_years'] = True
-
-                # Recursively check nested objects
-                for value in data.values():
-                    traverse_schema(value)
-
-            elif isinstance(data, list):
-                for item in data:
-                    traverse_schema(item)
-
-        if isinstance(schema_data, list):
-            for item in schema_data:
-                traverse_schema(item)
-        else:
-            traverse_schema(schema_data)
+        self.rule_engine.count(schema_data, elements)
 
     def test_google_rich_results(self, urls: List[str]) -> Dict[str, Any]:
         """Test URLs with Google Rich Results Test"""
@@ -182,106 +347,279 @@ class AuthorityValidator:
 
     def calculate_authority_score(self, validation_results: Dict) -> Dict[str, Any]:
         """Calculate final authority score based on implementation"""
-        base_score = 58  # Starting authority score
+        base_score = BASE_AUTHORITY_SCORE
 
         # Scoring weights
-        weights = {
-            'schema_implementation': 0.25,  # 25% - Technical implementation
-            'certifications': 0.20,         # 20% - Industry certifications
-            'expert_staff': 0.15,           # 15% - Staff expertise
-            'awards_recognition': 0.15,     # 15% - Awards and recognition
-            'customer_reviews': 0.15,       # 15% - Customer validation
-            'business_longevity': 0.10      # 10% - Years in business
-        }
+        weights = dict(AUTHORITY_SCORE_WEIGHTS)
 
         score_components = {}
 
         # Schema implementation score (0-100)
         if validation_results['pages_validated'] > 0:
             implementation_rate = validation_results['valid_schemas'] / validation_results['pages_validated']
-            score_components['schema_implementation'] = min(100, implementation_rate * 120)
+            score_components['schema_implementation'] = min(MAX_SCORE, implementation_rate * SCHEMA_IMPLEMENTATION_SCALE)
         else:
             score_components['schema_implementation'] = 0
 
         # Certifications score
         cert_count = validation_results['authority_elements']['certifications']
-        score_components['certifications'] = min(100, cert_count * 15)  # 15 points per certification
+        score_components['certifications'] = min(MAX_SCORE, cert_count * CERTIFICATION_POINTS)
 
         # Expert staff score
         staff_count = validation_results['authority_elements']['expert_staff']
-        score_components['expert_staff'] = min(100, staff_count * 10)  # 10 points per expert
+        score_components['expert_staff'] = min(MAX_SCORE, staff_count * EXPERT_STAFF_POINTS)
 
         # Awards score
         awards_count = validation_results['authority_elements']['awards']
-        score_components['awards_recognition'] = min(100, awards_count * 20)  # 20 points per award
+        score_components['awards_recognition'] = min(MAX_SCORE, awards_count * AWARD_POINTS)
 
         # Reviews score
         has_reviews = validation_results['authority_elements']['reviews'] > 0
-        score_components['customer_reviews'] = 85 if has_reviews else 0
+        score_components['customer_reviews'] = CUSTOMER_REVIEWS_SCORE if has_reviews else 0
 
         # Business longevity score
         has_founding_date = validation_results['authority_elements']['experience_years']
-        score_components['business_longevity'] = 90 if has_founding_date else 0
+        score_components['business_longevity'] = BUSINESS_LONGEVITY_SCORE if has_founding_date else 0
 
         # Calculate weighted final score
         final_score = base_score
         for component, score in score_components.items():
             weighted_contribution = (score * weights[component])
-            final_score += weighted_contribution * 0.3  # 30% improvement potential
+            final_score += weighted_contribution * IMPROVEMENT_POTENTIAL
 
         return {
             'base_score': base_score,
-            'final_score': min(100, round(final_score)),
-            'improvement': min(100, round(final_score)) - base_score,
+            'final_score': min(MAX_SCORE, round(final_score)),
+            'improvement': min(MAX_SCORE, round(final_score)) - base_score,
             'components': score_components,
             'weights': weights
         }
 
-def main():
-    # Initialize validator with dealership URL
-    validator = AuthorityValidator("https://your-dealership.com")
+def build_recommendations(validation_results: Dict[str, Any]) -> List[str]:
+    """Build recommendations based on validation results"""
+    recommendations = []
 
-    logger.info("🚀 Starting Authority Schema Validation...")
+    if validation_results['valid_schemas'] < validation_results['pages_validated']:
+        recommendations.append("Fix schema markup errors on remaining pages")
+
+    if validation_results['authority_elements']['certifications'] < 3:
+        recommendations.append("Add more industry certifications to schema")
 
-    # 1. Validate schema markup
-    logger.info("📋 Validating schema markup implementation...")
-    validation_results = validator.validate_schema_markup()
-
-    # 2. Test rich results
-    logger.info("🔍 Testing Google Rich Results...")
-    test_urls = [
-        "https://your-dealership.com/",
-        "https://your-dealership.com/staff",
-        "https://your-dealership.com/certifications"
-    ]
-    rich_results = validator.test_google_rich_results(test_urls)
-
-    # 3. Calculate authority score
-    logger.info("📊 Calculating authority score improvement...")
-    authority_score = validator.calculate_authority_score(validation_results)
-
-    # Generate final report
-    report = {
+    if validation_results['authority_elements']['expert_staff'] < 5:
+        recommendations.append("Add more staff member profiles with expertise")
+
+    return recommendations
+
+def validate_dealership(base_url: str, cache_path: Optional[str] = None,
+                        ledger_path: Optional[str] = None, discover_pages: bool = False,
+                        page_budget: int = 25, vocabulary_path: Optional[str] = None) -> Dict[str, Any]:
+    """Validate and score a single dealership (fleet worker entry point)"""
+    validator = AuthorityValidator(base_url, cache_path=cache_path, ledger_path=ledger_path,
+                                   discover_pages=discover_pages, page_budget=page_budget,
+                                   vocabulary_path=vocabulary_path)
+
+    try:
+        validation_results = asyncio.run(validator.validate_schema_markup_async())
+        authority_score = validator.calculate_authority_score(validation_results)
+    except Exception as e:
+        return {
+            'base_url': base_url,
+            'validation_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'error': str(e)
+        }
+    finally:
+        validator.session.close()
+        if validator.cache:
+            validator.cache.close()
+        if validator.ledger:
+            validator.ledger.close()
+        if validator.vocabulary:
+            validator.vocabulary.close()
+
+    return {
+        'base_url': base_url,
         'validation_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
         'schema_validation': validation_results,
-        'rich_results_test': rich_results,
         'authority_score': authority_score,
-        'recommendations': []
+        'recommendations': build_recommendations(validation_results)
     }
 
-    # Add recommendations based on results
-    if validation_results['valid_schemas'] < validation_results['pages_validated']:
-        report['recommendations'].append("Fix schema markup errors on remaining pages")
+def iter_dealership_urls(source: str) -> Iterator[str]:
+    """Stream dealership URLs from a file, one per line ('#' starts a comment)"""
+    with open(source) as f:
+        for line in f:
+            url = line.split('#', 1)[0].strip()
+            if url:
+                yield url
+
+def run_fleet(urls: Iterable[str], output_path: str, workers: Optional[int] = None,
+              max_pending: Optional[int] = None, cache_path: Optional[str] = None,
+              ledger_path: Optional[str] = None, discover_pages: bool = False,
+              page_budget: int = 25, vocabulary_path: Optional[str] = None,
+              results_path: Optional[str] = None) -> Dict[str, Any]:
+    """Validate many dealerships across a process pool.
+
+    URLs are consumed lazily and at most ``max_pending`` dealers are in flight,
+    so memory stays flat regardless of fleet size. Each result is streamed to
+    ``output_path`` as one NDJSON record as soon as its worker finishes, and
+    the fleet summary is written as the final record. With ``results_path``,
+    each dealer's score components are also appended to that results store.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+
+    summary = {
+        'dealers_validated': 0,
+        'dealers_failed': 0,
+        'total_score': 0,
+        'started_at': time.strftime('%Y-%m-%d %H:%M:%S')
+    }
 
-    if validation_results['authority_elements']['certifications'] < 3:
-        report['recommendations'].append("Add more industry certifications to schema")
+    url_iter = iter(urls)
+    worker = partial(validate_dealership, cache_path=cache_path, ledger_path=ledger_path,
+                     discover_pages=discover_pages, page_budget=page_budget,
+                     vocabulary_path=vocabulary_path)
+    results_store = ResultsStore(results_path) if results_path else None
+    with ProcessPoolExecutor(max_workers=workers) as executor, ReportSink(output_path) as sink:
+        pending = set()
+
+        while True:
+            # Top up the in-flight window from the URL stream
+            for url in url_iter:
+                pending.add(executor.submit(worker, url))
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                sink.write(record, record_type='dealer')
+
+                if 'error' in record:
+                    summary['dealers_failed'] += 1
+                    logger.warning(f"Fleet validation failed for {record['base_url']}: {record['error']}")
+                else:
+                    summary['dealers_validated'] += 1
+                    summary['total_score'] += record['authority_score']['final_score']
+                    if results_store:
+                        results_store.append_authority_scores(
+                            record['base_url'], authority_score_components(record['authority_score']), 'validator'
+                        )
+
+        summary['finished_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        summary['average_score'] = (
+            round(summary['total_score'] / summary['dealers_validated'], 1)
+            if summary['dealers_validated'] else 0
+        )
+        sink.close(summary)
+
+    if results_store:
+        results_store.close()
+    return summary
+
+def fleet_main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run fleet validation from command line arguments"""
+    urls = iter_dealership_urls(args.fleet) if args.fleet else args.urls
+    output_path = report_path('authority_fleet_results.ndjson', args.output, args.compress)
+
+    logger.info(f"🚚 Starting fleet validation with {args.workers or os.cpu_count()} workers...")
+    summary = run_fleet(urls, str(output_path), workers=args.workers, cache_path=args.cache,
+                        ledger_path=args.ledger, discover_pages=args.discover,
+                        page_budget=args.page_budget, vocabulary_path=args.vocabulary,
+                        results_path=args.results_db)
 
-    if validation_results['authority_elements']['expert_staff'] < 5:
-        report['recommendations'].append("Add more staff member profiles with expertise")
+    print("\n" + "="*60)
+    print("🎯 FLEET AUTHORITY VALIDATION COMPLETE")
+    print("="*60)
+    print(f"✅ Dealers Validated: {summary['dealers_validated']}")
+    print(f"❌ Dealers Failed: {summary['dealers_failed']}")
+    print(f"🏆 Average Authority Score: {summary['average_score']}")
+    print(f"📄 Results: {output_path}")
+    print("="*60)
 
-    # Save report
-    with open('/Users/briankramer/Documents/GitHub/dealership-ai/reports/authority_validation_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    return summary
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate authority schema markup")
+    parser.add_argument('urls', nargs='*', help="Dealership URLs to validate in fleet mode")
+    parser.add_argument('--fleet', help="File of dealership URLs, one per line")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for fleet mode (default: CPU count)")
+    parser.add_argument('--output', default=None,
+                        help="NDJSON report path; a .gz suffix compresses it "
+                             "(default: $DEALERSHIP_AI_REPORTS_DIR or reports/)")
+    parser.add_argument('--compress', action='store_true',
+                        help="Gzip the report when --output is not given")
+    parser.add_argument('--cache', default=None,
+                        help="SQLite file for the conditional page cache (disabled by default)")
+    parser.add_argument('--ledger', default=None,
+                        help="SQLite file for incremental per-page contributions (disabled by default)")
+    parser.add_argument('--discover', action='store_true',
+                        help="Discover pages from robots.txt and sitemaps instead of the fixed list")
+    parser.add_argument('--page-budget', type=int, default=25,
+                        help="Maximum pages per site when discovering (default: 25)")
+    parser.add_argument('--vocabulary', default=None,
+                        help="Schema.org vocabulary index built by schema_vocabulary.py (disabled by default)")
+    parser.add_argument('--results-db', default=None,
+                        help="SQLite results store to append authority score history to (disabled by default)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    if args.fleet or args.urls:
+        return fleet_main(args)
+
+    # Initialize validator with dealership URL
+    validator = AuthorityValidator("https://your-dealership.com", cache_path=args.cache,
+                                   ledger_path=args.ledger, discover_pages=args.discover,
+                                   page_budget=args.page_budget, vocabulary_path=args.vocabulary)
+
+    logger.info("🚀 Starting Authority Schema Validation...")
+    output_path = report_path('authority_validation_report.ndjson', args.output, args.compress)
+
+    with ReportSink(output_path) as sink:
+        # 1. Validate schema markup
+        logger.info("📋 Validating schema markup implementation...")
+        validation_results = validator.validate_schema_markup()
+        sink.write(validation_results, record_type='schema_validation')
+
+        # 2. Test rich results
+        logger.info("🔍 Testing Google Rich Results...")
+        test_urls = [
+            "https://your-dealership.com/",
+            "https://your-dealership.com/staff",
+            "https://your-dealership.com/certifications"
+        ]
+        rich_results = validator.test_google_rich_results(test_urls)
+        sink.write(rich_results, record_type='rich_results_test')
+
+        # 3. Calculate authority score
+        logger.info("📊 Calculating authority score improvement...")
+        authority_score = validator.calculate_authority_score(validation_results)
+        sink.write(authority_score, record_type='authority_score')
+        if args.results_db:
+            results_store = ResultsStore(args.results_db)
+            try:
+                results_store.append_authority_scores(validator.base_url,
+                                                      authority_score_components(authority_score), 'validator')
+            finally:
+                results_store.close()
+
+        recommendations = build_recommendations(validation_results)
+        sink.write({'recommendations': recommendations}, record_type='recommendations')
+
+        summary = {
+            'base_url': validator.base_url,
+            'validation_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'pages_validated': validation_results['pages_validated'],
+            'valid_schemas': validation_results['valid_schemas'],
+            'final_score': authority_score['final_score'],
+            'improvement': authority_score['improvement']
+        }
+        sink.close(summary)
 
     # Print summary
     print("\n" + "="*60)
@@ -289,11 +627,21 @@ def main():
     print("="*60)
     print(f"📄 Pages Validated: {validation_results['pages_validated']}")
     print(f"✅ Valid Schemas: {validation_results['valid_schemas']}")
+    print(f"⚠️  Schema Warnings: {validation_results['schema_warnings']}")
     print(f"🏆 Authority Score: {authority_score['base_score']} → {authority_score['final_score']} (+{authority_score['improvement']})")
     print(f"💰 Estimated Annual Revenue Impact: ${authority_score['improvement'] * 1500:,}")
+    if 'cache' in validation_results:
+        print(f"🗄️  Page Cache Hit Rate: {validation_results['cache']['hit_rate']:.1%}")
+    print(f"📄 Report: {output_path}")
     print("="*60)
 
-    return report
+    return {
+        'validation_timestamp': summary['validation_timestamp'],
+        'schema_validation': validation_results,
+        'rich_results_test': rich_results,
+        'authority_score': authority_score,
+        'recommendations': recommendations
+    }
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
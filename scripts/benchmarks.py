@@ -0,0 +1,1123 @@
+#!/usr/bin/env python3
+"""
+Authority Validation Benchmarks
+Measures hot paths of the validation pipeline against synthetic or saved dealer pages
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import pickle
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAKES = ['Toyota', 'Honda', 'Ford', 'Chevrolet', 'Nissan', 'Subaru', 'Hyundai', 'Kia']
+MODELS = ['Camry', 'Civic', 'F-150', 'Silverado', 'Altima', 'Outback', 'Tucson', 'Sorento']
+JOB_TITLES = ['Master Technician', 'Service Advisor', 'Sales Consultant', 'Finance Manager', 'General Manager']
+
+def generate_dealer_schema(rng: random.Random, vehicles: int = 50, staff: int = 10) -> Dict[str, Any]:
+    """Generate a realistic dealership JSON-LD document with an inventory @graph"""
+    graph: List[Dict[str, Any]] = [{
+        '@type': 'AutoDealer',
+        '@id': '#dealer',
+        'name': 'Premier Auto Group',
+        'foundingDate': '1987',
+        'award': ['Dealer of the Year 2023', "President's Award"],
+        'aggregateRating': {'@type': 'AggregateRating', 'ratingValue': 4.7, 'reviewCount': 1289},
+        'employee': [
+            {
+                '@type': 'Person',
+                'name': f'Staff Member {i}',
+                'jobTitle': rng.choice(JOB_TITLES),
+                'hasCredential': {
+                    '@type': 'EducationalOccupationalCredential',
+                    'credentialCategory': 'certification',
+                    'name': 'ASE Master Certification'
+                }
+            }
+            for i in range(staff)
+        ]
+    }]
+
+    for i in range(vehicles):
+        make = rng.choice(MAKES)
+        graph.append({
+            '@type': 'Vehicle',
+            '@id': f'#vehicle-{i}',
+            'name': f'{rng.randint(2015, 2025)} {make} {rng.choice(MODELS)}',
+            'vehicleIdentificationNumber': ''.join(rng.choice('ABCDEFGHJKLMNPRSTUVWXYZ0123456789') for _ in range(17)),
+            'mileageFromOdometer': {'@type': 'QuantitativeValue', 'value': rng.randint(5, 120000), 'unitCode': 'SMI'},
+            'brand': {'@type': 'Brand', 'name': make},
+            'offers': {
+                '@type': 'Offer',
+                'price': rng.randint(12000, 65000),
+                'priceCurrency': 'USD',
+                'availability': 'https://schema.org/InStock',
+                'seller': {'@id': '#dealer'}
+            }
+        })
+
+    return {'@context': 'https://schema.org', '@graph': graph}
+
+def generate_dealer_page(rng: random.Random, vehicles: int = 50, cards: int = 200) -> bytes:
+    """Generate a heavy inventory page with JSON-LD, inline scripts, styles and comments"""
+    head = [
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">',
+        '<title>Inventory | Premier Auto Group</title>',
+        '<style>.card > .price { color: red } /* <script> is not a tag here */</style>',
+        '<script>window.dataLayer = []; var tpl = "<div class=\'x\'></div>";</script>',
+        '<!-- <script type="application/ld+json">{"commented": true}</script> -->',
+        '<script type="application/ld+json">',
+        json.dumps(generate_dealer_schema(rng, vehicles=vehicles)),
+        '</script></head><body>'
+    ]
+
+    body = []
+    for i in range(cards):
+        body.append(
+            f'<div class="card" data-id="{i}"><a href="/inventory/{i}">'
+            f'<img src="/img/{i}.jpg" alt="{rng.choice(MAKES)} {rng.choice(MODELS)}"></a>'
+            f'<span class="price">${rng.randint(12000, 65000):,}</span>'
+            f'<ul><li>Mileage: {rng.randint(5, 120000)}</li><li>Stock #{i:05d}</li></ul></div>'
+        )
+
+    footer = [
+        "<script type='application/ld+json'>",
+        json.dumps({'@context': 'https://schema.org', '@type': 'BreadcrumbList', 'itemListElement': []}),
+        '</script><script src="/static/app.js"></script></body></html>'
+    ]
+
+    return ''.join(head + body + footer).encode('utf-8')
+
+# Markup that trips up shortcut parsers; checked for equivalence on top of the corpus
+EDGE_CASE_PAGES = [
+    # Tag manager injection after the document end
+    b'<html><body><p>Inventory</p></body></html>'
+    b'<script type="application/ld+json">{"@type": "AutoDealer", "name": "After"}</script>',
+    # Malformed template: a second document after the first
+    b'<html><head><script type="application/ld+json">{"@type": "AutoDealer"}</script></head></html>\n'
+    b'<html><body><script type="application/ld+json">{"@type": "Offer"}</script></body></html>',
+    # </html> inside a raw-text element
+    b'<html><script>var end = "</html>";</script>'
+    b'<script type="application/ld+json">{"name": "</html>"}</script></html>',
+]
+
+def load_corpus(corpus: Optional[str], pages: int, seed: int) -> List[bytes]:
+    """Load saved dealer pages (*.html) or fall back to generated ones"""
+    if corpus:
+        return [path.read_bytes() for path in sorted(Path(corpus).glob('*.html'))]
+
+    rng = random.Random(seed)
+    return [generate_dealer_page(rng) for _ in range(pages)]
+
+def time_per_call(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Best-of-N wall time for a single call, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_extract(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare the JSON-LD extractor against the BeautifulSoup DOM path"""
+    from bs4 import BeautifulSoup
+    from jsonld_extractor import extract_jsonld_blocks
+
+    def bs4_blocks(content: bytes) -> List[str]:
+        soup = BeautifulSoup(content, 'html.parser')
+        return [script.string for script in soup.find_all('script', {'type': 'application/ld+json'})]
+
+    corpus = load_corpus(args.corpus, args.pages, args.seed)
+    total_bytes = sum(len(page) for page in corpus)
+
+    # Equivalence: both paths must yield the same decoded JSON-LD for every page
+    mismatches = []
+    for index, page in enumerate(corpus + EDGE_CASE_PAGES):
+        expected = [json.loads(block) if block else None for block in bs4_blocks(page)]
+        actual = [json.loads(block) if block else None for block in extract_jsonld_blocks(page)]
+        if expected != actual:
+            mismatches.append(index)
+
+    bs4_time = time_per_call(lambda: [bs4_blocks(page) for page in corpus], args.repeat)
+    extractor_time = time_per_call(lambda: [extract_jsonld_blocks(page) for page in corpus], args.repeat)
+
+    return {
+        'pages': len(corpus),
+        'corpus_mb': round(total_bytes / 1e6, 2),
+        'equivalent': not mismatches,
+        'mismatched_pages': mismatches,
+        'bs4_mb_per_sec': round(total_bytes / 1e6 / bs4_time, 1),
+        'extractor_mb_per_sec': round(total_bytes / 1e6 / extractor_time, 1),
+        'speedup': round(bs4_time / extractor_time, 1)
+    }
+
+def legacy_count_authority_elements(schema_data: Any, elements: Dict[str, Any]):
+    """Original recursive counter, kept as the reference for equivalence checks"""
+    def traverse_schema(data):
+        if isinstance(data, dict):
+            if data.get('@type') == 'EducationalOccupationalCredential':
+                elements['certifications'] += 1
+            if data.get('@type') == 'Award' or 'award' in str(data).lower():
+                elements['awards'] += 1
+            if data.get('@type') == 'Person' and 'jobTitle' in data:
+                elements['expert_staff'] += 1
+            if 'aggregateRating' in data or 'review' in data:
+                elements['reviews'] += 1
+            if 'foundingDate' in data or 'yearsInBusiness' in data:
+                elements['experience_years'] = True
+            for value in data.values():
+                traverse_schema(value)
+        elif isinstance(data, list):
+            for item in data:
+                traverse_schema(item)
+
+    traverse_schema(schema_data)
+
+def empty_authority_elements() -> Dict[str, Any]:
+    return {'certifications': 0, 'awards': 0, 'expert_staff': 0, 'reviews': 0, 'experience_years': False}
+
+def bench_count(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare the rule engine against the recursive str()-based counter on large @graph schemas"""
+    from authority_rules import AuthorityRuleEngine
+
+    engine = AuthorityRuleEngine()
+    rng = random.Random(args.seed)
+    results: Dict[str, Any] = {'equivalent': True}
+
+    for vehicles in (100, 1000, 5000):
+        schema = generate_dealer_schema(rng, vehicles=vehicles, staff=vehicles // 10)
+
+        expected, actual = empty_authority_elements(), empty_authority_elements()
+        legacy_count_authority_elements(schema, expected)
+        engine.count(schema, actual)
+        results['equivalent'] = results['equivalent'] and expected == actual
+
+        legacy_time = time_per_call(lambda: legacy_count_authority_elements(schema, empty_authority_elements()), args.repeat)
+        engine_time = time_per_call(lambda: engine.count(schema, empty_authority_elements()), args.repeat)
+        results[f'{vehicles}_vehicles_legacy_ms'] = round(legacy_time * 1000, 1)
+        results[f'{vehicles}_vehicles_engine_ms'] = round(engine_time * 1000, 1)
+        results[f'{vehicles}_vehicles_speedup'] = round(legacy_time / engine_time, 1)
+
+    # Offer catalogs nested level by level (itemListElement -> itemOffered -> ...),
+    # where re-serializing every subtree makes the legacy counter quadratic
+    for depth in (100, 250):
+        nested: Dict[str, Any] = {'@type': 'Vehicle', 'name': 'leaf'}
+        for level in range(depth):
+            nested = {
+                '@type': 'OfferCatalog',
+                'name': f'Level {level}',
+                'itemListElement': [generate_dealer_schema(rng, vehicles=2, staff=1)['@graph'][1],
+                                    {'@type': 'Offer', 'itemOffered': nested}]
+            }
+
+        expected, actual = empty_authority_elements(), empty_authority_elements()
+        legacy_count_authority_elements(nested, expected)
+        engine.count(nested, actual)
+        results['equivalent'] = results['equivalent'] and expected == actual
+
+        legacy_time = time_per_call(lambda: legacy_count_authority_elements(nested, empty_authority_elements()), args.repeat)
+        engine_time = time_per_call(lambda: engine.count(nested, empty_authority_elements()), args.repeat)
+        results[f'depth_{depth}_legacy_ms'] = round(legacy_time * 1000, 1)
+        results[f'depth_{depth}_engine_ms'] = round(engine_time * 1000, 1)
+        results[f'depth_{depth}_speedup'] = round(legacy_time / engine_time, 1)
+
+    # Nesting far beyond the interpreter recursion limit
+    deep: Dict[str, Any] = {'@type': 'Award', 'name': 'leaf'}
+    for _ in range(sys.getrecursionlimit() * 10):
+        deep = {'@type': 'Thing', 'subjectOf': deep}
+    elements = empty_authority_elements()
+    engine.count(deep, elements)
+    results['deep_nesting_awards'] = elements['awards']
+
+    return results
+
+def bench_validate(args: argparse.Namespace) -> Dict[str, Any]:
+    """Measure Schema.org validation throughput in nodes per second"""
+    from schema_rules import SchemaValidator
+
+    validator = SchemaValidator()
+    rng = random.Random(args.seed)
+    documents = [generate_dealer_schema(rng, vehicles=200, staff=20) for _ in range(args.pages)]
+
+    nodes = sum(validator.validate(document)['nodes_validated'] for document in documents)
+    elapsed = time_per_call(lambda: [validator.validate(document) for document in documents], args.repeat)
+
+    return {
+        'documents': len(documents),
+        'nodes': nodes,
+        'nodes_per_sec': round(nodes / elapsed),
+        'documents_per_sec': round(len(documents) / elapsed, 1)
+    }
+
+def generate_vocabulary(rng: random.Random, types: int = 900, properties: int = 1500) -> Dict[str, Any]:
+    """Generate a Schema.org-shaped JSON-LD vocabulary with a multiple-inheritance class tree"""
+    graph: List[Dict[str, Any]] = [{'@id': 'schema:Thing', '@type': 'rdfs:Class'}]
+    for i in range(1, types):
+        parents = {rng.randrange(i) for _ in range(1 if rng.random() < 0.9 else 2)}
+        graph.append({
+            '@id': f'schema:Type{i}',
+            '@type': 'rdfs:Class',
+            'rdfs:subClassOf': [{'@id': 'schema:Thing' if p == 0 else f'schema:Type{p}'} for p in sorted(parents)]
+        })
+    for i in range(properties):
+        domains = {rng.randrange(types) for _ in range(rng.randint(1, 3))}
+        graph.append({
+            '@id': f'schema:property{i}',
+            '@type': 'rdf:Property',
+            'schema:domainIncludes': [{'@id': 'schema:Thing' if d == 0 else f'schema:Type{d}'} for d in sorted(domains)]
+        })
+    return {'@context': {'schema': 'https://schema.org/'}, '@graph': graph}
+
+def bench_vocabulary(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare opening the memory-mapped vocabulary index with parsing the JSON-LD vocabulary"""
+    from schema_vocabulary import SchemaVocabulary, build_vocabulary_index
+
+    rng = random.Random(args.seed)
+    vocabulary = generate_vocabulary(rng)
+    type_names = [node['@id'][7:] for node in vocabulary['@graph'] if node['@type'] == 'rdfs:Class']
+    property_names = [node['@id'][7:] for node in vocabulary['@graph'] if node['@type'] == 'rdf:Property']
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / 'vocabulary.jsonld'
+        source.write_text(json.dumps(vocabulary))
+        index_path = str(Path(directory) / 'vocabulary.idx')
+
+        build_seconds = time_per_call(lambda: build_vocabulary_index(str(source), index_path), args.repeat)
+        parse_seconds = time_per_call(lambda: json.loads(source.read_bytes()), args.repeat)
+        open_seconds = time_per_call(lambda: SchemaVocabulary(index_path).close(), args.repeat)
+
+        index = SchemaVocabulary(index_path)
+        pairs = [(rng.choice(type_names), rng.choice(type_names)) for _ in range(20000)]
+        domain_pairs = [(rng.choice(type_names), rng.choice(property_names)) for _ in range(20000)]
+        subclass_seconds = time_per_call(lambda: [index.is_subclass_of(a, b) for a, b in pairs], args.repeat)
+        domain_seconds = time_per_call(lambda: [index.is_valid_property(t, p) for t, p in domain_pairs], args.repeat)
+        vocabulary_bytes = source.stat().st_size
+        index_bytes = Path(index_path).stat().st_size
+        index.close()
+
+    return {
+        'types': len(type_names),
+        'properties': len(property_names),
+        'vocabulary_bytes': vocabulary_bytes,
+        'index_bytes': index_bytes,
+        'build_ms': round(build_seconds * 1000, 1),
+        'json_parse_ms': round(parse_seconds * 1000, 2),
+        'index_open_ms': round(open_seconds * 1000, 3),
+        'subclass_lookups_per_sec': round(len(pairs) / subclass_seconds),
+        'domain_lookups_per_sec': round(len(domain_pairs) / domain_seconds)
+    }
+
+def bench_scoring(args: argparse.Namespace) -> Dict[str, Any]:
+    """Score 100k dealers with the batch scorer and check every result against the scalar path"""
+    from authority_validation import AuthorityValidator
+    from batch_scoring import calculate_authority_scores, score_columns
+
+    rng = random.Random(args.seed)
+    dealers = 100_000
+    results = []
+    for _ in range(dealers):
+        pages = rng.choice([0, rng.randint(1, 40)])
+        results.append({
+            'pages_validated': pages,
+            'valid_schemas': rng.randint(0, pages * 3),
+            'authority_elements': {
+                'certifications': rng.randint(0, 12),
+                'awards': rng.randint(0, 8),
+                'expert_staff': rng.randint(0, 15),
+                'reviews': rng.randint(0, 3),
+                'experience_years': rng.random() < 0.6
+            }
+        })
+
+    columns = score_columns(results)
+    batch_seconds = time_per_call(lambda: calculate_authority_scores(columns), args.repeat)
+
+    validator = AuthorityValidator('https://example.com')
+    start = time.perf_counter()
+    scalar = [validator.calculate_authority_score(result) for result in results]
+    scalar_seconds = time.perf_counter() - start
+    validator.session.close()
+
+    batch = calculate_authority_scores(columns)
+    equivalent = (
+        batch['final_score'].tolist() == [score['final_score'] for score in scalar]
+        and batch['improvement'].tolist() == [score['improvement'] for score in scalar]
+        and all(
+            batch['components'][component].tolist() == [score['components'][component] for score in scalar]
+            for component in batch['weights']
+        )
+    )
+
+    return {
+        'dealers': dealers,
+        'batch_ms': round(batch_seconds * 1000, 2),
+        'scalar_ms': round(scalar_seconds * 1000, 1),
+        'speedup': round(scalar_seconds / batch_seconds, 1),
+        'equivalent': equivalent
+    }
+
+def generate_site_corpus(rng: random.Random, paths: List[str], page_kb: int, vehicles: int) -> Dict[str, bytes]:
+    """Generate one page per path, padded with inventory cards to roughly ``page_kb`` kilobytes"""
+    base_size = len(generate_dealer_page(random.Random(0), vehicles=vehicles, cards=0))
+    card_size = (len(generate_dealer_page(random.Random(0), vehicles=vehicles, cards=100)) - base_size) / 100
+    cards = max(0, int((page_kb * 1024 - base_size) / card_size))
+    return {path: generate_dealer_page(rng, vehicles=vehicles, cards=cards) for path in paths}
+
+def serve_dealer_site(port_queue: Any, seed: int, page_kb: int, vehicles: int, latency_ms: float):
+    """Serve a generated dealer site on an ephemeral port until terminated (runs in a child process)"""
+    from authority_validation import PAGES_TO_CHECK
+
+    corpus = generate_site_corpus(random.Random(seed), PAGES_TO_CHECK, page_kb, vehicles)
+
+    class DealerSiteHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            body = corpus.get(self.path.split('?', 1)[0])
+            self.send_response(200 if body is not None else 404)
+            body = body if body is not None else b'Not found'
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DealerSiteHandler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+def latency_summary(prefix: str, latencies: List[float], elapsed: float, unit: str = 'pages') -> Dict[str, Any]:
+    """Throughput and p50/p99 latency in milliseconds for one suite stage"""
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return {
+        f'{prefix}_{unit}_per_sec': round(len(ordered) / elapsed, 1),
+        f'{prefix}_p50_ms': round(statistics.median(ordered) * 1000, 3),
+        f'{prefix}_p99_ms': round(p99 * 1000, 3)
+    }
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is bytes on macOS, kilobytes elsewhere)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def current_commit() -> str:
+    """Short commit id of the working tree, marked -dirty when tracked files are modified"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'diff', '--quiet', 'HEAD'], capture_output=True).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{commit}-dirty' if dirty else commit
+
+def compare_suite_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> List[str]:
+    """Print per-metric changes against a baseline run and return the metrics that regressed"""
+    regressions = []
+    print(f"\n📊 Compared with {baseline['commit']} ({baseline['timestamp']})")
+    for key, value in current.items():
+        previous = baseline['results'].get(key)
+        if not isinstance(value, (int, float)) or not isinstance(previous, (int, float)) or not previous:
+            continue
+        change = (value - previous) / previous
+        # Throughput should go up; latency and memory should go down
+        worse = -change if key.endswith('_per_sec') else change
+        marker = '⚠️ ' if worse > threshold else '  '
+        if worse > threshold:
+            regressions.append(key)
+        print(f"{marker}{key}: {previous} -> {value} ({change:+.1%})")
+    return regressions
+
+def bench_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    End-to-end validator throughput against a local stand-in dealer site.
+
+    The site is served from a child process so its memory and CPU stay out of
+    the measurements. Results are saved per commit under ``--results-dir`` and
+    can be compared with an earlier run via ``--compare``.
+    """
+    from authority_validation import PAGES_TO_CHECK, AuthorityValidator
+    from jsonld_extractor import extract_jsonld_blocks
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve_dealer_site,
+        args=(port_queue, args.seed, args.page_kb, args.jsonld_vehicles, args.latency_ms),
+        daemon=True
+    )
+    server.start()
+
+    try:
+        base_url = f'http://127.0.0.1:{port_queue.get(timeout=60)}'
+        results: Dict[str, Any] = {}
+        page_latencies: List[float] = []
+
+        def timed_validator() -> AuthorityValidator:
+            validator = AuthorityValidator(base_url, request_delay=0)
+            validate_page = validator._validate_page
+
+            def timed_validate_page(page: str) -> Dict[str, Any]:
+                start = time.perf_counter()
+                try:
+                    return validate_page(page)
+                finally:
+                    page_latencies.append(time.perf_counter() - start)
+
+            validator._validate_page = timed_validate_page
+            return validator
+
+        # Sequential validation, one site after another
+        validation_results = []
+        start = time.perf_counter()
+        for _ in range(args.sites):
+            validator = timed_validator()
+            validation_results.append(validator.validate_schema_markup())
+            validator.session.close()
+        results.update(latency_summary('validate', page_latencies, time.perf_counter() - start))
+        results['pages_per_stage'] = len(page_latencies)
+
+        # Concurrent validation with the politeness limits lifted
+        page_latencies.clear()
+        start = time.perf_counter()
+        for _ in range(args.sites):
+            validator = timed_validator()
+            asyncio.run(validator.validate_schema_markup_async(
+                max_concurrency_per_host=8, requests_per_second=1e6, burst=1e6
+            ))
+            validator.session.close()
+        results.update(latency_summary('validate_async', page_latencies, time.perf_counter() - start))
+
+        # Schema errors are expected in the generated pages; failed fetches are not
+        fetch_errors = [error for result in validation_results for error in result['errors']
+                        if error.startswith('Error validating')]
+        if fetch_errors:
+            print(f"⚠️  {len(fetch_errors)} pages failed, first: {fetch_errors[0]}")
+
+        # Authority element counting over every served JSON-LD document
+        corpus = generate_site_corpus(random.Random(args.seed), PAGES_TO_CHECK, args.page_kb, args.jsonld_vehicles)
+        documents = [json.loads(block) for page in corpus.values() for block in extract_jsonld_blocks(page)]
+        validator = AuthorityValidator(base_url)
+        count_latencies = []
+        start = time.perf_counter()
+        for _ in range(args.repeat * 20):
+            for document in documents:
+                call_start = time.perf_counter()
+                validator._count_authority_elements(document, validator._new_results()['authority_elements'])
+                count_latencies.append(time.perf_counter() - call_start)
+        results.update(latency_summary('count', count_latencies, time.perf_counter() - start, unit='documents'))
+
+        # Scoring of the validation results collected above
+        score_latencies = []
+        start = time.perf_counter()
+        for _ in range(max(1, 10_000 // len(validation_results))):
+            for validation_result in validation_results:
+                call_start = time.perf_counter()
+                validator.calculate_authority_score(validation_result)
+                score_latencies.append(time.perf_counter() - call_start)
+        results.update(latency_summary('score', score_latencies, time.perf_counter() - start, unit='calls'))
+        validator.session.close()
+
+        results['peak_rss_mb'] = peak_rss_mb()
+    finally:
+        server.terminate()
+        server.join()
+
+    run = {
+        'commit': current_commit(),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'config': {
+            'sites': args.sites,
+            'latency_ms': args.latency_ms,
+            'page_kb': args.page_kb,
+            'jsonld_vehicles': args.jsonld_vehicles,
+            'seed': args.seed
+        },
+        'results': results
+    }
+
+    results_dir = Path(args.results_dir)
+    if args.compare:
+        baseline_path = Path(args.compare)
+        if not baseline_path.exists():
+            baseline_path = results_dir / f'{args.compare}.json'
+        baseline = json.loads(baseline_path.read_text())
+        if baseline['config'] != run['config']:
+            print(f"⚠️  Baseline was run with a different configuration: {baseline['config']}")
+        results['regressions'] = compare_suite_results(results, baseline)
+
+    if not args.no_save:
+        results_dir.mkdir(parents=True, exist_ok=True)
+        saved_path = results_dir / f"{run['commit']}.json"
+        saved_path.write_text(json.dumps(run, indent=2) + '\n')
+        results['saved_to'] = str(saved_path)
+
+    return results
+
+def naive_mentions(roster: Dict[str, List[str]], text: str) -> Dict[str, int]:
+    """Per-alias search baseline: first ranking position of every dealer mentioned in ``text``"""
+    from mention_extractor import LIST_ITEM
+
+    found: Dict[str, int] = {}
+    position = 0
+    for line in text.splitlines():
+        is_item = LIST_ITEM.match(line) is not None
+        position += is_item
+        lowered = line.lower()
+        for dealer_id, aliases in roster.items():
+            if dealer_id in found:
+                continue
+            for alias in aliases:
+                start = lowered.find(alias)
+                while start >= 0:
+                    end = start + len(alias)
+                    if (start == 0 or not lowered[start - 1].isalnum()) and \
+                            (end == len(lowered) or not lowered[end].isalnum()):
+                        found[dealer_id] = position if is_item else 1
+                        break
+                    start = lowered.find(alias, start + 1)
+                if dealer_id in found:
+                    break
+    return found
+
+def bench_mentions(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare the roster automaton against one search per dealer alias"""
+    from mention_extractor import MentionExtractor
+
+    rng = random.Random(args.seed)
+    roster = {}
+    for i in range(2000):
+        name = f'{rng.choice(MAKES)} of Town {i}'
+        roster[name] = [name.lower(), f'town {i} {rng.choice(MAKES).lower()} motors', f'dealer{i}.example.com']
+
+    names = list(roster)
+    answers = []
+    for _ in range(args.pages * 4):
+        listed = rng.sample(names, 8)
+        lines = ['Here are some highly rated options near you:']
+        lines += [f'{n}. {name} - ASE-certified technicians, award-winning service' for n, name in enumerate(listed, 1)]
+        lines.append(f'You can also browse {rng.choice(roster[rng.choice(names)])} for current inventory.')
+        answers.append('\n'.join(lines))
+
+    extractor = MentionExtractor(roster, memo_size=0)
+    build_seconds = time_per_call(lambda: MentionExtractor(roster), 1)
+    automaton_seconds = time_per_call(lambda: [extractor.extract(answer) for answer in answers], args.repeat)
+    naive_seconds = time_per_call(lambda: [naive_mentions(roster, answer) for answer in answers], 1)
+
+    equivalent = all(
+        {dealer: mention['position'] for dealer, mention in extractor.extract(answer).items()}
+        == naive_mentions(roster, answer)
+        for answer in answers
+    )
+
+    # Incremental roster change: swap 1% of dealers (additions relink the whole trie)
+    changed = dict(roster)
+    for name in names[:20]:
+        del changed[name]
+        changed[name + ' Plus'] = [name.lower() + ' plus']
+    start = time.perf_counter()
+    extractor.update_roster(changed)
+    extractor.extract(answers[0])
+    update_seconds = time.perf_counter() - start
+
+    # Removals alone only recompute output links
+    for name in names[20:40]:
+        del changed[name]
+    start = time.perf_counter()
+    extractor.update_roster(changed)
+    extractor.extract(answers[0])
+    removal_seconds = time.perf_counter() - start
+
+    return {
+        'dealers': len(roster),
+        'aliases': sum(len(aliases) for aliases in roster.values()),
+        'answers': len(answers),
+        'build_ms': round(build_seconds * 1000, 1),
+        'incremental_update_ms': round(update_seconds * 1000, 1),
+        'removal_update_ms': round(removal_seconds * 1000, 1),
+        'automaton_answers_per_sec': round(len(answers) / automaton_seconds),
+        'per_alias_answers_per_sec': round(len(answers) / naive_seconds),
+        'speedup': round(naive_seconds / automaton_seconds, 1),
+        'equivalent': equivalent
+    }
+
+def bench_results(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare a 90-day visibility trend query on the results store against rescanning NDJSON reports"""
+    from results_store import DAY_SECONDS, ResultsStore
+
+    rng = random.Random(args.seed)
+    platforms = ['ChatGPT', 'Perplexity', 'Gemini']
+    dealers = [f'Dealer {i}' for i in range(args.pages * 4)]
+    queries = [f'Test query {i}' for i in range(10)]
+    history_days = 180
+    now = time.time()
+
+    def dealer_record(dealer: str) -> Dict[str, Any]:
+        results = []
+        for platform in platforms:
+            for query in queries:
+                mentioned = rng.random() < 0.4
+                results.append({
+                    'platform': platform, 'query': query, 'status': 'success', 'mentioned': mentioned,
+                    'ranking_position': rng.randint(1, 8) if mentioned else None,
+                    'authority_signals': rng.randint(0, 3) if mentioned else 0
+                })
+        return {'dealership': dealer, 'query_results': results}
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultsStore(str(Path(directory) / 'results.db'))
+        reports = Path(directory) / 'reports'
+        reports.mkdir()
+
+        append_seconds = 0.0
+        rows = 0
+        report_times = {}
+        for day in range(history_days):
+            recorded_at = now - (history_days - day) * DAY_SECONDS + 60
+            report_times[reports / f'day{day:03d}.ndjson'] = recorded_at
+            with open(reports / f'day{day:03d}.ndjson', 'w') as report:
+                for dealer in dealers:
+                    record = dealer_record(dealer)
+                    report.write(json.dumps({'record_type': 'dealer_platform_visibility', **record}) + '\n')
+                    start = time.perf_counter()
+                    rows += store.append_platform_results(dealer, record['query_results'], recorded_at=recorded_at)
+                    append_seconds += time.perf_counter() - start
+
+        def rescan_reports() -> Dict[tuple, List[int]]:
+            # What a trend query costs today: load every report in the window and walk the records
+            since_day = int((now - 90 * DAY_SECONDS) // DAY_SECONDS)
+            totals: Dict[tuple, List[int]] = {}
+            for path, recorded_at in report_times.items():
+                if recorded_at // DAY_SECONDS < since_day:
+                    continue
+                date = time.strftime('%Y-%m-%d', time.gmtime(recorded_at))
+                with open(path) as report:
+                    for line in report:
+                        for result in json.loads(line)['query_results']:
+                            total = totals.setdefault((result['platform'], date), [0, 0])
+                            total[0] += 1
+                            total[1] += result['mentioned']
+            return totals
+
+        store_seconds = time_per_call(lambda: store.visibility_by_platform(90, now=now), args.repeat)
+        dealer_seconds = time_per_call(lambda: store.visibility_by_platform(90, dealer=dealers[0], now=now), args.repeat)
+        rescan_seconds = time_per_call(rescan_reports, 1)
+
+        trend = store.visibility_by_platform(90, now=now)
+        totals = rescan_reports()
+        equivalent = {
+            (platform, date): (queries, rate)
+            for platform, date, queries, rate in zip(trend['platform'], trend['date'], trend['queries'], trend['mention_rate'])
+        } == {key: (total[0], round(total[1] / total[0], 3)) for key, total in totals.items()}
+        store.close()
+
+    return {
+        'rows': rows,
+        'append_rows_per_sec': round(rows / append_seconds),
+        'trend_query_ms': round(store_seconds * 1000, 1),
+        'dealer_trend_query_ms': round(dealer_seconds * 1000, 2),
+        'report_rescan_ms': round(rescan_seconds * 1000, 1),
+        'speedup': round(rescan_seconds / store_seconds, 1),
+        'equivalent': equivalent
+    }
+
+def legacy_signal_summary(dealer_results: List[Dict[str, Dict[str, Dict[str, bool]]]],
+                          platforms: List[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Fleet recognition summary with the per-platform generator sums the tester used before the matrix"""
+    summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for authority_tests in dealer_results:
+        for category, signals in authority_tests.items():
+            category_summary = summary.setdefault(category, {})
+            for platform in platforms:
+                counts = category_summary.setdefault(platform, {'recognized_count': 0, 'total_signals': 0})
+                counts['recognized_count'] += sum(1 for signal_data in signals.values() if signal_data.get(platform, False))
+                counts['total_signals'] += len(signals)
+    for category_summary in summary.values():
+        for counts in category_summary.values():
+            counts['recognition_rate'] = counts['recognized_count'] / counts['total_signals']
+    return summary
+
+def bench_signals(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare the packed signal recognition matrix against nested dicts of booleans"""
+    from ai_platform_tester import PLATFORMS, SIMULATED_SIGNAL_RECOGNITION
+    from signal_matrix import SignalRecognitionMatrix
+
+    rng = random.Random(args.seed)
+    dealers = args.pages * 200
+
+    tracemalloc.start()
+    dealer_results = [
+        {
+            category: {
+                signal: {platform: rng.random() < 0.6 for platform in PLATFORMS}
+                for signal in signals
+            }
+            for category, signals in SIMULATED_SIGNAL_RECOGNITION.items()
+        }
+        for _ in range(dealers)
+    ]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    matrix = SignalRecognitionMatrix(PLATFORMS)
+    for i, authority_tests in enumerate(dealer_results):
+        matrix.add_results(f'Dealer {i}', authority_tests)
+    matrix_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    matrix_seconds = time_per_call(matrix.platform_summary, args.repeat)
+    dict_seconds = time_per_call(lambda: legacy_signal_summary(dealer_results, PLATFORMS), 1)
+
+    return {
+        'dealers': dealers,
+        'rows': matrix.row_count,
+        'dict_mb': round(dict_bytes / 1e6, 1),
+        'matrix_mb': round(matrix_bytes / 1e6, 2),
+        'matrix_summary_ms': round(matrix_seconds * 1000, 2),
+        'dict_summary_ms': round(dict_seconds * 1000, 1),
+        'speedup': round(dict_seconds / matrix_seconds, 1),
+        'equivalent': matrix.platform_summary() == legacy_signal_summary(dealer_results, PLATFORMS)
+                      and matrix.detailed_results('Dealer 7') == dealer_results[7]
+    }
+
+def bench_sampling(args: argparse.Namespace) -> Dict[str, Any]:
+    """Compare adaptive query sampling against running every query, across dealers with varied mention rates"""
+    from ai_platform_tester import STANDIN_COMPETITORS, AIPlatformTester
+    from answer_cache import AnswerCache
+    from session_management_system import LocalComputerUseBackend, SessionManager
+
+    rng = random.Random(args.seed)
+    full_calls = adaptive_calls = 0
+    covered = estimates = 0
+    errors = []
+    mid_full_calls = mid_adaptive_calls = 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        def run_dealer(i: int, mention_rate: float, answer_cache: Optional[AnswerCache] = None) -> tuple:
+            tester = AIPlatformTester(f'Dealer {i}', 'Springfield, IL')
+            backend = LocalComputerUseBackend([tester.dealership_name] + STANDIN_COMPETITORS, latency=0,
+                                              mention_rate=mention_rate, seed=i)
+            session_manager = SessionManager(str(Path(directory) / f'sessions{i}'), backend=backend)
+
+            async def run_both() -> tuple:
+                # One event loop per session manager
+                return (await tester.run_platform_tests(session_manager),
+                        await tester.run_adaptive_platform_tests(session_manager, answer_cache=answer_cache))
+
+            return asyncio.run(run_both())
+
+        for i in range(args.sites):
+            full, adaptive = run_dealer(i, rng.random())
+            full_calls += full['query_stats']['platform_calls']
+            adaptive_calls += adaptive['sampling']['platform_calls']
+
+            for platform, result in adaptive['improved'].items():
+                if not result['queries_run']:
+                    continue
+                low, high = result['query_success_interval']
+                full_rate = full['improved'][platform]['query_success_rate']
+                estimates += 1
+                covered += low <= full_rate <= high
+                errors.append(abs(result['query_success_rate'] - full_rate))
+
+        # Typical dealers, mentioned in about 60% of answers: the default stopping rule must save a quarter of calls
+        for i in range(args.sites, args.sites + 10):
+            full, adaptive = run_dealer(i, 0.6)
+            mid_full_calls += full['query_stats']['platform_calls']
+            mid_adaptive_calls += adaptive['sampling']['platform_calls']
+
+        # A rerun answered from the answer cache makes no platform calls
+        answer_cache = AnswerCache(str(Path(directory) / 'answers.db'))
+        try:
+            run_dealer(0, 0.6, answer_cache)
+            _, cached = run_dealer(0, 0.6, answer_cache)
+        finally:
+            answer_cache.close()
+
+    return {
+        'dealers': args.sites,
+        'platform_calls_full': full_calls,
+        'platform_calls_adaptive': adaptive_calls,
+        'calls_saved_pct': round(100 * (full_calls - adaptive_calls) / full_calls, 1),
+        'mean_abs_rate_error': round(statistics.mean(errors), 3),
+        'full_rate_within_interval_pct': round(100 * covered / estimates, 1),
+        'mid_rate_calls_saved_pct': round(100 * (mid_full_calls - mid_adaptive_calls) / mid_full_calls, 1),
+        'cached_rerun_platform_calls': cached['sampling']['platform_calls'],
+        'cached_rerun_cache_hits': cached['sampling']['cache_hits'],
+        'equivalent': mid_adaptive_calls <= 0.75 * mid_full_calls and cached['sampling']['platform_calls'] == 0
+                      and cached['sampling']['platform_calls_saved'] == cached['sampling']['platform_calls_full']
+    }
+
+def bench_sessions(args: argparse.Namespace) -> Dict[str, Any]:
+    """Hot SessionManager.get_session latency: cached session health, then write-behind persistence"""
+    import ai_platform_tester  # noqa: F401 - puts lib/ on sys.path
+    from session_management_system import LocalComputerUseBackend, SessionData, SessionManager
+
+    # Every Computer Use action costs one backend round trip
+    backend = LocalComputerUseBackend(['Premier Auto Group'], latency=(args.latency_ms or 50) / 1000)
+    calls = args.repeat * 10
+
+    def hot_session_manager(storage_path: Path, **options: Any) -> SessionManager:
+        # One session whose hourly quota the hot loop cannot use up
+        session_manager = SessionManager(str(storage_path), backend=backend, pool_sizes={'gemini': 1}, **options)
+        session_manager.platform_configs['gemini']['max_requests_per_hour'] = calls * 100
+        return session_manager
+
+    async def hot_latencies(session_manager: SessionManager, calls: int) -> List[float]:
+        async with session_manager:
+            await session_manager.get_session('gemini')
+            latencies = []
+            for _ in range(calls):
+                start = time.perf_counter()
+                await session_manager.get_session('gemini')
+                latencies.append(time.perf_counter() - start)
+        return latencies
+
+    with tempfile.TemporaryDirectory() as directory:
+        uncached = asyncio.run(hot_latencies(
+            hot_session_manager(Path(directory) / 'uncached', health_ttl=0, persist_interval=0), calls
+        ))
+
+        # Persist overhead per request: write-through on every request vs coalesced write-behind
+        write_through = hot_session_manager(Path(directory) / 'write_through', persist_interval=0)
+        write_through_latencies = asyncio.run(hot_latencies(write_through, calls * 20))
+        write_behind = hot_session_manager(Path(directory) / 'write_behind')
+        write_behind_latencies = asyncio.run(hot_latencies(write_behind, calls * 20))
+
+        # Restore after a restart, with many older session files for the platform on disk
+        store = Path(directory) / 'write_behind'
+        latest = max(store.glob('gemini_*.pkl'), key=lambda p: p.stat().st_mtime)
+        payload = latest.read_bytes()
+        for i in range(args.pages * 40):
+            old_file = store / f'gemini_{i:08d}_old.pkl'
+            old_file.write_bytes(payload)
+            os.utime(old_file, (1e9 + i, 1e9 + i))
+
+        restarted = SessionManager(str(store), backend=backend)
+
+        def load_session(session_file: Path) -> SessionData:
+            return SessionData(**pickle.loads(session_file.read_bytes()))
+
+        # Both sides find the latest file and load it the same way; only the lookup differs
+        scan_times, manifest_times = [], []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            scanned = restarted._scan_latest_session_file('gemini')
+            scanned_session = load_session(scanned)
+            scan_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            manifest_session = load_session(store / restarted._read_manifest()['gemini']['file'])
+            manifest_times.append(time.perf_counter() - start)
+        restored = asyncio.run(restarted._restore_session('gemini'))
+
+    requests = calls * 20 + 1
+    return {
+        'backend_latency_ms': (args.latency_ms or 50),
+        'uncached_health_p50_us': round(statistics.median(uncached) * 1e6),
+        'write_through_p50_us': round(statistics.median(write_through_latencies) * 1e6),
+        'write_behind_p50_us': round(statistics.median(write_behind_latencies) * 1e6),
+        'write_through_writes_per_request': round(write_through.persist_stats['writes'] / requests, 3),
+        'write_behind_writes_per_request': round(write_behind.persist_stats['writes'] / requests, 3),
+        'speedup': round(statistics.median(uncached) / statistics.median(write_behind_latencies), 1),
+        'stored_session_files': args.pages * 40 + 1,
+        'restore_scan_ms': round(min(scan_times) * 1000, 2),
+        'restore_manifest_ms': round(min(manifest_times) * 1000, 2),
+        'equivalent': scanned == latest and restored is not None
+                      and scanned_session.session_id == manifest_session.session_id == restored.session_id
+                      == pickle.loads(payload)['session_id']
+    }
+
+def bench_pools(args: argparse.Namespace) -> Dict[str, Any]:
+    """Per-platform query throughput with 1, 2, 4 and 8 pooled sessions"""
+    import ai_platform_tester  # noqa: F401 - puts lib/ on sys.path
+    from session_management_system import LocalComputerUseBackend, SessionManager
+
+    backend = LocalComputerUseBackend(['Premier Auto Group', 'City Motors', 'Valley Ford'],
+                                      latency=(args.latency_ms or 50) / 1000)
+    queries = [f'best car dealer query {i}' for i in range(args.sites * 4)]
+
+    async def throughput(session_manager: SessionManager, pool_size: int) -> Tuple[float, int]:
+        async with session_manager:
+            # Fill the pool first, so only steady-state checkouts are timed
+            sessions = [await session_manager.checkout_session('gemini') for _ in range(pool_size)]
+            for session in sessions:
+                session_manager.checkin_session(session)
+            start = time.perf_counter()
+            responses = await asyncio.gather(*(session_manager.execute_query('gemini', query) for query in queries))
+            elapsed = time.perf_counter() - start
+        return len(queries) / elapsed, len({response['session_id'] for response in responses})
+
+    results: Dict[str, Any] = {'queries': len(queries), 'backend_latency_ms': args.latency_ms or 50}
+    with tempfile.TemporaryDirectory() as directory:
+        for pool_size in (1, 2, 4, 8):
+            session_manager = SessionManager(str(Path(directory) / f'pool{pool_size}'), backend=backend,
+                                             pool_sizes={'gemini': pool_size})
+            queries_per_second, sessions_used = asyncio.run(throughput(session_manager, pool_size))
+            results[f'pool_{pool_size}_queries_per_sec'] = round(queries_per_second, 1)
+            results[f'pool_{pool_size}_sessions_used'] = sessions_used
+
+    results['scaling_1_to_8'] = round(results['pool_8_queries_per_sec'] / results['pool_1_queries_per_sec'], 2)
+    return results
+
+def hammer_rate_limiter(path: str, attempts: int, limit: int) -> Tuple[int, List[float]]:
+    """Worker process: try ``attempts`` requests against one session's quota"""
+    import ai_platform_tester  # noqa: F401 - puts lib/ on sys.path
+    from rate_limiter import RateLimiter
+
+    rate_limiter = RateLimiter(path)
+    granted, latencies = 0, []
+    for _ in range(attempts):
+        start = time.perf_counter()
+        granted += rate_limiter.acquire('gemini/shared-session', limit)['allowed']
+        latencies.append(time.perf_counter() - start)
+    rate_limiter.close()
+    return granted, latencies
+
+def bench_ratelimit(args: argparse.Namespace) -> Dict[str, Any]:
+    """Requests granted to one session by several worker processes: per-process counters vs the shared limiter"""
+    workers, limit = 4, 100
+    attempts = limit
+
+    # Per-process counting (the old request_count) lets every worker spend the whole quota
+    per_process_granted = workers * min(attempts, limit)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / 'rate_limits.db')
+        with multiprocessing.Pool(workers) as pool:
+            outcomes = pool.starmap(hammer_rate_limiter, [(path, attempts, limit)] * workers)
+
+    latencies = [latency for _, worker_latencies in outcomes for latency in worker_latencies]
+    granted = sum(worker_granted for worker_granted, _ in outcomes)
+    return {
+        'workers': workers,
+        'hourly_limit': limit,
+        'attempts': workers * attempts,
+        'per_process_granted': per_process_granted,
+        'shared_granted': granted,
+        'acquire_p50_us': round(statistics.median(latencies) * 1e6),
+        'acquire_p99_us': round(sorted(latencies)[int(len(latencies) * 0.99)] * 1e6),
+        'equivalent': granted == limit
+    }
+
+def bench_shared(args: argparse.Namespace) -> Dict[str, Any]:
+    """Session initializations and worker start-up when workers hand off sessions through a shared store"""
+    import ai_platform_tester  # noqa: F401 - puts lib/ on sys.path
+    from session_management_system import LocalComputerUseBackend, SessionManager
+    from session_store import LocalRespServer, RedisSessionStore, SQLiteSessionStore
+
+    latency = (args.latency_ms or 50) / 1000
+
+    class SlowInitBackend(LocalComputerUseBackend):
+        """Session initialization (navigation, banners, auth) costs ten ordinary actions"""
+        initializations = 0
+
+        async def execute(self, prompt: str, action: Dict[str, Any]) -> Dict:
+            if action.get('type') == 'initialize':
+                SlowInitBackend.initializations += 1
+                await asyncio.sleep(latency * 9)
+            return await super().execute(prompt, action)
+
+    backend = SlowInitBackend(['Premier Auto Group', 'City Motors', 'Valley Ford'], latency=latency)
+    workers, pool_size = 4, 2
+
+    async def run_worker(storage_path: Path, session_store: Any) -> float:
+        session_manager = SessionManager(str(storage_path), backend=backend, pool_sizes={'gemini': pool_size},
+                                         session_store=session_store)
+        async with session_manager:
+            start = time.perf_counter()
+            await asyncio.gather(*(session_manager.execute_query('gemini', f'query {i}') for i in range(pool_size)))
+            return time.perf_counter() - start
+
+    def run_workers(directory: Path, name: str, make_store: Callable[[], Any]) -> Tuple[int, List[float]]:
+        # Workers on separate nodes (own session directories) start one after another
+        SlowInitBackend.initializations = 0
+        startups = [asyncio.run(run_worker(directory / f'{name}_worker{i}', make_store())) for i in range(workers)]
+        return SlowInitBackend.initializations, startups
+
+    results: Dict[str, Any] = {'workers': workers, 'pool_size': pool_size, 'backend_latency_ms': latency * 1000}
+    with tempfile.TemporaryDirectory() as directory:
+        with LocalRespServer() as server:
+            stores = {
+                'none': lambda: None,
+                'sqlite': lambda: SQLiteSessionStore(str(Path(directory) / 'sessions.db')),
+                'redis': lambda: RedisSessionStore(server.host, server.port)
+            }
+            for name, make_store in stores.items():
+                initializations, startups = run_workers(Path(directory), name, make_store)
+                results[f'{name}_initializations'] = initializations
+                results[f'{name}_later_worker_startup_ms'] = round(statistics.mean(startups[1:]) * 1000, 1)
+
+    results['equivalent'] = results['sqlite_initializations'] == results['redis_initializations'] == pool_size
+    return results
+
+BENCHMARKS = {
+    'extract': bench_extract,
+    'mentions': bench_mentions,
+    'pools': bench_pools,
+    'ratelimit': bench_ratelimit,
+    'results': bench_results,
+    'count': bench_count,
+    'sampling': bench_sampling,
+    'scoring': bench_scoring,
+    'sessions': bench_sessions,
+    'shared': bench_shared,
+    'signals': bench_signals,
+    'suite': bench_suite,
+    'validate': bench_validate,
+    'vocabulary': bench_vocabulary
+}
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Authority validation benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS), help="Benchmark to run")
+    parser.add_argument('--corpus', help="Directory of saved dealer pages (*.html)")
+    parser.add_argument('--pages', type=int, default=50, help="Generated pages when no corpus is given")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetitions (best time is reported)")
+    parser.add_argument('--seed', type=int, default=2025)
+
+    suite = parser.add_argument_group('suite', "Options for the end-to-end validator suite")
+    suite.add_argument('--sites', type=int, default=20, help="Site validations per stage")
+    suite.add_argument('--latency-ms', type=float, default=0, help="Stand-in server latency per request")
+    suite.add_argument('--page-kb', type=int, default=120, help="Approximate size of each served page")
+    suite.add_argument('--jsonld-vehicles', type=int, default=50, help="Vehicle nodes in each page's JSON-LD")
+    suite.add_argument('--results-dir', default='reports/benchmarks', help="Where suite results are saved per commit")
+    suite.add_argument('--compare', help="Baseline to compare against: a commit id in --results-dir or a results file")
+    suite.add_argument('--no-save', action='store_true', help="Do not save this run's results")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    results = BENCHMARKS[args.benchmark](args)
+
+    print("\n" + "="*60)
+    print(f"⏱️  BENCHMARK: {args.benchmark}")
+    print("="*60)
+    for key, value in results.items():
+        print(f"{key}: {value}")
+    print("="*60)
+
+    if results.get('equivalent') is False:
+        sys.exit(1)
+
+    return results
+
+if __name__ == "__main__":
+    main()
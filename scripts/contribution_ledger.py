@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Page Contribution Ledger
+Per-page JSON-LD fingerprints and contribution records for incremental revalidation
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+COUNTED_FIELDS = ('pages_validated', 'schema_found', 'valid_schemas', 'schema_warnings')
+COUNTED_ELEMENTS = ('certifications', 'awards', 'expert_staff', 'reviews')
+
+def schema_fingerprint(blocks: List[str], salt: str = '') -> str:
+    """Fingerprint of a page's JSON-LD blocks, independent of the surrounding HTML"""
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    for block in blocks:
+        digest.update(block.encode('utf-8', errors='replace'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def empty_aggregate() -> Dict[str, int]:
+    aggregate = {field: 0 for field in COUNTED_FIELDS + COUNTED_ELEMENTS}
+    # experience_years is a flag, so keep the number of pages that set it
+    aggregate['experience_years_pages'] = 0
+    return aggregate
+
+class ContributionLedger:
+    """
+    Persistent per-page contribution records for each site.
+
+    Every page's validation record is stored with the fingerprint of its
+    JSON-LD. On the next run a page whose fingerprint is unchanged reuses its
+    record without being recounted, and the site aggregate is updated by
+    subtracting the old contribution and adding the new one for changed pages
+    only.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS page_contributions (
+                site TEXT NOT NULL,
+                page TEXT NOT NULL,
+                fingerprint TEXT,
+                record TEXT NOT NULL,
+                PRIMARY KEY (site, page)
+            );
+            CREATE TABLE IF NOT EXISTS site_aggregates (
+                site TEXT PRIMARY KEY,
+                aggregate TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        ''')
+
+    def unchanged_record(self, site: str, page: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the stored record if the page's JSON-LD fingerprint has not changed"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT record FROM page_contributions WHERE site = ? AND page = ? AND fingerprint = ?',
+                (site, page, fingerprint)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def apply(self, site: str, page_records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply this run's page records to the site aggregate.
+
+        Only pages whose fingerprint changed (or that appeared or disappeared)
+        touch the aggregate. Returns the updated aggregate and delta statistics.
+        """
+        stats = {'pages_unchanged': 0, 'pages_changed': 0, 'pages_removed': 0}
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                previous = {
+                    page: (fingerprint, record)
+                    for page, fingerprint, record in self._conn.execute(
+                        'SELECT page, fingerprint, record FROM page_contributions WHERE site = ?', (site,)
+                    )
+                }
+                row = self._conn.execute('SELECT aggregate FROM site_aggregates WHERE site = ?', (site,)).fetchone()
+                aggregate = json.loads(row[0]) if row else empty_aggregate()
+
+                for page, record in page_records.items():
+                    fingerprint = record.get('fingerprint')
+                    old = previous.pop(page, None)
+
+                    if old and fingerprint is not None and old[0] == fingerprint:
+                        stats['pages_unchanged'] += 1
+                        continue
+
+                    if old:
+                        self._add(aggregate, json.loads(old[1]), -1)
+                    self._add(aggregate, record, 1)
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO page_contributions VALUES (?, ?, ?, ?)',
+                        (site, page, fingerprint, json.dumps(record))
+                    )
+                    stats['pages_changed'] += 1
+
+                # Pages that are no longer checked stop contributing
+                for page, (_, record) in previous.items():
+                    self._add(aggregate, json.loads(record), -1)
+                    self._conn.execute('DELETE FROM page_contributions WHERE site = ? AND page = ?', (site, page))
+                    stats['pages_removed'] += 1
+
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO site_aggregates VALUES (?, ?, ?)',
+                    (site, json.dumps(aggregate), time.time())
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        return {'aggregate': aggregate, 'stats': stats}
+
+    @staticmethod
+    def _add(aggregate: Dict[str, int], record: Dict[str, Any], sign: int):
+        # Records and aggregates written before a field existed count it as zero
+        for field in COUNTED_FIELDS:
+            aggregate[field] = aggregate.get(field, 0) + sign * record.get(field, 0)
+
+        elements = record['authority_elements']
+        for element in COUNTED_ELEMENTS:
+            aggregate[element] += sign * elements[element]
+        if elements['experience_years']:
+            aggregate['experience_years_pages'] += sign
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
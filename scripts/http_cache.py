@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Validator Page Cache
+Persistent conditional-request cache for AuthorityValidator page fetches
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+class PageCache:
+    """
+    On-disk cache of page validators and validation records.
+
+    For every URL it keeps the ETag/Last-Modified response headers, a hash of
+    the body and the page's validation record. Conditional requests are sent
+    with the stored headers; on a 304 or an unchanged body hash the stored
+    record is reused and JSON-LD parsing is skipped entirely. Each entry is
+    tagged with the ``version`` of the validator that produced its record,
+    and entries of another version are revalidated, not reused. Entries are
+    evicted least-recently-used first once ``max_entries`` or ``max_bytes`` is
+    exceeded. The SQLite file can be shared by several processes.
+    """
+
+    STAT_KEYS = ('not_modified_hits', 'content_hash_hits', 'misses', 'stores', 'evictions')
+
+    def __init__(self, path: str, version: str = '', max_entries: int = 50000, max_bytes: int = 256 * 1024 * 1024):
+        self.path = Path(path)
+        self.version = version
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = {key: 0 for key in self.STAT_KEYS}
+
+        # Fetches run in worker threads, so one connection is shared behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT NOT NULL,
+                record TEXT NOT NULL,
+                version TEXT NOT NULL DEFAULT '',
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+            CREATE TABLE IF NOT EXISTS cache_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                entries INTEGER NOT NULL,
+                bytes INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO cache_totals VALUES (0, 0, 0);
+        ''')
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(pages)')}
+        if 'version' not in columns:
+            # Caches written before records were versioned are never reused
+            self._conn.execute("ALTER TABLE pages ADD COLUMN version TEXT NOT NULL DEFAULT ''")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified, if the cached record is of this version"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified FROM pages WHERE url = ? AND version = ?', (url, self.version)
+            ).fetchone()
+
+        headers = {}
+        if row:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def not_modified(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record for a URL the server answered 304 for; None if it is of another version"""
+        record = self._load_record(url)
+        self._count('not_modified_hits' if record is not None else 'misses')
+        return record
+
+    def matching_content(self, url: str, content_hash: str, etag: Optional[str],
+                         last_modified: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached record if the body hash is unchanged, refreshing its validators"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT record FROM pages WHERE url = ? AND content_hash = ?', (url, content_hash)
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    'UPDATE pages SET etag = ?, last_modified = ?, last_access = ? WHERE url = ?',
+                    (etag, last_modified, time.time(), url)
+                )
+
+        if row is None:
+            self._count('misses')
+            return None
+
+        self._count('content_hash_hits')
+        return json.loads(row[0])
+
+    def store(self, url: str, content_hash: str, etag: Optional[str], last_modified: Optional[str],
+              record: Dict[str, Any]):
+        """Store a freshly validated page and evict least-recently-used entries over budget"""
+        encoded = json.dumps(record)
+        size = len(url) + len(encoded) + len(content_hash) + len(etag or '') + len(last_modified or '')
+
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                previous = self._conn.execute('SELECT size FROM pages WHERE url = ?', (url,)).fetchone()
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO pages (url, etag, last_modified, content_hash, record, version, size, last_access) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, content_hash, encoded, self.version, size, time.time())
+                )
+                if previous:
+                    self._conn.execute('UPDATE cache_totals SET bytes = bytes + ?', (size - previous[0],))
+                else:
+                    self._conn.execute('UPDATE cache_totals SET entries = entries + 1, bytes = bytes + ?', (size,))
+
+                evicted = self._evict()
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        self._count('stores')
+        if evicted:
+            self._count('evictions', evicted)
+
+    def _evict(self) -> int:
+        """Drop oldest entries until within budget; must run inside a transaction"""
+        entries, total_bytes = self._conn.execute('SELECT entries, bytes FROM cache_totals').fetchone()
+        evicted = 0
+
+        while entries > self.max_entries or total_bytes > self.max_bytes:
+            # Evict in small batches to bound the work per store
+            batch = self._conn.execute(
+                'SELECT url, size FROM pages ORDER BY last_access LIMIT ?',
+                (max(1, entries - self.max_entries, 16),)
+            ).fetchall()
+            if not batch:
+                break
+
+            for url, size in batch:
+                if entries <= self.max_entries and total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute('DELETE FROM pages WHERE url = ?', (url,))
+                entries -= 1
+                total_bytes -= size
+                evicted += 1
+
+        if evicted:
+            self._conn.execute('UPDATE cache_totals SET entries = ?, bytes = ?', (entries, total_bytes))
+        return evicted
+
+    def _load_record(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT record FROM pages WHERE url = ? AND version = ?', (url, self.version)
+            ).fetchone()
+            if row:
+                self._conn.execute('UPDATE pages SET last_access = ? WHERE url = ?', (time.time(), url))
+        return json.loads(row[0]) if row else None
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the counters, for computing per-run statistics"""
+        with self._lock:
+            return dict(self.stats)
+
+    def stats_since(self, snapshot: Dict[str, int]) -> Dict[str, Any]:
+        """Hit/miss statistics accumulated since ``snapshot`` was taken"""
+        current = self.snapshot()
+        stats: Dict[str, Any] = {key: current[key] - snapshot.get(key, 0) for key in self.STAT_KEYS}
+        hits = stats['not_modified_hits'] + stats['content_hash_hits']
+        lookups = hits + stats['misses']
+        stats['hit_rate'] = round(hits / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
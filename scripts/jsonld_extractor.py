@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Lightweight JSON-LD Extractor
+Pulls application/ld+json script blocks out of raw HTML bytes without building a DOM
+"""
+
+import html
+import re
+from typing import Any, List, Optional
+
+JSONLD_MIME_TYPE = 'application/ld+json'
+
+# Markup that changes how the following bytes must be read. <script> and <style>
+# are raw-text elements, so anything that looks like a tag inside them is ignored,
+# the same way html.parser treats them. Scanning goes on past </html>: html.parser
+# still returns scripts that templates or tag managers put after it.
+_MARKUP = re.compile(rb'<(?:(!--)|(script|style)(?=[\s/>]))', re.I)
+_START_TAG_END = re.compile(rb'(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+_ATTRIBUTE = re.compile(rb'([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+_END_TAGS = {
+    b'script': re.compile(rb'</\s*script\s*>', re.I),
+    b'style': re.compile(rb'</\s*style\s*>', re.I)
+}
+_COMMENT_END = b'-->'
+
+# Longest prefix of a markup token that can be split across two chunks
+_MAX_TOKEN_TAIL = 8
+# End tags allow whitespace (</script  >), so keep a more generous tail for them
+_MAX_END_TAG_TAIL = 64
+
+class JsonLdExtractor:
+    """
+    Incremental JSON-LD extractor.
+
+    Feed it the response body chunk by chunk; completed blocks are returned as
+    soon as their closing tag has been seen, and the rest once ``close`` marks
+    the end of the document.
+    """
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self.encoding = encoding
+        self.done = False
+        self._buffer = bytearray()
+        self._pos = 0
+        # Where to resume looking for the end tag of an element left open by the last chunk
+        self._close_from = 0
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """Consume a chunk of the document and return any completed blocks"""
+        if self.done:
+            return []
+
+        self._buffer += chunk
+        blocks = self._scan(final=False)
+        self._compact()
+        return blocks
+
+    def close(self) -> List[str]:
+        """Signal end of document and return any remaining blocks"""
+        blocks = [] if self.done else self._scan(final=True)
+        self.done = True
+        self._buffer = bytearray()
+        self._pos = 0
+        self._close_from = 0
+        return blocks
+
+    def _scan(self, final: bool) -> List[str]:
+        blocks = []
+        buffer = self._buffer
+
+        while not self.done:
+            match = _MARKUP.search(buffer, self._pos)
+            if not match:
+                # Keep a short tail in case a token straddles the chunk boundary
+                self._pos = max(self._pos, len(buffer) - _MAX_TOKEN_TAIL)
+                break
+
+            if match.group(1):
+                end = buffer.find(_COMMENT_END, match.end())
+                if end < 0:
+                    if final:
+                        self.done = True
+                    self._pos = match.start()
+                    break
+                self._pos = end + len(_COMMENT_END)
+                continue
+
+            tag_end = _START_TAG_END.match(buffer, match.end())
+            if not tag_end:
+                if final:
+                    self.done = True
+                self._pos = match.start()
+                break
+
+            tag = match.group(2).lower()
+            attributes = buffer[match.end():tag_end.end() - 1]
+
+            # <script ... /> is a complete (empty) element for html.parser
+            if attributes.rstrip().endswith(b'/'):
+                if tag == b'script' and self._is_jsonld(attributes):
+                    blocks.append('')
+                self._pos = tag_end.end()
+                continue
+
+            close = _END_TAGS[tag].search(buffer, max(tag_end.end(), self._close_from))
+            self._close_from = 0
+            if not close:
+                if final:
+                    # Unterminated raw text runs to the end of the document
+                    if tag == b'script' and self._is_jsonld(attributes):
+                        blocks.append(self._decode(buffer[tag_end.end():]))
+                    self.done = True
+                self._pos = match.start()
+                self._close_from = max(tag_end.end(), len(buffer) - _MAX_END_TAG_TAIL)
+                break
+
+            if tag == b'script' and self._is_jsonld(attributes):
+                blocks.append(self._decode(buffer[tag_end.end():close.start()]))
+            self._pos = close.end()
+
+        return blocks
+
+    def _compact(self):
+        """Drop bytes that have already been scanned"""
+        if self._pos:
+            del self._buffer[:self._pos]
+            self._close_from = max(0, self._close_from - self._pos)
+            self._pos = 0
+
+    def _is_jsonld(self, attributes: bytes) -> bool:
+        script_type = None
+        for match in _ATTRIBUTE.finditer(attributes):
+            if match.group(1).lower() == b'type':
+                # Later duplicates win, matching BeautifulSoup's default
+                value = next((v for v in match.groups()[1:] if v is not None), b'')
+                script_type = value
+        if script_type is None:
+            return False
+        return html.unescape(script_type.decode(self.encoding, errors='replace')) == JSONLD_MIME_TYPE
+
+    def _decode(self, block: bytes) -> str:
+        return block.decode(self.encoding, errors='replace')
+
+def extract_jsonld_blocks(content: bytes, encoding: str = 'utf-8') -> List[str]:
+    """Extract all JSON-LD script bodies from a complete HTML document"""
+    extractor = JsonLdExtractor(encoding)
+    return extractor.feed(content) + extractor.close()
+
+def response_encoding(response) -> str:
+    """
+    Charset declared in the response's Content-Type, else the one detected
+    from the body, as BeautifulSoup would. requests' own default for text
+    without a charset (ISO-8859-1) would garble UTF-8 pages. Detection reads
+    the whole body into memory first.
+    """
+    if response.encoding and 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return response.apparent_encoding or 'utf-8'
+
+def extract_jsonld_from_response(response, chunk_size: int = 64 * 1024,
+                                 encoding: Optional[str] = None, digest: Any = None) -> List[str]:
+    """
+    Extract JSON-LD blocks from a streamed ``requests`` response, decoded
+    with ``encoding`` or else the response's charset (see response_encoding),
+    and close the response. When a hashlib ``digest`` is given every chunk is
+    fed to it as well.
+    """
+    extractor = JsonLdExtractor(encoding or response_encoding(response))
+    blocks = []
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if digest is not None:
+                digest.update(chunk)
+            blocks.extend(extractor.feed(chunk))
+        blocks.extend(extractor.close())
+    finally:
+        response.close()
+
+    return blocks
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Dealer Mention Extractor
+Aho-Corasick automaton over the dealer roster that finds every dealer mention and list position in one pass
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Numbered or bulleted list items, which define ranking positions in an answer
+LIST_ITEM = re.compile(r'^\s*(?:\d+[.)]|[-*•])\s+')
+
+class MentionExtractor:
+    """
+    Multi-pattern matcher for dealer names, DBA aliases and domains.
+
+    All aliases share one case-insensitive Aho-Corasick automaton, so an
+    answer is scanned once no matter how many dealers are tracked. Matches
+    must sit on word boundaries ("Ford" does not match "Fordham").
+
+    Roster changes edit the trie in place: new aliases are inserted into the
+    existing trie and removed ones are unhooked from their end states. A new
+    alias can change the failure link of any state, so additions are followed
+    by a full relink (lazily, on the next scan), which saves rebuilding the
+    trie but still walks all of it; removals leave failure links valid and
+    only recompute output links. The trie is compacted once more than half of
+    its patterns have been removed. Results are memoized per answer text, so
+    fanning one answer out to many dealers costs a single scan.
+    """
+
+    def __init__(self, roster: Optional[Dict[str, Iterable[str]]] = None, memo_size: int = 4096):
+        self.memo_size = memo_size
+        self._reset()
+        self.stats = {'patterns_added': 0, 'patterns_removed': 0, 'relinks': 0, 'output_relinks': 0,
+                      'compactions': 0, 'scans': 0}
+        for dealer_id, aliases in (roster or {}).items():
+            self.add_dealer(dealer_id, aliases)
+
+    def _reset(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output_link: List[int] = [0]
+        self._terminal: List[List[int]] = [[]]
+        # Pattern id -> (dealer id, alias, end state); None once removed
+        self._patterns: List[Optional[Tuple[str, str, int]]] = []
+        self._dealer_aliases: Dict[str, Dict[str, int]] = {}
+        # States in breadth-first order as of the last relink
+        self._order: List[int] = []
+        self._removed = 0
+        self._dirty = False
+        self._outputs_dirty = False
+        self._memo: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def __contains__(self, dealer_id: str) -> bool:
+        return dealer_id in self._dealer_aliases
+
+    def add_dealer(self, dealer_id: str, aliases: Iterable[str]):
+        """Add a dealer or replace its aliases; unchanged aliases are left in place"""
+        wanted = {alias.strip().lower() for alias in aliases if alias and alias.strip()}
+        current = self._dealer_aliases.setdefault(dealer_id, {})
+
+        for alias in [alias for alias in current if alias not in wanted]:
+            self._remove_pattern(current.pop(alias))
+        for alias in wanted - current.keys():
+            current[alias] = self._insert_pattern(dealer_id, alias)
+
+        self._maybe_compact()
+
+    def remove_dealer(self, dealer_id: str):
+        for pattern_id in self._dealer_aliases.pop(dealer_id, {}).values():
+            self._remove_pattern(pattern_id)
+        self._maybe_compact()
+
+    def update_roster(self, roster: Dict[str, Iterable[str]]):
+        """Make the tracked roster equal to ``roster``, touching only dealers that changed"""
+        for dealer_id in [dealer_id for dealer_id in self._dealer_aliases if dealer_id not in roster]:
+            self.remove_dealer(dealer_id)
+        for dealer_id, aliases in roster.items():
+            self.add_dealer(dealer_id, aliases)
+
+    def _insert_pattern(self, dealer_id: str, alias: str) -> int:
+        state = 0
+        for char in alias:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output_link.append(0)
+                self._terminal.append([])
+            state = next_state
+
+        pattern_id = len(self._patterns)
+        self._patterns.append((dealer_id, alias, state))
+        self._terminal[state].append(pattern_id)
+        self._dirty = True
+        self.stats['patterns_added'] += 1
+        return pattern_id
+
+    def _remove_pattern(self, pattern_id: int):
+        _, _, state = self._patterns[pattern_id]
+        self._terminal[state].remove(pattern_id)
+        self._patterns[pattern_id] = None
+        self._removed += 1
+        self._outputs_dirty = True
+        self.stats['patterns_removed'] += 1
+
+    def _maybe_compact(self):
+        if self._removed * 2 <= len(self._patterns) or not self._removed:
+            return
+        roster = {dealer_id: list(aliases) for dealer_id, aliases in self._dealer_aliases.items()}
+        self._reset()
+        for dealer_id, aliases in roster.items():
+            self._dealer_aliases[dealer_id] = {alias: self._insert_pattern(dealer_id, alias) for alias in aliases}
+        self.stats['compactions'] += 1
+
+    def _link(self):
+        """Recompute failure and output links breadth-first over the current trie"""
+        goto, fail, output_link, terminal = self._goto, self._fail, self._output_link, self._terminal
+        order = []
+        queue = deque()
+        for state in goto[0].values():
+            fail[state] = 0
+            output_link[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, child in goto[state].items():
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                # Nearest proper suffix state where some alias ends
+                suffix = fail[child]
+                output_link[child] = suffix if terminal[suffix] else output_link[suffix]
+                queue.append(child)
+
+        self._order = order
+        self._dirty = False
+        self._outputs_dirty = False
+        self._memo.clear()
+        self.stats['relinks'] += 1
+
+    def _relink_outputs(self):
+        """Recompute output links after removals, which leave the trie and its failure links as they are"""
+        fail, output_link, terminal = self._fail, self._output_link, self._terminal
+        # A failure link points to a shallower state, which comes first in breadth-first order
+        for state in self._order:
+            suffix = fail[state]
+            output_link[state] = suffix if terminal[suffix] else output_link[suffix]
+
+        self._outputs_dirty = False
+        self._memo.clear()
+        self.stats['output_relinks'] += 1
+
+    def extract(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Every dealer mentioned in ``text`` with its first mention: ranking
+        ``position`` (list item number, or 1 for a mention outside a list), the
+        ``line`` it appears on, the matched ``alias`` and the mention count.
+        The result is the caller's own to modify.
+        """
+        if self._dirty:
+            self._link()
+        elif self._outputs_dirty:
+            self._relink_outputs()
+        cached = self._memo.get(text)
+        if cached is not None:
+            return {dealer_id: dict(mention) for dealer_id, mention in cached.items()}
+
+        goto, fail, output_link, terminal, patterns = (
+            self._goto, self._fail, self._output_link, self._terminal, self._patterns
+        )
+        mentions: Dict[str, Dict[str, Any]] = {}
+        # Where each dealer's last counted match ended, so overlapping aliases count once
+        last_end: Dict[str, Tuple[int, int]] = {}
+        list_position = 0
+
+        for line_number, line in enumerate(text.splitlines()):
+            is_item = LIST_ITEM.match(line) is not None
+            list_position += is_item
+            lowered = line.lower()
+            last = len(lowered) - 1
+            state = 0
+
+            for index, char in enumerate(lowered):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+
+                match_state = state if terminal[state] else output_link[state]
+                while match_state:
+                    for pattern_id in terminal[match_state]:
+                        dealer_id, alias, _ = patterns[pattern_id]
+                        start = index - len(alias) + 1
+                        # Word boundaries, where the alias itself starts or ends with a word character
+                        if start > 0 and alias[0].isalnum() and lowered[start - 1].isalnum():
+                            continue
+                        if index < last and alias[-1].isalnum() and lowered[index + 1].isalnum():
+                            continue
+
+                        previous_end = last_end.get(dealer_id)
+                        if previous_end is not None and previous_end[0] == line_number and start <= previous_end[1]:
+                            continue
+                        last_end[dealer_id] = (line_number, index)
+
+                        mention = mentions.get(dealer_id)
+                        if mention is None:
+                            mentions[dealer_id] = {
+                                'position': list_position if is_item else 1,
+                                'line': line,
+                                'alias': alias,
+                                'mentions': 1
+                            }
+                        else:
+                            mention['mentions'] += 1
+                    match_state = output_link[match_state]
+
+        self.stats['scans'] += 1
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[text] = mentions
+        return {dealer_id: dict(mention) for dealer_id, mention in mentions.items()}
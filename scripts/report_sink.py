@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Report Sink
+Streams report records to NDJSON (optionally gzip-compressed) with a final summary record
+"""
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Output directory for reports when no explicit path is given
+REPORTS_DIR_ENV = 'DEALERSHIP_AI_REPORTS_DIR'
+DEFAULT_REPORTS_DIR = Path(__file__).resolve().parent.parent / 'reports'
+
+def reports_dir() -> Path:
+    """Report directory: $DEALERSHIP_AI_REPORTS_DIR, or the repository's reports/ directory"""
+    return Path(os.environ.get(REPORTS_DIR_ENV) or DEFAULT_REPORTS_DIR)
+
+def report_path(default_name: str, output: Optional[str] = None, compress: bool = False) -> Path:
+    """Resolve a report location: an explicit ``output`` wins, otherwise ``default_name`` in reports_dir()"""
+    if output:
+        return Path(output)
+    path = reports_dir() / default_name
+    return path.with_name(path.name + '.gz') if compress else path
+
+class ReportSink:
+    """
+    Append-only NDJSON report writer.
+
+    Every record is serialized and written as soon as it is produced, so
+    memory stays flat no matter how many dealers or pages a run covers.
+    Paths ending in ``.gz`` are gzip-compressed. Closing the sink writes a
+    final ``summary`` record with the record count and any totals the caller
+    supplies, which lets readers tell a complete report from a truncated one.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self.started_at = time.strftime('%Y-%m-%d %H:%M:%S')
+
+        if self.path.suffix == '.gz':
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        self._flushed_at = time.monotonic()
+
+    def write(self, record: Dict[str, Any], record_type: Optional[str] = None):
+        """Write one record, tagged with ``record_type`` when given"""
+        if record_type is not None:
+            record = {'record_type': record_type, **record}
+        self._file.write(json.dumps(record) + '\n')
+        self.records_written += 1
+
+        # Periodic flushes keep the file tail-able without flushing every gzip member
+        now = time.monotonic()
+        if now - self._flushed_at >= self.flush_interval:
+            self._file.flush()
+            self._flushed_at = now
+
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        """Write the summary record and close the file"""
+        if self._file.closed:
+            return
+        self.write({
+            'records': self.records_written,
+            'started_at': self.started_at,
+            'finished_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            **(summary or {})
+        }, record_type='summary')
+        self._file.close()
+
+    def __enter__(self) -> 'ReportSink':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close({'incomplete': True, 'error': str(exc)} if exc_type else None)
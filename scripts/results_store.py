@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Results Store
+Indexed SQLite history of platform visibility and authority scores for trend queries
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DAY_SECONDS = 86400
+
+# Column order of each table, as returned by scan()
+TABLE_COLUMNS = {
+    'platform_results': (
+        'recorded_at', 'dealer', 'platform', 'query', 'status',
+        'mentioned', 'ranking_position', 'authority_signals'
+    ),
+    'authority_scores': ('recorded_at', 'dealer', 'source', 'component', 'score')
+}
+
+def authority_score_components(authority_score: Dict[str, Any]) -> Dict[str, float]:
+    """Flatten a ``calculate_authority_score`` result into component -> score"""
+    return {
+        'final_score': authority_score['final_score'],
+        'improvement': authority_score['improvement'],
+        **authority_score['components']
+    }
+
+class ResultsStore:
+    """
+    Append-only history of test results, one narrow row per measurement.
+
+    Platform rows are keyed by (dealer, platform, query, recorded_at) and
+    authority rows by (dealer, source, component, recorded_at). Both tables
+    carry covering indexes for time-range scans across all dealers and for
+    one dealer's history. Platform rows are also rolled up per (day, dealer,
+    platform) in the same transaction as the append, so trend queries such as
+    "visibility by platform over 90 days" aggregate a few rows per dealer-day
+    instead of every query result or historical report.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS platform_results (
+                recorded_at REAL NOT NULL,
+                dealer TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                query TEXT NOT NULL,
+                status TEXT NOT NULL,
+                mentioned INTEGER NOT NULL,
+                ranking_position INTEGER,
+                authority_signals INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS platform_results_time ON platform_results
+                (recorded_at, platform, mentioned, ranking_position);
+            CREATE INDEX IF NOT EXISTS platform_results_dealer ON platform_results
+                (dealer, recorded_at, platform, mentioned, ranking_position);
+            CREATE TABLE IF NOT EXISTS platform_daily (
+                day INTEGER NOT NULL,
+                dealer TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                queries INTEGER NOT NULL,
+                mentions INTEGER NOT NULL,
+                position_sum INTEGER NOT NULL,
+                PRIMARY KEY (day, dealer, platform)
+            );
+            CREATE INDEX IF NOT EXISTS platform_daily_dealer ON platform_daily (dealer, day);
+            CREATE TABLE IF NOT EXISTS authority_scores (
+                recorded_at REAL NOT NULL,
+                dealer TEXT NOT NULL,
+                source TEXT NOT NULL,
+                component TEXT NOT NULL,
+                score REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS authority_scores_time ON authority_scores
+                (component, recorded_at, score);
+            CREATE INDEX IF NOT EXISTS authority_scores_dealer ON authority_scores
+                (dealer, component, recorded_at, score);
+        ''')
+
+    def _append(self, table: str, rows: List[Sequence[Any]], rollup: Optional[List[Sequence[Any]]] = None) -> int:
+        placeholders = ', '.join('?' * len(TABLE_COLUMNS[table]))
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(f'INSERT INTO {table} VALUES ({placeholders})', rows)
+                if rollup:
+                    self._conn.executemany(
+                        'INSERT INTO platform_daily VALUES (?, ?, ?, ?, ?, ?) '
+                        'ON CONFLICT (day, dealer, platform) DO UPDATE SET '
+                        'queries = queries + excluded.queries, mentions = mentions + excluded.mentions, '
+                        'position_sum = position_sum + excluded.position_sum',
+                        rollup
+                    )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return len(rows)
+
+    def append_platform_results(self, dealer: str, query_results: Iterable[Dict[str, Any]],
+                                recorded_at: Optional[float] = None) -> int:
+        """Append per-query results (``query_results`` from score_platform_results) for one dealer"""
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        rows = [
+            (recorded_at, dealer, result['platform'], result['query'], result['status'],
+             int(result['mentioned']), result['ranking_position'], result['authority_signals'])
+            for result in query_results
+        ]
+
+        day = int(recorded_at // DAY_SECONDS)
+        daily: Dict[str, List[int]] = {}
+        for row in rows:
+            totals = daily.setdefault(row[2], [0, 0, 0])
+            totals[0] += 1
+            totals[1] += row[5]
+            totals[2] += row[6] or 0
+        rollup = [(day, dealer, platform, *totals) for platform, totals in daily.items()]
+        return self._append('platform_results', rows, rollup)
+
+    def append_authority_scores(self, dealer: str, scores: Mapping[str, float], source: str,
+                                recorded_at: Optional[float] = None) -> int:
+        """Append one row per score component; ``source`` names the producer (validator, calculator)"""
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        rows = [(recorded_at, dealer, source, component, float(score)) for component, score in scores.items()]
+        return self._append('authority_scores', rows)
+
+    def scan(self, table: str, columns: Optional[Sequence[str]] = None, since: Optional[float] = None,
+             until: Optional[float] = None, **equals: Any) -> Dict[str, List[Any]]:
+        """
+        Column-oriented read of ``table``: a list per requested column, in
+        recorded_at order. ``since``/``until`` bound recorded_at and keyword
+        arguments filter on column equality (e.g. ``dealer=...``).
+        """
+        known = TABLE_COLUMNS[table]
+        columns = list(columns or known)
+        for column in columns + list(equals):
+            if column not in known:
+                raise ValueError(f"Unknown column for {table}: {column}")
+
+        clauses, params = [], []
+        for column, value in equals.items():
+            clauses.append(f'{column} = ?')
+            params.append(value)
+        if since is not None:
+            clauses.append('recorded_at >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('recorded_at < ?')
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY recorded_at", params
+            ).fetchall()
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        return {column: list(column_values) for column, column_values in zip(columns, values)}
+
+    def visibility_by_platform(self, days: int = 90, dealer: Optional[str] = None,
+                               now: Optional[float] = None) -> Dict[str, List[Any]]:
+        """
+        Daily visibility per platform over the last ``days`` days (whole UTC
+        days), across the fleet or for one dealer: query count, mention rate
+        and average ranking position (of the queries that mentioned the dealer).
+        """
+        since = (time.time() if now is None else now) - days * DAY_SECONDS
+        dealer_clause, params = ('dealer = ? AND ', [dealer]) if dealer is not None else ('', [])
+
+        with self._lock:
+            rows = self._conn.execute(
+                f'''SELECT platform, day, SUM(queries), SUM(mentions), SUM(position_sum)
+                    FROM platform_daily
+                    WHERE {dealer_clause}day >= ?
+                    GROUP BY platform, day
+                    ORDER BY platform, day''',
+                params + [int(since // DAY_SECONDS)]
+            ).fetchall()
+
+        platforms, day_numbers, queries, mentions, position_sums = zip(*rows) if rows else [()] * 5
+        return {
+            'platform': list(platforms),
+            'date': [time.strftime('%Y-%m-%d', time.gmtime(day * DAY_SECONDS)) for day in day_numbers],
+            'queries': list(queries),
+            'mention_rate': [round(mentioned / total, 3) for mentioned, total in zip(mentions, queries)],
+            'average_position': [round(position_sum / mentioned, 2) if mentioned else None
+                                 for position_sum, mentioned in zip(position_sums, mentions)]
+        }
+
+    def query_outcomes(self, dealer: str, days: int = 90, now: Optional[float] = None) -> Dict[str, Tuple[int, int]]:
+        """(mentions, runs) per query for one dealer over the last ``days`` days, across platforms"""
+        since = (time.time() if now is None else now) - days * DAY_SECONDS
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT query, SUM(mentioned), COUNT(*) FROM platform_results '
+                'WHERE dealer = ? AND recorded_at >= ? GROUP BY query',
+                (dealer, since)
+            ).fetchall()
+        return {query: (mentions, runs) for query, mentions, runs in rows}
+
+    def authority_trend(self, dealer: str, component: str = 'final_score', days: int = 90,
+                        now: Optional[float] = None) -> Dict[str, List[Any]]:
+        """One dealer's score history for a component over the last ``days`` days"""
+        since = (time.time() if now is None else now) - days * DAY_SECONDS
+        return self.scan('authority_scores', ('recorded_at', 'source', 'score'), since=since,
+                         dealer=dealer, component=component)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Schema.org Validation Rules
+Declarative per-type rules compiled into a type-dispatched, single-pass JSON-LD validator
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump whenever the rules change so cached page results are re-validated
+RULESET_VERSION = 'schema-rules-1'
+
+# Per-type rules:
+#   extends      - inherit the rules of another type in this table
+#   required     - properties that must be present
+#   required_any - groups where at least one property must be present
+#   recommended  - properties that should be present (reported as warnings)
+#   expects      - allowed @type values for nested objects under a property
+SCHEMA_TYPE_RULES: Dict[str, Dict[str, Any]] = {
+    'Organization': {
+        'required': ['name'],
+        'recommended': ['url', 'logo', 'sameAs']
+    },
+    'LocalBusiness': {
+        'extends': 'Organization',
+        'required': ['address'],
+        'recommended': ['telephone', 'openingHoursSpecification', 'geo', 'image', 'priceRange'],
+        'expects': {
+            'address': ['PostalAddress'],
+            'aggregateRating': ['AggregateRating'],
+            'review': ['Review'],
+            'employee': ['Person']
+        }
+    },
+    'AutoDealer': {
+        'extends': 'LocalBusiness',
+        'recommended': ['aggregateRating', 'foundingDate', 'award', 'employee', 'department']
+    },
+    'AutoRepair': {'extends': 'LocalBusiness'},
+    'AutoPartsStore': {'extends': 'LocalBusiness'},
+    'AutoBodyShop': {'extends': 'LocalBusiness'},
+    'PostalAddress': {
+        'required': ['streetAddress', 'addressLocality'],
+        'recommended': ['addressRegion', 'postalCode', 'addressCountry']
+    },
+    'Person': {
+        'required': ['name'],
+        'recommended': ['jobTitle', 'worksFor', 'hasCredential', 'image'],
+        'expects': {'hasCredential': ['EducationalOccupationalCredential']}
+    },
+    'EducationalOccupationalCredential': {
+        'required': ['name'],
+        'recommended': ['credentialCategory', 'recognizedBy', 'dateCreated']
+    },
+    'Vehicle': {
+        'required': ['name'],
+        'recommended': ['vehicleIdentificationNumber', 'brand', 'model', 'image', 'offers', 'mileageFromOdometer'],
+        'expects': {'offers': ['Offer', 'AggregateOffer']}
+    },
+    'Car': {'extends': 'Vehicle'},
+    'Motorcycle': {'extends': 'Vehicle'},
+    'Offer': {
+        'required': ['priceCurrency'],
+        'required_any': [['price', 'priceSpecification']],
+        'recommended': ['availability', 'url', 'seller', 'itemCondition']
+    },
+    'AggregateOffer': {
+        'required': ['lowPrice', 'priceCurrency'],
+        'recommended': ['highPrice', 'offerCount']
+    },
+    'AggregateRating': {
+        'required': ['ratingValue'],
+        'required_any': [['reviewCount', 'ratingCount']],
+        'recommended': ['bestRating', 'worstRating']
+    },
+    'Review': {
+        'required': ['author', 'reviewRating'],
+        'recommended': ['datePublished', 'reviewBody'],
+        'expects': {'reviewRating': ['Rating']}
+    },
+    'Rating': {
+        'required': ['ratingValue'],
+        'recommended': ['bestRating']
+    }
+}
+
+class CompiledTypeRule:
+    """Flattened rule for one @type with inheritance already resolved"""
+    __slots__ = ('type_name', 'required', 'required_any', 'recommended', 'expects')
+
+    def __init__(self, type_name: str, required: Tuple[str, ...], required_any: Tuple[Tuple[str, ...], ...],
+                 recommended: Tuple[str, ...], expects: Dict[str, frozenset]):
+        self.type_name = type_name
+        self.required = required
+        self.required_any = required_any
+        self.recommended = recommended
+        self.expects = expects
+
+def compile_schema_rules(rules: Dict[str, Dict[str, Any]]) -> Dict[str, CompiledTypeRule]:
+    """Resolve inheritance and build the @type dispatch table"""
+    compiled: Dict[str, CompiledTypeRule] = {}
+
+    def resolve(type_name: str, chain: Tuple[str, ...] = ()) -> CompiledTypeRule:
+        if type_name in compiled:
+            return compiled[type_name]
+        if type_name in chain:
+            raise ValueError(f"Circular 'extends' in schema rules: {' -> '.join(chain + (type_name,))}")
+
+        rule = rules[type_name]
+        parent = resolve(rule['extends'], chain + (type_name,)) if 'extends' in rule else None
+
+        required = list(parent.required) if parent else []
+        required += [name for name in rule.get('required', []) if name not in required]
+        required_any = list(parent.required_any) if parent else []
+        required_any += [tuple(group) for group in rule.get('required_any', [])]
+        recommended = list(parent.recommended) if parent else []
+        recommended += [name for name in rule.get('recommended', []) if name not in recommended]
+        expects = dict(parent.expects) if parent else {}
+        expects.update({name: frozenset(types) for name, types in rule.get('expects', {}).items()})
+
+        compiled[type_name] = CompiledTypeRule(
+            type_name, tuple(required), tuple(required_any),
+            tuple(name for name in recommended if name not in required), expects
+        )
+        return compiled[type_name]
+
+    for type_name in rules:
+        resolve(type_name)
+    return compiled
+
+class SchemaValidator:
+    """
+    Single-pass JSON-LD validator.
+
+    Each node's @type is looked up once in the compiled dispatch table and the
+    flattened rule is applied directly; nested objects are validated in the
+    same iterative traversal. With a ``vocabulary`` index, unknown types and
+    properties used outside their Schema.org domain are reported as warnings.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None, vocabulary: Optional[Any] = None):
+        self.dispatch = compile_schema_rules(rules if rules is not None else SCHEMA_TYPE_RULES)
+        self.vocabulary = vocabulary
+        # Results depend on the vocabulary too, so it is part of the cache salt
+        self.version = f'{RULESET_VERSION}+vocab-{vocabulary.checksum}' if vocabulary is not None else RULESET_VERSION
+
+    def validate(self, schema_data: Any) -> Dict[str, Any]:
+        """Validate a JSON-LD document; returns validity, errors, warnings and node count"""
+        errors: List[str] = []
+        warnings: List[str] = []
+        nodes_validated = 0
+
+        documents = schema_data if isinstance(schema_data, list) else [schema_data]
+        # Stack entries: (node, path, must_be_typed). Paths are (parent path, key)
+        # links that are only rendered to strings when an issue is reported.
+        stack: List[Tuple[Any, Any, bool]] = []
+
+        for index, document in enumerate(documents):
+            path = ('$', index) if isinstance(schema_data, list) else '$'
+            if not isinstance(document, dict):
+                errors.append(f"{render_path(path)}: JSON-LD document must be an object")
+                continue
+            if '@context' not in document:
+                errors.append(f"{render_path(path)}: missing @context")
+
+            graph = document.get('@graph')
+            if isinstance(graph, list):
+                graph_path = (path, '@graph')
+                stack.extend((node, (graph_path, i), True) for i, node in enumerate(graph))
+                if '@type' in document:
+                    stack.append(({k: v for k, v in document.items() if k != '@graph'}, path, True))
+            else:
+                stack.append((document, path, True))
+
+        dispatch = self.dispatch
+        vocabulary = self.vocabulary
+        while stack:
+            node, path, must_be_typed = stack.pop()
+
+            if isinstance(node, list):
+                stack.extend((item, (path, i), must_be_typed) for i, item in enumerate(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+
+            node_type = node.get('@type')
+            nodes_validated += 1
+
+            if node_type is None:
+                # Untyped nested objects and bare @id references are allowed
+                if must_be_typed and '@id' not in node:
+                    errors.append(f"{render_path(path)}: missing @type")
+            else:
+                type_names = node_type if isinstance(node_type, list) else (node_type,)
+                for type_name in type_names:
+                    rule = dispatch.get(type_name) if isinstance(type_name, str) else None
+                    if rule is not None:
+                        self._apply_rule(rule, node, path, errors, warnings)
+                if vocabulary is not None:
+                    self._check_vocabulary(vocabulary, type_names, node, path, warnings)
+
+            for key, value in node.items():
+                if isinstance(value, (dict, list)) and not key.startswith('@'):
+                    stack.append((value, (path, key), False))
+
+        return {
+            'valid': not errors,
+            'errors': errors,
+            'warnings': warnings,
+            'nodes_validated': nodes_validated
+        }
+
+    @staticmethod
+    def _apply_rule(rule: CompiledTypeRule, node: Dict[str, Any], path: Any,
+                    errors: List[str], warnings: List[str]):
+        missing_required = [name for name in rule.required if name not in node]
+        missing_any = [group for group in rule.required_any if not any(name in node for name in group)]
+        missing_recommended = [name for name in rule.recommended if name not in node]
+        unexpected = [
+            (name, allowed, item['@type'])
+            for name, allowed in rule.expects.items()
+            for item in (node[name] if isinstance(node.get(name), list) else (node.get(name),))
+            if isinstance(item, dict) and isinstance(item.get('@type'), str) and item['@type'] not in allowed
+        ]
+        if not (missing_required or missing_any or missing_recommended or unexpected):
+            return
+
+        # Rendered once per node, and only when there is something to report
+        where = render_path(path)
+        type_name = rule.type_name
+        errors.extend(f"{where}: {type_name} missing required property '{name}'" for name in missing_required)
+        errors.extend(f"{where}: {type_name} requires one of {', '.join(group)}" for group in missing_any)
+        errors.extend(f"{where}.{name}: expected {' or '.join(sorted(allowed))}, got {got}"
+                      for name, allowed, got in unexpected)
+        warnings.extend(f"{where}: {type_name} missing recommended property '{name}'" for name in missing_recommended)
+
+    @staticmethod
+    def _check_vocabulary(vocabulary: Any, type_names: Any, node: Dict[str, Any], path: Any,
+                          warnings: List[str]):
+        type_ids = []
+        unknown_types = []
+        for type_name in type_names:
+            if not isinstance(type_name, str):
+                continue
+            type_id = vocabulary.type_id(type_name)
+            if type_id is None:
+                unknown_types.append(type_name)
+            else:
+                type_ids.append(type_id)
+
+        unknown_properties = []
+        misplaced_properties = []
+        if type_ids:
+            for key in node:
+                # Keywords and prefixed extension properties are outside Schema.org
+                if key.startswith('@') or ':' in key:
+                    continue
+                property_id = vocabulary.property_id(key)
+                if property_id is None:
+                    unknown_properties.append(key)
+                elif not any(vocabulary.property_applies_to(property_id, type_id) for type_id in type_ids):
+                    misplaced_properties.append(key)
+
+        if not (unknown_types or unknown_properties or misplaced_properties):
+            return
+
+        where = render_path(path)
+        warnings.extend(f"{where}: unknown Schema.org type '{name}'" for name in unknown_types)
+        warnings.extend(f"{where}: unknown Schema.org property '{name}'" for name in unknown_properties)
+        shown_types = '/'.join(name for name in type_names if isinstance(name, str))
+        warnings.extend(f"{where}: property '{name}' is not expected on {shown_types}" for name in misplaced_properties)
+
+def render_path(path: Any) -> str:
+    """Render a linked (parent, key) path as $.a.b[0]"""
+    parts = []
+    while isinstance(path, tuple):
+        path, key = path
+        parts.append(f'[{key}]' if isinstance(key, int) else f'.{key}')
+    return path + ''.join(reversed(parts))
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Schema.org Vocabulary Index
+Builds and memory-maps a compact binary index of Schema.org types, subclass closure and property domains
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Index layout (little-endian), every section sized from the header:
+#   header          magic, format version, type count, property count, bitset row bytes,
+#                   hash slot count, source checksum
+#   names           (offset, length) into the string blob per id; types first, then properties
+#   slots           open-addressing hash table of id + 1 (0 = empty), keyed by crc32 of the name
+#   ancestors       one bitset row per type: bit a is set when the type is a subclass of type a
+#   domains         one bitset row per property: bit t is set when the property applies to type t
+#   strings         UTF-8 names
+INDEX_MAGIC = b'SDOVIDX1'
+INDEX_FORMAT = 1
+_HEADER = struct.Struct('<8sIIIII16s')
+_NAME = struct.Struct('<II')
+_SLOT = struct.Struct('<I')
+
+SCHEMA_PREFIXES = ('schema:', 'https://schema.org/', 'http://schema.org/')
+
+def schema_name(value: str) -> str:
+    """Strip a Schema.org namespace prefix from a type or property name"""
+    for prefix in SCHEMA_PREFIXES:
+        if value.startswith(prefix):
+            return value[len(prefix):]
+    return value
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def _referenced_names(value: Any) -> List[str]:
+    return [schema_name(item['@id']) for item in _as_list(value) if isinstance(item, dict) and '@id' in item]
+
+def build_vocabulary_index(vocabulary_path: str, index_path: str) -> Dict[str, int]:
+    """
+    Build a binary index from a Schema.org JSON-LD vocabulary file
+    (e.g. schemaorg-current-https.jsonld). The index is written to a temporary
+    file and renamed into place, so processes that already have the old index
+    mapped keep a consistent view.
+    """
+    source = Path(vocabulary_path).read_bytes()
+    vocabulary = json.loads(source)
+
+    parents: Dict[str, List[str]] = {}
+    domains: Dict[str, List[str]] = {}
+    for node in _as_list(vocabulary.get('@graph', vocabulary)):
+        if not isinstance(node, dict) or not isinstance(node.get('@id'), str):
+            continue
+        node_types = _as_list(node.get('@type'))
+        name = schema_name(node['@id'])
+        if ':' in name:
+            continue
+        if 'rdfs:Class' in node_types:
+            parents[name] = _referenced_names(node.get('rdfs:subClassOf'))
+        elif 'rdf:Property' in node_types:
+            domains[name] = _referenced_names(node.get('schema:domainIncludes'))
+
+    type_names = sorted(parents)
+    property_names = sorted(domains)
+    type_ids = {name: i for i, name in enumerate(type_names)}
+
+    # Reflexive-transitive subclass closure as integer bitsets
+    closure: Dict[str, int] = {}
+
+    def ancestors(name: str, chain: Set[str]) -> int:
+        if name in closure:
+            return closure[name]
+        bits = 1 << type_ids[name]
+        for parent in parents[name]:
+            # Parents outside the vocabulary (rdfs:Class) and cycles are ignored
+            if parent in type_ids and parent not in chain:
+                bits |= ancestors(parent, chain | {name})
+        closure[name] = bits
+        return bits
+
+    descendants = [0] * len(type_names)
+    for name in type_names:
+        bits = ancestors(name, set())
+        for ancestor_id in _set_bits(bits):
+            descendants[ancestor_id] |= 1 << type_ids[name]
+
+    every_type = (1 << len(type_names)) - 1
+    property_rows = []
+    for name in property_names:
+        known = [type_ids[domain] for domain in domains[name] if domain in type_ids]
+        bits = 0
+        for domain_id in known:
+            bits |= descendants[domain_id]
+        # Properties without a declared domain are accepted everywhere
+        property_rows.append(bits if known else every_type)
+
+    row_bytes = max(1, (len(type_names) + 7) // 8)
+    names = type_names + property_names
+    slot_count = 1
+    while slot_count < len(names) * 2:
+        slot_count <<= 1
+
+    encoded_names = [name.encode('utf-8') for name in names]
+    slots = [0] * slot_count
+    for name_id, encoded in enumerate(encoded_names):
+        slot = zlib.crc32(encoded) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = name_id + 1
+
+    checksum = hashlib.sha256(source).digest()[:16]
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = index_path.with_name(index_path.name + f'.{os.getpid()}.tmp')
+
+    with open(temporary_path, 'wb') as out:
+        out.write(_HEADER.pack(INDEX_MAGIC, INDEX_FORMAT, len(type_names), len(property_names),
+                               row_bytes, slot_count, checksum))
+        offset = 0
+        for encoded in encoded_names:
+            out.write(_NAME.pack(offset, len(encoded)))
+            offset += len(encoded)
+        out.write(b''.join(_SLOT.pack(slot) for slot in slots))
+        out.write(b''.join(closure[name].to_bytes(row_bytes, 'little') for name in type_names))
+        out.write(b''.join(bits.to_bytes(row_bytes, 'little') for bits in property_rows))
+        out.write(b''.join(encoded_names))
+    os.replace(temporary_path, index_path)
+
+    return {
+        'types': len(type_names),
+        'properties': len(property_names),
+        'bytes': index_path.stat().st_size
+    }
+
+def _set_bits(bits: int) -> Iterable[int]:
+    index = 0
+    while bits:
+        if bits & 1:
+            yield index
+        bits >>= 1
+        index += 1
+
+class SchemaVocabulary:
+    """
+    Read-only view of a prebuilt vocabulary index.
+
+    The file is memory-mapped rather than parsed, so opening it costs a few
+    page faults and every worker process shares the same physical pages.
+    Name lookups are a single hash probe sequence and subclass and property
+    domain checks are one bit test each.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm.size() < _HEADER.size:
+            raise ValueError(f"Not a Schema.org vocabulary index: {self.path}")
+        magic, version, self.type_count, self.property_count, self._row_bytes, self._slot_count, checksum = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != INDEX_MAGIC or version != INDEX_FORMAT:
+            raise ValueError(f"Not a Schema.org vocabulary index (or built by another version): {self.path}")
+        self.checksum = checksum.hex()
+
+        name_count = self.type_count + self.property_count
+        self._names_offset = _HEADER.size
+        self._slots_offset = self._names_offset + name_count * _NAME.size
+        self._ancestors_offset = self._slots_offset + self._slot_count * _SLOT.size
+        self._domains_offset = self._ancestors_offset + self.type_count * self._row_bytes
+        self._strings_offset = self._domains_offset + self.property_count * self._row_bytes
+
+    def _lookup(self, name: str) -> Optional[int]:
+        """Id of a type or property name, or None if the vocabulary does not define it"""
+        encoded = name.encode('utf-8')
+        mm = self._mm
+        mask = self._slot_count - 1
+        slot = zlib.crc32(encoded) & mask
+
+        while True:
+            entry = _SLOT.unpack_from(mm, self._slots_offset + slot * _SLOT.size)[0]
+            if not entry:
+                return None
+            offset, length = _NAME.unpack_from(mm, self._names_offset + (entry - 1) * _NAME.size)
+            if length == len(encoded):
+                start = self._strings_offset + offset
+                if mm[start:start + length] == encoded:
+                    return entry - 1
+            slot = (slot + 1) & mask
+
+    def type_id(self, name: str) -> Optional[int]:
+        name_id = self._lookup(schema_name(name))
+        return name_id if name_id is not None and name_id < self.type_count else None
+
+    def property_id(self, name: str) -> Optional[int]:
+        name_id = self._lookup(schema_name(name))
+        return name_id - self.type_count if name_id is not None and name_id >= self.type_count else None
+
+    def is_type(self, name: str) -> bool:
+        return self.type_id(name) is not None
+
+    def is_property(self, name: str) -> bool:
+        return self.property_id(name) is not None
+
+    def _test_bit(self, row_offset: int, bit: int) -> bool:
+        return bool(self._mm[row_offset + (bit >> 3)] >> (bit & 7) & 1)
+
+    def type_is_subclass_of(self, type_id: int, ancestor_id: int) -> bool:
+        return self._test_bit(self._ancestors_offset + type_id * self._row_bytes, ancestor_id)
+
+    def property_applies_to(self, property_id: int, type_id: int) -> bool:
+        return self._test_bit(self._domains_offset + property_id * self._row_bytes, type_id)
+
+    def is_subclass_of(self, name: str, ancestor: str) -> bool:
+        """True if ``name`` is ``ancestor`` or one of its (transitive) subclasses"""
+        type_id = self.type_id(name)
+        ancestor_id = self.type_id(ancestor)
+        if type_id is None or ancestor_id is None:
+            return False
+        return self.type_is_subclass_of(type_id, ancestor_id)
+
+    def is_valid_property(self, type_name: str, property_name: str) -> bool:
+        """True if the property's domain includes the type or one of its superclasses"""
+        type_id = self.type_id(type_name)
+        property_id = self.property_id(property_name)
+        if type_id is None or property_id is None:
+            return False
+        return self.property_applies_to(property_id, type_id)
+
+    def close(self):
+        self._mm.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the Schema.org vocabulary index")
+    parser.add_argument('vocabulary', help="Schema.org JSON-LD vocabulary (e.g. schemaorg-current-https.jsonld)")
+    parser.add_argument('index', help="Output index path")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    stats = build_vocabulary_index(args.vocabulary, args.index)
+    print(f"📚 Indexed {stats['types']} types and {stats['properties']} properties "
+          f"into {args.index} ({stats['bytes']:,} bytes)")
+    return stats
+
+if __name__ == "__main__":
+    main()
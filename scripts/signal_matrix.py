@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Signal Recognition Matrix
+Packed bitsets recording which AI platforms recognize each dealer's authority signals
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class SignalRecognitionMatrix:
+    """
+    Authority signal recognition for many dealers.
+
+    Each (dealer, signal) pair is one packed row with one bit per platform,
+    and all rows live in a single growable uint8 array instead of a dict of
+    booleans per signal. Recognition counts per category and platform come
+    from vectorized popcounts: the platform bits are transposed into one
+    bitset over rows per platform and ANDed with one row mask per category.
+    ``detailed_results`` and ``platform_summary`` rebuild the nested dict
+    output of ``AIPlatformTester.test_specific_authority_signals``.
+    """
+
+    def __init__(self, platforms: Sequence[str], capacity: int = 64):
+        self.platforms = list(platforms)
+        self._platform_ids = {platform: i for i, platform in enumerate(self.platforms)}
+        self._row_bytes = max(1, (len(self.platforms) + 7) // 8)
+
+        self._bits = np.zeros((capacity, self._row_bytes), dtype=np.uint8)
+        self._row_dealer = np.zeros(capacity, dtype=np.int32)
+        self._row_signal = np.zeros(capacity, dtype=np.int32)
+        # Row of each (dealer id, signal id), -1 when not recorded
+        self._row_index = np.full((capacity, 8), -1, dtype=np.int32)
+        self.row_count = 0
+
+        self.dealers: List[str] = []
+        self._dealer_ids: Dict[str, int] = {}
+        self.categories: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        # Signal id -> (category, signal name)
+        self.signals: List[Tuple[str, str]] = []
+        self._signal_ids: Dict[Tuple[str, str], int] = {}
+        self._signal_category: List[int] = []
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the row arrays (excluding the name tables)"""
+        return self._bits.nbytes + self._row_dealer.nbytes + self._row_signal.nbytes + self._row_index.nbytes
+
+    def _row(self, dealer: str, category: str, signal: str) -> int:
+        dealer_id = self._dealer_ids.get(dealer)
+        if dealer_id is None:
+            dealer_id = self._dealer_ids[dealer] = len(self.dealers)
+            self.dealers.append(dealer)
+
+        signal_id = self._signal_ids.get((category, signal))
+        if signal_id is None:
+            category_id = self._category_ids.get(category)
+            if category_id is None:
+                category_id = self._category_ids[category] = len(self.categories)
+                self.categories.append(category)
+            signal_id = self._signal_ids[(category, signal)] = len(self.signals)
+            self.signals.append((category, signal))
+            self._signal_category.append(category_id)
+
+        dealer_capacity, signal_capacity = self._row_index.shape
+        if dealer_id >= dealer_capacity or signal_id >= signal_capacity:
+            shape = (max(dealer_capacity, (dealer_id + 1) * 2), max(signal_capacity, (signal_id + 1) * 2))
+            row_index = np.full(shape, -1, dtype=np.int32)
+            row_index[:dealer_capacity, :signal_capacity] = self._row_index
+            self._row_index = row_index
+
+        row = int(self._row_index[dealer_id, signal_id])
+        if row < 0:
+            row = self.row_count
+            self._row_index[dealer_id, signal_id] = row
+            if row == len(self._bits):
+                self._grow()
+            self._row_dealer[row] = dealer_id
+            self._row_signal[row] = signal_id
+            self.row_count += 1
+        return row
+
+    def _grow(self):
+        capacity = max(16, len(self._bits) * 2)
+        bits = np.zeros((capacity, self._row_bytes), dtype=np.uint8)
+        bits[:len(self._bits)] = self._bits
+        self._bits = bits
+        self._row_dealer = np.resize(self._row_dealer, capacity)
+        self._row_signal = np.resize(self._row_signal, capacity)
+
+    def set(self, dealer: str, category: str, signal: str, platform: str, recognized: bool = True):
+        """Record whether ``platform`` recognizes one of a dealer's signals"""
+        row = self._row(dealer, category, signal)
+        platform_id = self._platform_ids[platform]
+        if recognized:
+            self._bits[row, platform_id >> 3] |= 1 << (platform_id & 7)
+        else:
+            self._bits[row, platform_id >> 3] &= 0xFF ^ (1 << (platform_id & 7))
+
+    def add_results(self, dealer: str, results: Dict[str, Dict[str, Dict[str, bool]]]):
+        """Record a dealer's {category: {signal: {platform: recognized}}} results"""
+        for category, signals in results.items():
+            for signal, platforms in signals.items():
+                packed = 0
+                for platform, recognized in platforms.items():
+                    if recognized:
+                        packed |= 1 << self._platform_ids[platform]
+                row = self._row(dealer, category, signal)
+                self._bits[row] = np.frombuffer(packed.to_bytes(self._row_bytes, 'little'), dtype=np.uint8)
+
+    def recognition_counts(self, dealer: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recognized signal counts as a (categories x platforms) array and
+        signal totals per category, across all dealers or for one dealer.
+        """
+        rows = self.row_count
+        row_category = np.asarray(self._signal_category, dtype=np.int32)[self._row_signal[:rows]]
+        category_rows = row_category[None, :] == np.arange(len(self.categories), dtype=np.int32)[:, None]
+        if dealer is not None:
+            category_rows &= self._row_dealer[:rows] == self._dealer_ids[dealer]
+
+        # One bitset over rows per platform, and one per category
+        platform_columns = np.unpackbits(self._bits[:rows], axis=1, count=len(self.platforms), bitorder='little')
+        platform_bitsets = np.packbits(platform_columns.T, axis=1, bitorder='little')
+        category_bitsets = np.packbits(category_rows, axis=1, bitorder='little')
+
+        recognized = _POPCOUNT[category_bitsets[:, None, :] & platform_bitsets[None, :, :]].sum(axis=2, dtype=np.int64)
+        totals = _POPCOUNT[category_bitsets].sum(axis=1, dtype=np.int64)
+        return recognized, totals
+
+    def platform_summary(self, dealer: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{category: {platform: counts and recognition rate}}, across all dealers or for one dealer"""
+        recognized, totals = self.recognition_counts(dealer)
+        summary = {}
+        for category_id, category in enumerate(self.categories):
+            total = int(totals[category_id])
+            if not total:
+                continue
+            summary[category] = {
+                platform: {
+                    'recognized_count': int(recognized[category_id, platform_id]),
+                    'total_signals': total,
+                    'recognition_rate': int(recognized[category_id, platform_id]) / total
+                }
+                for platform_id, platform in enumerate(self.platforms)
+            }
+        return summary
+
+    def detailed_results(self, dealer: str) -> Dict[str, Dict[str, Dict[str, bool]]]:
+        """One dealer's {category: {signal: {platform: recognized}}} results"""
+        dealer_id = self._dealer_ids[dealer]
+        rows = np.flatnonzero(self._row_dealer[:self.row_count] == dealer_id)
+        platform_columns = np.unpackbits(self._bits[rows], axis=1, count=len(self.platforms), bitorder='little')
+
+        results: Dict[str, Dict[str, Dict[str, bool]]] = {}
+        for row, bits in zip(rows, platform_columns):
+            category, signal = self.signals[self._row_signal[row]]
+            results.setdefault(category, {})[signal] = dict(zip(self.platforms, map(bool, bits)))
+        return results
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Site Page Discovery
+Streams robots.txt and sitemaps into a bounded, prioritized crawl frontier
+"""
+
+import gzip
+import hashlib
+import heapq
+import io
+import logging
+import math
+import re
+import xml.etree.ElementTree as ET
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+# Page categories in priority order: (name, path pattern, weight, share of the page budget).
+# Weights rank pages within the whole frontier; shares stop one category (usually
+# thousands of vehicle detail pages) from crowding out the rest.
+PAGE_CATEGORIES: List[Tuple[str, str, float, float]] = [
+    ('authority', r'/(about|staff|team|our-team|meet|certification|award|reviews?|testimonial)', 3.0, 0.35),
+    ('department', r'/(service|parts|finance|collision|body-shop|departments?|contact|hours)', 2.0, 0.25),
+    ('vehicle', r'/(inventory|vehicle|vdp|used|new|certified|cpo)/|[A-HJ-NPR-Z0-9]{17}', 1.5, 0.30),
+    ('other', r'', 0.5, 0.10)
+]
+
+class BloomFilter:
+    """Fixed-size Bloom filter for URL de-duplication in constant memory"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> bool:
+        """Add an item; returns False if it was (probably) already present"""
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p // 8] & (1 << (p % 8)) for p in self._positions(item))
+
+class CrawlFrontier:
+    """
+    Bounded priority frontier.
+
+    Each page category keeps only its best ``budget`` URLs in a min-heap, so
+    memory is bounded by the page budget no matter how many URLs the sitemaps
+    list. When drained, every category first gets its share of the budget
+    left after pinned paths, and any unused budget goes to the best
+    remaining URLs. URLs are de-duplicated through a Bloom filter.
+    """
+
+    def __init__(self, budget: int, categories: Optional[List[Tuple[str, str, float, float]]] = None,
+                 seen: Optional[BloomFilter] = None):
+        self.budget = budget
+        self.categories = [
+            (name, re.compile(pattern, re.I), weight, share)
+            for name, pattern, weight, share in (categories or PAGE_CATEGORIES)
+        ]
+        self.seen = seen or BloomFilter()
+        self._heaps: Dict[str, List[Tuple[float, int, str]]] = {name: [] for name, *_ in self.categories}
+        self._pinned: List[str] = []
+        self._sequence = 0
+        self.offered = 0
+
+    def pin(self, path: str):
+        """Always include a path, ahead of and outside the category quotas"""
+        if self.seen.add(path) and len(self._pinned) < self.budget:
+            self._pinned.append(path)
+
+    def offer(self, path: str, sitemap_priority: Optional[float] = None) -> bool:
+        """Offer a site-relative path; returns True if it is currently kept"""
+        if not self.seen.add(path):
+            return False
+        self.offered += 1
+
+        for name, pattern, weight, _ in self.categories:
+            if pattern.search(path):
+                break
+
+        priority = weight + (sitemap_priority if sitemap_priority is not None else 0.5)
+        # Shallow paths first among equals; negative sequence keeps earlier URLs on ties
+        priority -= path.count('/') * 0.01
+        self._sequence += 1
+        entry = (priority, -self._sequence, path)
+
+        heap = self._heaps[name]
+        if len(heap) < self.budget:
+            heapq.heappush(heap, entry)
+            return True
+        if entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+            return True
+        return False
+
+    def drain(self) -> List[str]:
+        """Pinned paths, then the highest-priority paths across categories, at most ``budget`` in total"""
+        remaining = max(0, self.budget - len(self._pinned))
+        selected: List[Tuple[float, int, str]] = []
+        leftovers: List[Tuple[float, int, str]] = []
+
+        # Shares sum to at most 1, so rounding down keeps the quotas within what pinned paths left
+        for name, _, _, share in self.categories:
+            quota = int(remaining * share)
+            entries = sorted(self._heaps[name], reverse=True)
+            selected.extend(entries[:quota])
+            leftovers.extend(entries[quota:])
+
+        leftovers.sort(reverse=True)
+        selected.extend(leftovers[:remaining - len(selected)])
+        selected.sort(reverse=True)
+
+        return self._pinned + [path for _, _, path in selected]
+
+class SiteDiscovery:
+    """Discovers schema-rich pages for a site from robots.txt and its sitemaps"""
+
+    def __init__(self, session: Any, base_url: str, page_budget: int = 25, user_agent: str = 'AuthorityValidator',
+                 max_sitemaps: int = 50, max_urls: int = 500_000, timeout: int = 10):
+        self.session = session
+        self.base_url = base_url
+        self.page_budget = page_budget
+        self.user_agent = user_agent
+        self.max_sitemaps = max_sitemaps
+        self.max_urls = max_urls
+        self.timeout = timeout
+        self.host = self._site_host(base_url)
+        self.robots = RobotFileParser()
+        self.stats = {'sitemaps_read': 0, 'urls_seen': 0, 'urls_disallowed': 0}
+
+    def discover(self, seed_pages: Optional[List[str]] = None) -> List[str]:
+        """Return up to ``page_budget`` site-relative paths to validate, best first"""
+        frontier = CrawlFrontier(self.page_budget)
+        sitemaps = deque(self._read_robots() or [urljoin(self.base_url, '/sitemap.xml')])
+
+        # Seed pages are always worth checking, so they take budget ahead of sitemap URLs, unless robots.txt forbids them
+        for page in seed_pages or []:
+            if self.robots.can_fetch(self.user_agent, urljoin(self.base_url, page)):
+                frontier.pin(page)
+            else:
+                self.stats['urls_disallowed'] += 1
+        visited_sitemaps = set()
+
+        while sitemaps and len(visited_sitemaps) < self.max_sitemaps and self.stats['urls_seen'] < self.max_urls:
+            sitemap_url = sitemaps.popleft()
+            if sitemap_url in visited_sitemaps:
+                continue
+            visited_sitemaps.add(sitemap_url)
+
+            try:
+                for kind, loc, priority in self._stream_sitemap(sitemap_url):
+                    if kind == 'sitemap':
+                        if len(sitemaps) + len(visited_sitemaps) < self.max_sitemaps:
+                            sitemaps.append(loc)
+                        continue
+
+                    self.stats['urls_seen'] += 1
+                    path = self._site_path(loc)
+                    if path is None:
+                        continue
+                    if not self.robots.can_fetch(self.user_agent, loc):
+                        self.stats['urls_disallowed'] += 1
+                        continue
+                    frontier.offer(path, priority)
+
+                    if self.stats['urls_seen'] >= self.max_urls:
+                        break
+                self.stats['sitemaps_read'] += 1
+            except Exception as e:
+                logger.warning(f"Could not read sitemap {sitemap_url}: {e}")
+
+        return frontier.drain()
+
+    def _read_robots(self) -> List[str]:
+        """Stream robots.txt into the robots parser and return its sitemap URLs"""
+        robots_url = urljoin(self.base_url, '/robots.txt')
+        try:
+            response = self.session.get(robots_url, timeout=self.timeout, stream=True)
+            try:
+                if response.status_code in (401, 403):
+                    self.robots.disallow_all = True
+                    self.robots.modified()
+                    return []
+                if response.status_code >= 400:
+                    # Missing robots.txt means everything is allowed
+                    self.robots.parse([])
+                    return []
+                self.robots.parse(line.decode('utf-8', errors='replace') for line in response.iter_lines())
+            finally:
+                response.close()
+        except Exception as e:
+            logger.warning(f"Could not read {robots_url}: {e}")
+            self.robots.parse([])
+            return []
+
+        return list(self.robots.site_maps() or [])
+
+    def _stream_sitemap(self, sitemap_url: str) -> Iterator[Tuple[str, str, Optional[float]]]:
+        """Yield ('url' | 'sitemap', loc, priority) entries while parsing the sitemap incrementally"""
+        response = self.session.get(sitemap_url, timeout=self.timeout, stream=True)
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Let the parser see EOF instead of a closed file once the body is exhausted
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+
+            # Gzipped sitemap files (as opposed to gzip transfer encoding)
+            if stream.peek(2)[:2] == b'\x1f\x8b':
+                stream = gzip.GzipFile(fileobj=stream)
+
+            root = None
+            for event, element in ET.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = element
+                    continue
+
+                tag = element.tag
+                if tag in (SITEMAP_NS + 'url', SITEMAP_NS + 'sitemap'):
+                    loc = (element.findtext(SITEMAP_NS + 'loc') or '').strip()
+                    priority = self._parse_priority(element.findtext(SITEMAP_NS + 'priority'))
+                    if loc:
+                        yield ('sitemap' if tag == SITEMAP_NS + 'sitemap' else 'url'), loc, priority
+                    # Drop processed entries so memory stays flat on huge sitemaps
+                    root.clear()
+        finally:
+            response.close()
+
+    def _site_path(self, loc: str) -> Optional[str]:
+        """Site-relative path for same-site URLs, None for other hosts"""
+        parsed = urlparse(loc)
+        if parsed.netloc and self._site_host(loc) != self.host:
+            return None
+        return urlunparse(('', '', parsed.path or '/', parsed.params, parsed.query, ''))
+
+    @staticmethod
+    def _site_host(url: str) -> str:
+        """Lowercased host and port of a URL, without a leading "www." (www.example.com is example.com)"""
+        parsed = urlparse(url)
+        host = parsed.hostname or ''
+        if host.startswith('www.'):
+            host = host[4:]
+        return f"{host}:{parsed.port}" if parsed.port else host
+
+    @staticmethod
+    def _parse_priority(value: Optional[str]) -> Optional[float]:
+        try:
+            return min(1.0, max(0.0, float(value))) if value else None
+        except ValueError:
+            return None